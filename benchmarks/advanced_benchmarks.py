@@ -13,24 +13,30 @@ This script provides comprehensive performance testing including:
 import asyncio
 import cProfile
 import gc
-import io
 import json
+import os
 import pstats
 import sys
 import tempfile
 import time
-from contextlib import contextmanager
-from dataclasses import dataclass
+import tracemalloc
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from unittest.mock import Mock, patch
 
-import psutil
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
-@dataclass
-class BenchmarkResult:
-    """Benchmark result data structure."""
+
+class BenchmarkResult(NamedTuple):
+    """Benchmark result record (a tuple, so no per-instance __dict__)."""
 
     name: str
     duration: float
@@ -43,68 +49,116 @@ class BenchmarkResult:
 
 
 class PerformanceProfiler:
-    """Advanced performance profiler with memory and CPU tracking."""
+    """Advanced performance profiler with memory and CPU tracking.
+
+    Memory is measured with ``tracemalloc`` (Python allocations, true peak).
+    Set ``BENCHMARK_USE_RSS=1`` to sample process RSS via ``psutil`` instead.
+    """
 
     def __init__(self):
-        self.process = psutil.Process()
+        self.use_rss = os.environ.get("BENCHMARK_USE_RSS") == "1"
+        self.process = psutil.Process() if self.use_rss and psutil else None
         self.results: List[BenchmarkResult] = []
 
-    @contextmanager
-    def profile(self, name: str):
-        """Context manager for profiling code blocks."""
-        # Start profiling
-        gc.collect()  # Clean up before measurement
-        start_time = time.perf_counter()
-        start_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        start_cpu = self.process.cpu_percent()
-
-        success = True
-        error = None
+    def _rss_mb(self) -> float:
+        return self.process.memory_info().rss / 1024 / 1024
 
-        try:
-            yield
-        except Exception as e:
-            success = False
-            error = str(e)
-        finally:
-            # End profiling
-            end_time = time.perf_counter()
-            end_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-            end_cpu = self.process.cpu_percent()
-
-            result = BenchmarkResult(
-                name=name,
-                duration=end_time - start_time,
-                memory_peak=max(start_memory, end_memory),
-                memory_current=end_memory,
-                cpu_percent=(start_cpu + end_cpu) / 2,
-                success=success,
-                error=error,
-            )
+    def profile(self, name: str, collect: bool = False) -> "_ProfileBlock":
+        """Context manager for profiling code blocks.
 
-            self.results.append(result)
-            self._print_result(result)
+        Pass ``collect=True`` to run a full garbage collection before measuring.
+        """
+        return _ProfileBlock(self, name, collect)
 
     def _print_result(self, result: BenchmarkResult):
         """Print benchmark result."""
         status = "✅ PASS" if result.success else "❌ FAIL"
-        print(f"{status} {result.name}")
-        print(f"   Duration: {result.duration:.4f}s")
-        print(f"   Memory: {result.memory_current:.2f}MB (peak: {result.memory_peak:.2f}MB)")
-        print(f"   CPU: {result.cpu_percent:.2f}%")
+        lines = [
+            f"{status} {result.name}",
+            f"   Duration: {result.duration:.4f}s",
+            f"   Memory: {result.memory_current:.2f}MB (peak: {result.memory_peak:.2f}MB)",
+            f"   CPU: {result.cpu_percent:.2f}%",
+        ]
         if result.error:
-            print(f"   Error: {result.error}")
-        print()
+            lines.append(f"   Error: {result.error}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
+
+
+class _ProfileBlock:
+    """Timing/memory block returned by PerformanceProfiler.profile.
+
+    A plain class rather than a @contextmanager generator, to keep the
+    profiler's own overhead out of short measurements.
+    """
+
+    __slots__ = ("profiler", "name", "start_time", "start_cpu", "start_memory")
+
+    def __init__(self, profiler: PerformanceProfiler, name: str, collect: bool):
+        self.profiler = profiler
+        self.name = name
+        if collect:
+            gc.collect()  # Clean up before measurement
+
+    def __enter__(self) -> "_ProfileBlock":
+        # Start profiling
+        if self.profiler.process:
+            self.start_memory = self.profiler._rss_mb()
+        else:
+            tracemalloc.start()
+        self.start_time = time.perf_counter()
+        self.start_cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # End profiling
+        end_time = time.perf_counter()
+        end_cpu = time.process_time()
+        profiler = self.profiler
+        if profiler.process:
+            memory_current = profiler._rss_mb()
+            memory_peak = max(self.start_memory, memory_current)
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            memory_current = current / 1024 / 1024
+            memory_peak = peak / 1024 / 1024
+
+        # Record failures instead of propagating them
+        failed = exc_type is not None and issubclass(exc_type, Exception)
+
+        duration = end_time - self.start_time
+        result = BenchmarkResult(
+            name=self.name,
+            duration=duration,
+            memory_peak=memory_peak,
+            memory_current=memory_current,
+            cpu_percent=(end_cpu - self.start_cpu) / duration * 100 if duration else 0.0,
+            success=not failed,
+            error=str(exc) if failed else None,
+        )
+
+        profiler.results.append(result)
+        profiler._print_result(result)
+        return failed
+
+
+MOCK_ORG_PREFIX = "test-org/"
+MOCK_HTTPS_PREFIX = "https://github.com/" + MOCK_ORG_PREFIX
+MOCK_SSH_PREFIX = "git@github.com:" + MOCK_ORG_PREFIX
+LARGE_REPO_KB = 5000
 
 
 class MockRepository:
     """Mock repository for testing."""
 
+    __slots__ = ("name", "full_name", "clone_url", "ssh_url", "size", "private")
+
     def __init__(self, name: str, size: int = 1000):
         self.name = name
-        self.full_name = f"test-org/{name}"
-        self.clone_url = f"https://github.com/test-org/{name}.git"
-        self.ssh_url = f"git@github.com:test-org/{name}.git"
+        git_name = name + ".git"
+        self.full_name = MOCK_ORG_PREFIX + name
+        self.clone_url = MOCK_HTTPS_PREFIX + git_name
+        self.ssh_url = MOCK_SSH_PREFIX + git_name
         self.size = size  # KB
         self.private = False
 
@@ -125,95 +179,112 @@ def setup_test_environment():
 
 def create_mock_repos(count: int) -> List[MockRepository]:
     """Create mock repositories for testing."""
-    return [MockRepository(f"repo-{i:04d}", size=1000 + (i * 100)) for i in range(count)]
+    return [MockRepository(f"repo-{i:04d}", 1000 + i * 100) for i in range(count)]
 
 
-async def benchmark_github_api_calls(
+def benchmark_github_api_calls(
     profiler: PerformanceProfiler, github_service, repo_count: int = 100
 ):
     """Benchmark GitHub API calls."""
     mock_repos = create_mock_repos(repo_count)
 
-    with profiler.profile(f"GitHub API - Fetch {repo_count} repos"):
-        # Mock the API response
-        with patch.object(github_service, "_make_request") as mock_request:
-            mock_request.return_value = {
-                "data": [
-                    {
-                        "name": repo.name,
-                        "full_name": repo.full_name,
-                        "clone_url": repo.clone_url,
-                        "ssh_url": repo.ssh_url,
-                        "size": repo.size,
-                        "private": repo.private,
-                    }
-                    for repo in mock_repos
-                ]
-            }
+    # One full page, then the empty page that ends the listing (no Link header)
+    page = Mock(status_code=200, headers={})
+    page.json.return_value = [
+        {
+            "name": repo.name,
+            "full_name": repo.full_name,
+            "clone_url": repo.clone_url,
+            "ssh_url": repo.ssh_url,
+            "size": repo.size,
+            "private": repo.private,
+        }
+        for repo in mock_repos
+    ]
+    last_page = Mock(status_code=200, headers={})
+    last_page.json.return_value = []
 
-            _ = await asyncio.get_event_loop().run_in_executor(
-                None, github_service.get_repositories, "test-org", "all"
-            )
+    with profiler.profile(f"GitHub API - Fetch {repo_count} repos"):
+        # Stub the HTTP layer so the real pagination and response handling run
+        with patch.object(github_service.session, "get", side_effect=[page, last_page]):
+            repos = github_service.get_repositories("org", "test-org")
+        if len(repos) != repo_count:
+            raise RuntimeError(f"Expected {repo_count} repositories, fetched {len(repos)}")
 
 
 def benchmark_git_operations(profiler: PerformanceProfiler, git_service, repo_count: int = 10):
     """Benchmark Git operations."""
+    from git_batch_pull.models import Repository, RepositoryInfo
+
     mock_repos = create_mock_repos(repo_count)
 
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
+        repositories = [
+            Repository(
+                info=RepositoryInfo(
+                    name=repo.name,
+                    default_branch="main",
+                    clone_url=repo.clone_url,
+                    ssh_url=repo.ssh_url,
+                ),
+                local_path=temp_path / repo.name,
+            )
+            for repo in mock_repos
+        ]
 
         # Test clone operations
+        clone_result = Mock(returncode=0, stdout="", stderr="")
         with profiler.profile(f"Git Clone - {repo_count} repos (mocked)"):
-            for repo in mock_repos:
-                repo_path = temp_path / repo.name
-                # Mock git clone operation
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
-                    try:
-                        # This would normally clone, but we're mocking it
-                        _ = git_service.clone_repository(repo.clone_url, str(repo_path))
-                    except Exception:
-                        pass  # Expected since we're mocking  # nosec
+            # Mock git clone operation; any failure is recorded against the benchmark
+            with patch("subprocess.run", return_value=clone_result):
+                for repository in repositories:
+                    git_service.clone_repository(repository)
 
         # Test pull operations
-        with profiler.profile(f"Git Pull - {repo_count} repos (mocked)"):
-            for repo in mock_repos:
-                repo_path = temp_path / repo.name
-                repo_path.mkdir(exist_ok=True)  # Create directory for pull test
-                (repo_path / ".git").mkdir(exist_ok=True)  # Mock git directory
+        for repository in repositories:
+            os.makedirs(repository.local_path / ".git", exist_ok=True)  # Mock git directory
 
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value = Mock(
-                        returncode=0, stdout="Already up to date.", stderr=""
-                    )
-                    try:
-                        _ = git_service.pull_repository(str(repo_path))
-                    except Exception:
-                        pass  # Expected since we're mocking  # nosec
+        clean_status = "# branch.oid " + "0" * 40 + "\n# branch.head main\n"
+
+        def git_result(command, *args, **kwargs):
+            # A clean checkout of the default branch, so each pull runs status then pull
+            if command[1] == "status":
+                return Mock(returncode=0, stdout=clean_status, stderr="")
+            return Mock(returncode=0, stdout="Already up to date.", stderr="")
+
+        with profiler.profile(f"Git Pull - {repo_count} repos (mocked)"):
+            with patch("subprocess.run", side_effect=git_result) as run:
+                for repository in repositories:
+                    git_service.pull_repository(repository)
+            if run.call_count != 2 * repo_count:
+                raise RuntimeError(f"Expected {2 * repo_count} git calls, ran {run.call_count}")
 
 
 def benchmark_batch_processing(
     profiler: PerformanceProfiler, batch_processor, repo_count: int = 50
 ):
-    """Benchmark batch processing operations."""
-    mock_repos = create_mock_repos(repo_count)
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with profiler.profile(f"Batch Processing - {repo_count} repos"):
-            # Mock the batch processing
-            with patch.object(batch_processor, "process_repositories") as mock_process:
-                mock_process.return_value = {
-                    "success": repo_count,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total": repo_count,
-                }
-
-                try:
-                    _ = batch_processor.process_repositories(mock_repos, temp_dir, max_workers=4)
-                except Exception:
-                    pass  # Expected since we're mocking  # nosec
+    """Benchmark batch processing operations (dry run through the real processor)."""
+    from git_batch_pull.models import Repository, RepositoryInfo
+
+    base_folder = batch_processor.git_service.base_folder
+    repositories = [
+        Repository(
+            info=RepositoryInfo(
+                name=repo.name,
+                default_branch="main",
+                clone_url=repo.clone_url,
+                ssh_url=repo.ssh_url,
+            ),
+            local_path=base_folder / repo.name,
+        )
+        for repo in create_mock_repos(repo_count)
+    ]
+
+    with profiler.profile(f"Batch Processing - {repo_count} repos"):
+        result = batch_processor.process_repositories(repositories, dry_run=True, quiet=True)
+        if result.total != repo_count:
+            raise RuntimeError(f"Expected {repo_count} repositories, tallied {result.total}")
 
 
 def benchmark_memory_usage(profiler: PerformanceProfiler):
@@ -224,15 +295,14 @@ def benchmark_memory_usage(profiler: PerformanceProfiler):
             repos = create_mock_repos(size)
 
             # Simulate processing large amounts of data
-            data = []
-            for repo in repos:
-                data.append(
-                    {
-                        "name": repo.name,
-                        "size": repo.size,
-                        "metadata": {"created": time.time(), "data": "x" * 100},
-                    }
-                )
+            _ = [
+                {
+                    "name": repo.name,
+                    "size": repo.size,
+                    "metadata": {"created": time.time(), "data": "x" * 100},
+                }
+                for repo in repos
+            ]
 
             # Force garbage collection to measure actual memory usage
             gc.collect()
@@ -250,21 +320,26 @@ def benchmark_concurrent_operations(profiler: PerformanceProfiler):
         with profiler.profile(f"Concurrent Ops - {concurrency} workers"):
 
             async def run_concurrent():
-                tasks = [mock_operation(i) for i in range(50)]
-                semaphore = asyncio.Semaphore(concurrency)
+                queue: asyncio.Queue = asyncio.Queue()
+                for i in range(50):
+                    queue.put_nowait(i)
 
-                async def limited_task(task):
-                    async with semaphore:
-                        return await task
+                async def worker():
+                    while not queue.empty():
+                        await mock_operation(queue.get_nowait())
 
-                limited_tasks = [limited_task(task) for task in tasks]
-                return await asyncio.gather(*limited_tasks)
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
 
             asyncio.run(run_concurrent())
 
 
-def profile_cpu_intensive_operations():
-    """Profile CPU-intensive operations with cProfile."""
+def compute_size_metrics(sizes: List[int]) -> List[Tuple[float, str]]:
+    """Compute (size in MB, size category) for a sequence of sizes in KB."""
+    return [(size / 1024, "large" if size > LARGE_REPO_KB else "small") for size in sizes]
+
+
+def profile_cpu_intensive_operations() -> List[Dict]:
+    """Profile CPU-intensive operations with cProfile and return the top 20 entries."""
     print("🔍 CPU Profiling")
     print("=" * 50)
 
@@ -273,65 +348,87 @@ def profile_cpu_intensive_operations():
 
     # CPU-intensive operations
     mock_repos = create_mock_repos(1000)
-    processed_data = []
+    metrics = compute_size_metrics([repo.size for repo in mock_repos])
 
-    for repo in mock_repos:
-        # Simulate CPU-intensive processing
-        processed = {
+    # Simulate CPU-intensive processing
+    _ = [
+        {
             "name": repo.name.upper(),
             "hash": hash(repo.full_name),
             "processed": True,
-            "metrics": {
-                "size_mb": repo.size / 1024,
-                "category": "large" if repo.size > 5000 else "small",
-            },
+            "metrics": {"size_mb": size_mb, "category": category},
         }
-        processed_data.append(processed)
+        for repo, (size_mb, category) in zip(mock_repos, metrics)
+    ]
 
     pr.disable()
 
     # Print profiling results
-    s = io.StringIO()
-    ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
+    ps = pstats.Stats(pr, stream=sys.stdout).strip_dirs().sort_stats("cumulative")
     ps.print_stats(20)  # Top 20 functions
-
-    print(s.getvalue())
     print()
 
+    # Read the sorted entries directly: get_stats_profile() keys by bare function
+    # name, so e.g. two <listcomp> frames would collapse into one entry.
+    top_functions = []
+    for func in ps.fcn_list[:20]:
+        _, ncalls, tottime, cumtime, _ = ps.stats[func]
+        file_name, line_number, func_name = func
+        top_functions.append(
+            {
+                "function": func_name,
+                "file": file_name,
+                "line": line_number,
+                "ncalls": ncalls,
+                "tottime": tottime,
+                "cumtime": cumtime,
+            }
+        )
+    return top_functions
 
-def generate_performance_report(profiler: PerformanceProfiler):
-    """Generate comprehensive performance report."""
-    print("\n📊 Performance Report")
-    print("=" * 50)
 
+def generate_performance_report(
+    profiler: PerformanceProfiler, cpu_profile: Optional[List[Dict]] = None
+):
+    """Generate comprehensive performance report."""
     total_time = sum(r.duration for r in profiler.results)
     successful_tests = sum(1 for r in profiler.results if r.success)
     failed_tests = len(profiler.results) - successful_tests
 
-    print(f"Total Tests: {len(profiler.results)}")
-    print(f"Successful: {successful_tests}")
-    print(f"Failed: {failed_tests}")
-    print(f"Total Time: {total_time:.2f}s")
-    print(f"Average Time: {total_time / len(profiler.results):.4f}s")
-    print()
+    lines = [
+        "\n📊 Performance Report",
+        "=" * 50,
+        f"Total Tests: {len(profiler.results)}",
+        f"Successful: {successful_tests}",
+        f"Failed: {failed_tests}",
+        f"Total Time: {total_time:.2f}s",
+        f"Average Time: {total_time / len(profiler.results):.4f}s",
+        "",
+    ]
 
     # Performance metrics
     durations = [r.duration for r in profiler.results if r.success]
     memory_usage = [r.memory_current for r in profiler.results if r.success]
 
     if durations:
-        print("📈 Performance Metrics:")
-        print(f"  Fastest: {min(durations):.4f}s")
-        print(f"  Slowest: {max(durations):.4f}s")
-        print(f"  Average: {sum(durations) / len(durations):.4f}s")
-        print()
+        lines += [
+            "📈 Performance Metrics:",
+            f"  Fastest: {min(durations):.4f}s",
+            f"  Slowest: {max(durations):.4f}s",
+            f"  Average: {sum(durations) / len(durations):.4f}s",
+            "",
+        ]
 
     if memory_usage:
-        print("💾 Memory Usage:")
-        print(f"  Lowest: {min(memory_usage):.2f}MB")
-        print(f"  Highest: {max(memory_usage):.2f}MB")
-        print(f"  Average: {sum(memory_usage) / len(memory_usage):.2f}MB")
-        print()
+        lines += [
+            "💾 Memory Usage:",
+            f"  Lowest: {min(memory_usage):.2f}MB",
+            f"  Highest: {max(memory_usage):.2f}MB",
+            f"  Average: {sum(memory_usage) / len(memory_usage):.2f}MB",
+            "",
+        ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Save detailed results to JSON
     results_data = {
@@ -354,16 +451,20 @@ def generate_performance_report(profiler: PerformanceProfiler):
             }
             for r in profiler.results
         ],
+        "cpu_profile": cpu_profile or [],
     }
 
     results_file = Path(__file__).parent / "performance_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results_data, f, indent=2)
+    if orjson:
+        results_file.write_bytes(orjson.dumps(results_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(results_file, "w") as f:
+            json.dump(results_data, f, indent=2)
 
     print(f"📁 Detailed results saved to: {results_file}")
 
 
-async def main():
+def main():
     """Run comprehensive performance benchmarks."""
     print("🚀 Git Batch Pull - Advanced Performance Benchmarks")
     print("=" * 60)
@@ -392,22 +493,27 @@ async def main():
 
         github_service = GitHubService("mock_token", subprocess_runner)
         git_service = GitService(temp_dir, subprocess_runner, path_validator)
-        batch_processor = BatchProcessor(github_service, git_service)
+        batch_processor = BatchProcessor(git_service)
 
         print("🔄 Running benchmarks...\n")
 
-        # Run benchmarks
-        await benchmark_github_api_calls(profiler, github_service, 100)
-        benchmark_git_operations(profiler, git_service, 20)
-        benchmark_batch_processing(profiler, batch_processor, 50)
-        benchmark_memory_usage(profiler)
-        benchmark_concurrent_operations(profiler)
+        # Run benchmarks with a clean heap and no automatic collections
+        gc.collect()
+        gc.disable()
+        try:
+            benchmark_github_api_calls(profiler, github_service, 100)
+            benchmark_git_operations(profiler, git_service, 20)
+            benchmark_batch_processing(profiler, batch_processor, 50)
+            benchmark_memory_usage(profiler)
+            benchmark_concurrent_operations(profiler)
+        finally:
+            gc.enable()
 
         # CPU profiling
-        profile_cpu_intensive_operations()
+        cpu_profile = profile_cpu_intensive_operations()
 
         # Generate report
-        generate_performance_report(profiler)
+        generate_performance_report(profiler, cpu_profile)
 
         print("✅ All benchmarks completed successfully!")
 
@@ -420,11 +526,9 @@ async def main():
 
 if __name__ == "__main__":
     # Check dependencies
-    try:
-        import psutil
-    except ImportError:
-        print("❌ psutil is required for performance benchmarks")
+    if os.environ.get("BENCHMARK_USE_RSS") == "1" and psutil is None:
+        print("❌ psutil is required for BENCHMARK_USE_RSS=1")
         print("Install with: pip install psutil")
         sys.exit(1)
 
-    asyncio.run(main())
+    main()
@@ -6,30 +6,53 @@ This script measures the performance of key operations to ensure
 the tool scales well with different repository sizes and configurations.
 """
 
+import os
 import statistics
+import sys
 import tempfile
 import time
 from pathlib import Path
+from subprocess import CompletedProcess  # nosec
 from typing import Dict, List
-from unittest.mock import MagicMock
 
 from git_batch_pull.core.batch_processor import BatchProcessor
 from git_batch_pull.models.repository import Repository, RepositoryInfo
-from git_batch_pull.security import PathValidator, SafeSubprocessRunner
+from git_batch_pull.security import PathValidator
 from git_batch_pull.services.git_service import GitService
 
 
+class StubSubprocessRunner:
+    """Lightweight stand-in for SafeSubprocessRunner returning canned results per cwd."""
+
+    def __init__(self):
+        self.results_by_cwd: Dict[Path, CompletedProcess] = {}
+
+    def run_git_command(self, command, cwd, timeout=None, capture_output=True, check=True):
+        return self.results_by_cwd[cwd]
+
+
 class BenchmarkRunner:
     """Run performance benchmarks for git-batch-pull operations."""
 
     def __init__(self):
-        self.results: Dict[str, List[float]] = {}
-
-    def time_operation(self, name: str, operation_func, *args, **kwargs) -> float:
-        """Time a single operation and record the result."""
-        start_time = time.perf_counter()
+        self.results: Dict[str, List[int]] = {}
+
+        # Shared fixtures, created once and reused by every benchmark
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._temp_dir.name)
+        self.subprocess_runner = StubSubprocessRunner()
+        self.path_validator = PathValidator()
+        self.git_service = GitService(self.temp_dir, self.subprocess_runner, self.path_validator)
+
+    def close(self) -> None:
+        """Remove the shared temporary directory."""
+        self._temp_dir.cleanup()
+
+    def time_operation(self, name: str, operation_func, *args, **kwargs) -> int:
+        """Time a single operation and record the result in nanoseconds."""
+        start_time = time.perf_counter_ns()
         _ = operation_func(*args, **kwargs)
-        end_time = time.perf_counter()
+        end_time = time.perf_counter_ns()
 
         duration = end_time - start_time
         if name not in self.results:
@@ -58,31 +81,21 @@ class BenchmarkRunner:
 
     def benchmark_protocol_detection(self, count: int = 50) -> None:
         """Benchmark protocol detection for multiple repositories."""
-        # Setup
-        temp_dir = Path(tempfile.mkdtemp())
-        mock_subprocess = MagicMock(spec=SafeSubprocessRunner)
-        path_validator = PathValidator()
-        git_service = GitService(temp_dir, mock_subprocess, path_validator)
+        temp_dir = self.temp_dir
+        git_service = self.git_service
 
-        # Create test repositories
+        # Create test repositories with canned git remote get-url responses
         repositories = []
+        results_by_cwd = self.subprocess_runner.results_by_cwd
         for i in range(count):
             repo_path = temp_dir / f"repo-{i}"
-            repo_path.mkdir(parents=True)
-            (repo_path / ".git").mkdir()
+            os.makedirs(repo_path / ".git", exist_ok=True)
             repositories.append(repo_path)
-
-        # Mock git remote get-url responses
-        def mock_git_command(command, **kwargs):
-            mock_result = MagicMock()
-            repo_num = int(kwargs.get("cwd", temp_dir).name.split("-")[-1])
-            if repo_num % 2 == 0:
-                mock_result.stdout = f"https://github.com/user/repo-{repo_num}.git"
+            if i % 2 == 0:
+                stdout = f"https://github.com/user/repo-{i}.git"
             else:
-                mock_result.stdout = f"git@github.com:user/repo-{repo_num}.git"
-            return mock_result
-
-        mock_subprocess.run_git_command.side_effect = mock_git_command
+                stdout = f"git@github.com:user/repo-{i}.git"
+            results_by_cwd[repo_path] = CompletedProcess([], 0, stdout=stdout)
 
         def detect_protocols():
             protocols = []
@@ -95,12 +108,8 @@ class BenchmarkRunner:
 
     def benchmark_batch_processing_simulation(self, count: int = 20) -> None:
         """Benchmark batch processing simulation (dry run)."""
-        # Setup
-        temp_dir = Path(tempfile.mkdtemp())
-        mock_subprocess = MagicMock(spec=SafeSubprocessRunner)
-        path_validator = PathValidator()
-        git_service = GitService(temp_dir, mock_subprocess, path_validator)
-        batch_processor = BatchProcessor(git_service)
+        temp_dir = self.temp_dir
+        batch_processor = BatchProcessor(self.git_service)
 
         # Create test repositories
         repositories = []
@@ -124,18 +133,28 @@ class BenchmarkRunner:
 
         self.time_operation(f"process_batch_{count}_repos", process_batch)
 
+    def _warmup(self) -> None:
+        """Run every benchmark once on a tiny input, then discard the timings."""
+        self.benchmark_repository_creation(1)
+        self.benchmark_protocol_detection(1)
+        self.benchmark_batch_processing_simulation(1)
+        self.results.clear()
+
     def run_all_benchmarks(self) -> None:
         """Run all benchmark tests."""
         print("🚀 Running git-batch-pull Performance Benchmarks")
         print("=" * 50)
 
+        # Exclude first-call costs (lazy imports, cold caches) from reported numbers
+        self._warmup()
+
         # Repository creation benchmarks
         print("\n📦 Repository Creation Benchmarks:")
         for count in [10, 50, 100, 500]:
             duration = self.time_operation(
                 f"create_{count}_repositories", self.benchmark_repository_creation, count
             )
-            print(f"  Create {count:3d} repositories: {duration*1000:.2f} ms")
+            print(f"  Create {count:3d} repositories: {duration / 1e6:.2f} ms")
 
         # Protocol detection benchmarks
         print("\n🔍 Protocol Detection Benchmarks:")
@@ -143,7 +162,7 @@ class BenchmarkRunner:
             duration = self.time_operation(
                 f"detect_protocol_{count}_repos", self.benchmark_protocol_detection, count
             )
-            print(f"  Detect protocols for {count:2d} repos: {duration*1000:.2f} ms")
+            print(f"  Detect protocols for {count:2d} repos: {duration / 1e6:.2f} ms")
 
         # Batch processing benchmarks
         print("\n⚡ Batch Processing Benchmarks (Dry Run):")
@@ -151,7 +170,7 @@ class BenchmarkRunner:
             duration = self.time_operation(
                 f"process_batch_{count}_repos", self.benchmark_batch_processing_simulation, count
             )
-            print(f"  Process batch of {count:2d} repos: {duration*1000:.2f} ms")
+            print(f"  Process batch of {count:2d} repos: {duration / 1e6:.2f} ms")
 
     def print_summary(self) -> None:
         """Print benchmark summary statistics."""
@@ -160,16 +179,18 @@ class BenchmarkRunner:
 
         for operation, times in self.results.items():
             if len(times) > 1:
-                mean_time = statistics.mean(times) * 1000
-                std_dev = statistics.stdev(times) * 1000 if len(times) > 1 else 0
-                min_time = min(times) * 1000
-                max_time = max(times) * 1000
-
-                print(f"\n{operation}:")
-                print(f"  Mean: {mean_time:.2f} ms ± {std_dev:.2f} ms")
-                print(f"  Range: {min_time:.2f} ms - {max_time:.2f} ms")
+                mean_time = statistics.mean(times) / 1e6
+                std_dev = statistics.stdev(times) / 1e6 if len(times) > 1 else 0
+                min_time = min(times) / 1e6
+                max_time = max(times) / 1e6
+
+                sys.stdout.write(
+                    f"\n{operation}:\n"
+                    f"  Mean: {mean_time:.2f} ms ± {std_dev:.2f} ms\n"
+                    f"  Range: {min_time:.2f} ms - {max_time:.2f} ms\n"
+                )
             else:
-                print(f"\n{operation}: {times[0]*1000:.2f} ms")
+                sys.stdout.write(f"\n{operation}: {times[0] / 1e6:.2f} ms\n")
 
         # Performance thresholds and recommendations
         print("\n💡 Performance Analysis:")
@@ -179,12 +200,12 @@ class BenchmarkRunner:
         slow_operations = []
         for operation, times in self.results.items():
             avg_time = statistics.mean(times)
-            if "create_" in operation and avg_time > 0.1:  # 100ms for creation
-                slow_operations.append(f"{operation}: {avg_time*1000:.2f} ms")
-            elif "detect_" in operation and avg_time > 0.5:  # 500ms for detection
-                slow_operations.append(f"{operation}: {avg_time*1000:.2f} ms")
-            elif "process_" in operation and avg_time > 1.0:  # 1s for batch processing
-                slow_operations.append(f"{operation}: {avg_time*1000:.2f} ms")
+            if "create_" in operation and avg_time > 100_000_000:  # 100ms for creation
+                slow_operations.append(f"{operation}: {avg_time / 1e6:.2f} ms")
+            elif "detect_" in operation and avg_time > 500_000_000:  # 500ms for detection
+                slow_operations.append(f"{operation}: {avg_time / 1e6:.2f} ms")
+            elif "process_" in operation and avg_time > 1_000_000_000:  # 1s for batch processing
+                slow_operations.append(f"{operation}: {avg_time / 1e6:.2f} ms")
 
         if slow_operations:
             print("⚠️  Operations that may need optimization:")
@@ -208,6 +229,8 @@ def main():
     except Exception as e:
         print(f"❌ Benchmark failed: {e}")
         return 1
+    finally:
+        runner.close()
 
     return 0
 
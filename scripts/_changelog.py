@@ -0,0 +1,105 @@
+"""
+Git helpers shared by the changelog scripts.
+
+Imported by check_changes.py and update_changelog.py (the scripts directory is
+on sys.path when either is run directly). The lru_cache'd lookups are shared
+when both scripts run in one process.
+"""
+
+import functools
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def run_git_command(command: List[str], report_errors: bool = True) -> str:
+    """Run a git command and return the output ("" on failure)."""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+        return result.stdout.strip()
+    except subprocess.CalledProcessError as e:
+        if report_errors:
+            print(f"Git command failed: {' '.join(command)}")
+            print(f"Error: {e.stderr}")
+        return ""
+
+
+def iter_raw_records(
+    command: List[str], report_errors: bool = True, chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """Stream the NUL-terminated records of a git command's output, undecoded."""
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=REPO_ROOT
+    ) as proc:
+        pending = b""
+        for chunk in iter(lambda: proc.stdout.read(chunk_size), b""):
+            *records, pending = (pending + chunk).split(b"\0")
+            yield from records
+        if pending:
+            yield pending
+
+        stderr = proc.stderr.read()
+        if proc.wait() != 0 and report_errors:
+            print(f"Git command failed: {' '.join(command)}")
+            print(f"Error: {stderr.decode(errors='replace')}")
+
+
+def iter_git_records(command: List[str], report_errors: bool = True) -> Iterator[str]:
+    """Stream the NUL-terminated records of a git command's output."""
+    for record in iter_raw_records(command, report_errors):
+        yield record.decode("utf-8", "surrogateescape")
+
+
+def iter_status(report_errors: bool = True) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (status code, path) for every entry of ``git status --porcelain=v2 -z``.
+
+    Tracked entries carry their two-letter XY code ("." marks an unchanged side);
+    untracked files are reported as "??". Renames yield the new path.
+    """
+    records = iter_git_records(["git", "status", "--porcelain=v2", "-z"], report_errors)
+    for record in records:
+        if record.startswith("? "):
+            yield "??", record[2:]
+            continue
+        if record.startswith("2 "):
+            # A rename record is followed by an extra record holding the original path
+            next(records, None)
+            fields = record.split(" ", 9)
+        elif record.startswith("1 "):
+            fields = record.split(" ", 8)
+        elif record.startswith("u "):
+            fields = record.split(" ", 10)
+        else:
+            continue
+        yield fields[1], fields[-1]
+
+
+@functools.lru_cache(maxsize=None)
+def get_head_sha() -> str:
+    """Get the commit SHA of HEAD."""
+    return run_git_command(["git", "rev-parse", "HEAD"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_numstat(*extra_args: str) -> Dict[str, Tuple[str, str]]:
+    """Map each changed path to its (additions, deletions) from one ``git diff --numstat``."""
+    numstat: Dict[str, Tuple[str, str]] = {}
+    # Parse as bytes: the counts are ASCII and only the path needs a real decode
+    records = iter_raw_records(["git", "diff", "--numstat", "-z", *extra_args])
+    for record in records:
+        if not record:
+            continue
+        additions, deletions, file_path = record.split(b"\t", 2)
+        if not file_path:
+            # Rename: the source and destination paths follow as separate records
+            next(records, None)
+            file_path = next(records, b"")
+        numstat[file_path.decode("utf-8", "surrogateescape")] = (
+            additions.decode("ascii"),
+            deletions.decode("ascii"),
+        )
+
+    return numstat
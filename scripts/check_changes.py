@@ -6,48 +6,58 @@ This script helps identify what has changed locally compared to what's on GitHub
 making it easier to update the changelog with accurate information.
 """
 
-import subprocess
+import itertools
+import json
+import os
+import re
 import sys
-from pathlib import Path
-from typing import Dict, List
-
-
-def run_git_command(command: List[str]) -> str:
-    """Run a git command and return the output."""
-    try:
-        result = subprocess.run(
-            command, capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Git command failed: {' '.join(command)}")
-        print(f"Error: {e.stderr}")
-        return ""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from _changelog import REPO_ROOT, get_head_sha, get_numstat, iter_status, run_git_command
+
+CACHE_FILE = REPO_ROOT / ".git" / "git-batch-pull-changelog-cache.json"
+
+CATEGORIES = ("features", "bugfixes", "documentation", "tests", "config", "security", "other")
+
+# (category, changelog header) in output order; bugfixes are never suggested
+# because nothing is classified into them without commit analysis.
+SECTIONS = (
+    ("features", "Added"),
+    ("documentation", "Documentation"),
+    ("security", "Security"),
+    ("tests", "Testing"),
+    ("config", "Configuration"),
+    ("other", "Other"),
+)
+
+# One anchored alternation per category, tried in priority order; the name of
+# the matching group is the category. src/ files could be features or bugfixes,
+# which would need commit analysis, so they default to features.
+CATEGORY_RE = re.compile(
+    r"(?P<documentation>docs/|README)"
+    r"|(?P<tests>tests/)"
+    r"|(?P<config>.*\.(?:ya?ml|toml|cfg|ini)$)"
+    r"|(?P<security>(?i:.*(?:security|auth)))"
+    r"|(?P<features>src/)"
+)
 
 
 def get_git_status() -> Dict[str, List[str]]:
     """Get current git status categorized by change type."""
-    status_output = run_git_command(["git", "status", "--porcelain"])
-
     changes = {"modified": [], "added": [], "deleted": [], "renamed": [], "untracked": []}
 
-    for line in status_output.split("\n"):
-        if not line.strip():
-            continue
-
-        status_code = line[:2]
-        file_path = line[3:]
-
-        if status_code[0] == "M" or status_code[1] == "M":
+    for status_code, file_path in iter_status():
+        if status_code == "??":
+            changes["untracked"].append(file_path)
+        elif "M" in status_code:
             changes["modified"].append(file_path)
-        elif status_code[0] == "A" or status_code[1] == "A":
+        elif "A" in status_code:
             changes["added"].append(file_path)
-        elif status_code[0] == "D" or status_code[1] == "D":
+        elif "D" in status_code:
             changes["deleted"].append(file_path)
-        elif status_code[0] == "R":
+        elif status_code[0] in "RC":
             changes["renamed"].append(file_path)
-        elif status_code == "??":
-            changes["untracked"].append(file_path)
 
     return changes
 
@@ -62,112 +72,98 @@ def get_commit_history(since: str = "HEAD~10") -> List[str]:
     return [line.strip() for line in log_output.split("\n") if line.strip()]
 
 
-def analyze_file_changes(file_path: str) -> str:
-    """Analyze what changed in a specific file."""
-    if not Path(file_path).exists():
+def load_change_cache() -> Dict[str, str]:
+    """Load cached file analyses from previous runs."""
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_change_cache(cache: Dict[str, str]) -> None:
+    """Persist cached file analyses, keeping only entries for the current HEAD."""
+    prefix = get_head_sha() + ":"
+    current = {key: value for key, value in cache.items() if key.startswith(prefix)}
+    try:
+        CACHE_FILE.write_text(json.dumps(current))
+    except OSError:
+        pass  # Caching is best effort
+
+
+def analyze_file_changes(file_path: str, cache: Optional[Dict[str, str]] = None) -> str:
+    """Analyze what changed in a specific file.
+
+    When ``cache`` is given, results are looked up and stored under a key made of
+    HEAD, the path and the file's mtime and size, so unchanged files skip git.
+    """
+    path = REPO_ROOT / file_path
+    if not path.exists():
         return "File was deleted"
 
-    diff_output = run_git_command(["git", "diff", "HEAD", "--", file_path])
-    if not diff_output:
-        # Try staged changes
-        diff_output = run_git_command(["git", "diff", "--cached", "--", file_path])
+    cache_key = None
+    if cache is not None:
+        stat = path.stat()
+        cache_key = f"{get_head_sha()}:{file_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        if cache_key in cache:
+            return cache[cache_key]
 
-    if not diff_output:
-        return "New file"
+    numstat = get_numstat("HEAD")
+    if file_path not in numstat:
+        # Not in the working-tree diff: try staged changes
+        numstat = get_numstat("--cached", "--", file_path)
 
-    # Count additions and deletions
-    lines = diff_output.split("\n")
-    additions = sum(1 for line in lines if line.startswith("+") and not line.startswith("+++"))
-    deletions = sum(1 for line in lines if line.startswith("-") and not line.startswith("---"))
+    if file_path not in numstat:
+        change_info = "New file"
+    else:
+        additions, deletions = numstat[file_path]
+        change_info = f"+{additions} -{deletions} lines"
 
-    return f"+{additions} -{deletions} lines"
+    if cache_key is not None:
+        cache[cache_key] = change_info
+    return change_info
 
 
 def categorize_changes(changes: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """Categorize changes by type for changelog."""
-    categories = {
-        "features": [],
-        "bugfixes": [],
-        "documentation": [],
-        "tests": [],
-        "config": [],
-        "security": [],
-        "other": [],
-    }
-
-    all_files = []
-    for change_type, files in changes.items():
-        all_files.extend(files)
-
-    for file_path in all_files:
-        if file_path.startswith(("docs/", "README", "*.md")):
-            categories["documentation"].append(file_path)
-        elif file_path.startswith("tests/"):
-            categories["tests"].append(file_path)
-        elif file_path.endswith((".yml", ".yaml", ".toml", ".cfg", ".ini")):
-            categories["config"].append(file_path)
-        elif "security" in file_path.lower() or "auth" in file_path.lower():
-            categories["security"].append(file_path)
-        elif file_path.startswith("src/"):
-            # Could be features or bugfixes - would need commit analysis
-            categories["features"].append(file_path)
-        else:
-            categories["other"].append(file_path)
+    categories: Dict[str, List[str]] = {category: [] for category in CATEGORIES}
+
+    for file_path in itertools.chain.from_iterable(changes.values()):
+        match = CATEGORY_RE.match(file_path)
+        categories[match.lastgroup if match else "other"].append(file_path)
 
     return categories
 
 
-def generate_changelog_suggestions(changes: Dict[str, List[str]]) -> str:
+def _iter_suggestions(categories: Dict[str, List[str]], infos: Dict[str, str]) -> Iterator[str]:
+    """Yield the lines of the changelog suggestions."""
+    yield "## Suggested Changelog Updates"
+    yield ""
+
+    for category, header in SECTIONS:
+        files = categories[category]
+        if files:
+            yield f"### {header}"
+            for file_path in files:
+                yield f"- Updated `{file_path}` ({infos[file_path]})"
+            yield ""
+
+
+def generate_changelog_suggestions(
+    changes: Dict[str, List[str]], cache: Optional[Dict[str, str]] = None
+) -> str:
     """Generate changelog suggestions based on changes."""
     categories = categorize_changes(changes)
 
-    suggestions = []
-    suggestions.append("## Suggested Changelog Updates")
-    suggestions.append("")
-
-    if categories["features"]:
-        suggestions.append("### Added")
-        for file_path in categories["features"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    if categories["documentation"]:
-        suggestions.append("### Documentation")
-        for file_path in categories["documentation"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    if categories["security"]:
-        suggestions.append("### Security")
-        for file_path in categories["security"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    if categories["tests"]:
-        suggestions.append("### Testing")
-        for file_path in categories["tests"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    if categories["config"]:
-        suggestions.append("### Configuration")
-        for file_path in categories["config"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    if categories["other"]:
-        suggestions.append("### Other")
-        for file_path in categories["other"]:
-            change_info = analyze_file_changes(file_path)
-            suggestions.append(f"- Updated `{file_path}` ({change_info})")
-        suggestions.append("")
-
-    return "\n".join(suggestions)
+    # Remaining per-file work is waiting on git child processes, so threads overlap it.
+    # Prime the shared working-tree diff first so the workers don't all race to run it.
+    files = list(dict.fromkeys(path for paths in categories.values() for path in paths))
+    get_numstat("HEAD")
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        infos = dict(
+            zip(files, executor.map(lambda path: analyze_file_changes(path, cache), files))
+        )
+
+    return "\n".join(_iter_suggestions(categories, infos))
 
 
 def main():
@@ -214,7 +210,9 @@ def main():
 
     # Generate suggestions
     if total_changes > 0:
-        print("\n" + generate_changelog_suggestions(changes))
+        cache = load_change_cache()
+        print("\n" + generate_changelog_suggestions(changes, cache))
+        save_change_cache(cache)
 
     print("\n" + "=" * 60)
     print("💡 Tips for updating your changelog:")
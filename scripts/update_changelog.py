@@ -4,18 +4,52 @@ Changelog update helper script for git-batch-pull.
 Helps detect changes and suggests changelog updates.
 """
 
-import subprocess
+import re
 import sys
 from pathlib import Path
 
-
-def run_git_command(cmd):
-    """Run a git command and return the output."""
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+from _changelog import iter_status, run_git_command
+
+# Anchored alternation tried in priority order; each group maps to a changelog
+# category and entry template in CHANGE_RULES.
+CHANGE_RE = re.compile(
+    r"(?P<docs_security>(?=docs/|.*\.md$)(?i:.*security))"
+    r"|(?P<docs>docs/|.*\.md$)"
+    r"|(?P<src_security>src/.*security)"
+    r"|(?P<src_cli>src/.*cli)"
+    r"|(?P<src_tests>src/.*test)"
+    r"|(?P<src>src/)"
+    r"|(?P<tests>tests/)"
+    r"|(?P<config>.*\.(?:ya?ml|toml|cfg|ini)$)"
+    r"|(?P<ci>.*\.github)"
+    r"|(?P<docker>(?i:.*docker))"
+    r"|(?P<dependencies>.*requirements)"
+)
+
+# Output sections, in the order they are printed
+SUGGESTION_CATEGORIES = (
+    "Added",
+    "Changed",
+    "Fixed",
+    "Security",
+    "Technical",
+    "Documentation",
+    "Breaking Changes",
+)
+
+CHANGE_RULES = {
+    "docs_security": ("Security", "Updated {}"),
+    "docs": ("Documentation", "Updated {}"),
+    "src_security": ("Security", "Enhanced {}"),
+    "src_cli": ("Changed", "Updated CLI in {}"),
+    "src_tests": ("Technical", "Updated tests in {}"),
+    "src": ("Changed", "Modified {}"),
+    "tests": ("Technical", "Updated tests in {}"),
+    "config": ("Technical", "Updated configuration in {}"),
+    "ci": ("Technical", "Updated CI/CD in {}"),
+    "docker": ("Technical", "Updated Docker configuration"),
+    "dependencies": ("Technical", "Updated dependencies in {}"),
+}
 
 
 def get_changed_files():
@@ -24,98 +58,51 @@ def get_changed_files():
     commands = [
         ["git", "diff", "--name-only", "HEAD"],  # Changes since last commit
         ["git", "diff", "--cached", "--name-only"],  # Staged changes
-        ["git", "status", "--porcelain"],  # All changes
     ]
 
     for cmd in commands:
-        output = run_git_command(cmd)
+        output = run_git_command(cmd, report_errors=False)
         if output:
-            if cmd[1] == "status":
-                # Parse porcelain output
-                files = []
-                for line in output.split("\n"):
-                    if line.strip():
-                        files.append(line[3:])  # Remove status prefix
-                return files
-            else:
-                return output.split("\n") if output else []
+            return output.split("\n")
 
-    return []
+    # All changes, including untracked files
+    return [path for _, path in iter_status(report_errors=False)]
 
 
 def analyze_changes(files):
     """Analyze changed files and suggest changelog categories."""
-    suggestions = {
-        "Added": [],
-        "Changed": [],
-        "Fixed": [],
-        "Security": [],
-        "Technical": [],
-        "Documentation": [],
-        "Breaking Changes": [],
-    }
+    suggestions = {category: [] for category in SUGGESTION_CATEGORIES}
 
     for file in files:
         if not file.strip():
             continue
 
-        # Documentation changes
-        if file.startswith("docs/") or file.endswith(".md"):
-            if "security" in file.lower():
-                suggestions["Security"].append(f"Updated {file}")
-            else:
-                suggestions["Documentation"].append(f"Updated {file}")
-
-        # Source code changes
-        elif file.startswith("src/"):
-            if "security" in file:
-                suggestions["Security"].append(f"Enhanced {file}")
-            elif "cli" in file:
-                suggestions["Changed"].append(f"Updated CLI in {file}")
-            elif "test" in file:
-                suggestions["Technical"].append(f"Updated tests in {file}")
-            else:
-                suggestions["Changed"].append(f"Modified {file}")
-
-        # Test changes
-        elif file.startswith("tests/"):
-            suggestions["Technical"].append(f"Updated tests in {file}")
-
-        # Configuration changes
-        elif file.endswith((".yml", ".yaml", ".toml", ".cfg", ".ini")):
-            suggestions["Technical"].append(f"Updated configuration in {file}")
-
-        # CI/CD changes
-        elif ".github" in file:
-            suggestions["Technical"].append(f"Updated CI/CD in {file}")
-
-        # Docker changes
-        elif "docker" in file.lower() or file == "Dockerfile":
-            suggestions["Technical"].append("Updated Docker configuration")
-
-        # Dependencies
-        elif "requirements" in file or file == "pyproject.toml":
-            suggestions["Technical"].append(f"Updated dependencies in {file}")
+        match = CHANGE_RE.match(file)
+        if match:
+            category, template = CHANGE_RULES[match.lastgroup]
+            suggestions[category].append(template.format(file))
 
     return suggestions
 
 
-def format_suggestions(suggestions):
-    """Format suggestions for changelog."""
-    output = []
-    output.append("# Suggested Changelog Updates")
-    output.append("")
-    output.append("Based on the changed files, here are suggested changelog entries:")
-    output.append("")
+def _iter_suggestion_lines(suggestions):
+    """Yield the lines of the formatted changelog suggestions."""
+    yield "# Suggested Changelog Updates"
+    yield ""
+    yield "Based on the changed files, here are suggested changelog entries:"
+    yield ""
 
     for category, items in suggestions.items():
         if items:
-            output.append(f"### {category}")
+            yield f"### {category}"
             for item in items:
-                output.append(f"- {item}")
-            output.append("")
+                yield f"- {item}"
+            yield ""
 
-    return "\n".join(output)
+
+def format_suggestions(suggestions):
+    """Format suggestions for changelog."""
+    return "\n".join(_iter_suggestion_lines(suggestions))
 
 
 def main():
@@ -62,6 +62,17 @@ def main_command(
     use_ssh: bool = typer.Option(
         False, "--ssh/--https", help="Use SSH URLs for cloning (default: HTTPS)"
     ),
+    ssh_multiplex: bool = typer.Option(
+        False,
+        "--ssh-multiplex",
+        help="Share one SSH connection per host (sockets in ~/.cache/git-batch-pull)",
+    ),
+    # Backend options
+    use_libgit2: bool = typer.Option(
+        False,
+        "--libgit2",
+        help="Answer local git queries in-process with pygit2 (needs the libgit2 extra)",
+    ),
     # Repository filtering
     repos: Optional[str] = typer.Option(
         None, "--repos", help="Comma-separated list of repository names to process"
@@ -147,6 +158,8 @@ def main_command(
 
         # Override config with CLI arguments
         config_obj.use_ssh = use_ssh
+        config_obj.ssh_multiplex = ssh_multiplex or config_obj.ssh_multiplex
+        config_obj.use_libgit2 = use_libgit2 or config_obj.use_libgit2
         config_obj.repo_visibility = visibility
         config_obj.dry_run = dry_run
         config_obj.quiet = quiet
@@ -1,8 +1,9 @@
 """Core batch processing logic for repositories."""
 
+import asyncio
 import concurrent.futures
 import logging
-from typing import Callable, List, Optional
+from typing import Awaitable, Callable, List, Optional
 
 from tqdm import tqdm
 
@@ -82,6 +83,19 @@ class BatchProcessor:
         """
         result = ProcessingResult()
 
+        def record_failure(repository: Repository, e: Exception) -> None:
+            """Count a failed repository and report it."""
+            if isinstance(e, GitOperationError):
+                self.logger.error(f"Git operation failed for {repository.name}: {e}")
+                result.errors.append((repository.name, str(e)))
+            else:
+                self.logger.error(f"Unexpected error for {repository.name}: {e}")
+                result.errors.append((repository.name, f"Unexpected error: {e}"))
+            result.failed += 1
+
+            if error_callback:
+                error_callback(repository.name, e)
+
         def process_single_repository(repository: Repository) -> None:
             """Process a single repository."""
             try:
@@ -96,29 +110,32 @@ class BatchProcessor:
                 result.processed += 1
                 self.logger.info(f"Successfully processed: {repository.name}")
 
-            except GitOperationError as e:
-                self.logger.error(f"Git operation failed for {repository.name}: {e}")
-                result.failed += 1
-                result.errors.append((repository.name, str(e)))
-
-                if error_callback:
-                    error_callback(repository.name, e)
-
             except Exception as e:
-                self.logger.error(f"Unexpected error for {repository.name}: {e}")
-                result.failed += 1
-                result.errors.append((repository.name, f"Unexpected error: {e}"))
+                record_failure(repository, e)
 
-                if error_callback:
-                    error_callback(repository.name, e)
+        async def aprocess_single_repository(repository: Repository) -> None:
+            """Process a single repository on the event loop."""
+            try:
+                self.logger.debug(f"Processing repository: {repository.name}")
+                await self.git_service.aclone_or_pull(repository, use_ssh)
+                result.processed += 1
+                self.logger.info(f"Successfully processed: {repository.name}")
 
-        # Process repositories
-        if self.max_workers > 1 and not dry_run:
-            # Parallel processing
-            self._process_parallel(batch.repositories, process_single_repository, quiet)
-        else:
-            # Sequential processing
-            self._process_sequential(batch.repositories, process_single_repository, quiet)
+            except Exception as e:
+                record_failure(repository, e)
+
+        # Process repositories, checking which exist with one scan of the base folder
+        with self.git_service.existence_cache():
+            if self.max_workers > 1 and not dry_run and not interactive_auth:
+                # Concurrent processing: git runs as asyncio subprocesses, one loop
+                # thread waits on all of them
+                self._process_async(batch.repositories, aprocess_single_repository, quiet)
+            elif self.max_workers > 1 and not dry_run:
+                # Parallel processing (credential prompts need the blocking calls)
+                self._process_parallel(batch.repositories, process_single_repository, quiet)
+            else:
+                # Sequential processing
+                self._process_sequential(batch.repositories, process_single_repository, quiet)
 
         return result
 
@@ -153,6 +170,32 @@ class BatchProcessor:
                     except Exception:
                         pass  # nosec
 
+    def _process_async(
+        self,
+        repositories: List[Repository],
+        processor_func: Callable[[Repository], Awaitable[None]],
+        quiet: bool,
+    ) -> None:
+        """Process repositories concurrently, at most max_workers at a time."""
+        progress = None if quiet else tqdm(total=len(repositories), desc="Processing repositories")
+
+        async def process_all() -> None:
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def process(repository: Repository) -> None:
+                async with semaphore:
+                    await processor_func(repository)
+                if progress is not None:
+                    progress.update()
+
+            await asyncio.gather(*(process(repository) for repository in repositories))
+
+        try:
+            asyncio.run(process_all())
+        finally:
+            if progress is not None:
+                progress.close()
+
     def _process_sequential(
         self,
         repositories: List[Repository],
@@ -66,7 +66,9 @@ class ProtocolHandler:
 
         if should_fix:
             self.logger.info(f"Fixing protocol mismatches to {intended_protocol.upper()}")
-            self.repository_service.fix_protocol_mismatches(batch, intended_protocol, entity_name)
+            self.repository_service.fix_protocol_mismatches(
+                batch, intended_protocol, entity_name, mismatches
+            )
             return True
         else:
             self.logger.info("Continuing with existing protocols")
@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 import requests
 
@@ -13,7 +13,13 @@ class GitHubAPIClient:
     Handles authentication, pagination, and error handling.
     """
 
-    def __init__(self, token: str, max_retries: int = 3, backoff: float = 2.0):
+    def __init__(
+        self,
+        token: str,
+        max_retries: int = 3,
+        backoff: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         """
         Initialize the GitHubAPIClient.
 
@@ -21,6 +27,7 @@ class GitHubAPIClient:
             token: GitHub personal access token.
             max_retries: Number of retries for failed requests.
             backoff: Backoff time (seconds) for retries.
+            sleep: Function used to wait between retries and on rate limits.
         """
         self.session = requests.Session()
         self.session.headers.update(
@@ -32,6 +39,7 @@ class GitHubAPIClient:
         self.api_url = "https://api.github.com"
         self.max_retries = max_retries
         self.backoff = backoff
+        self._sleep = sleep
 
     def get_repos(
         self, entity_type: str, entity_name: str, repo_visibility: str = "all"
@@ -108,7 +116,7 @@ class GitHubAPIClient:
                         now = int(time.time())
                         wait = max(reset - now, 1)
                         logging.warning(f"Rate limit exceeded, sleeping for {wait} seconds")
-                        time.sleep(wait)
+                        self._sleep(wait)
                         continue
                     else:
                         try:
@@ -122,6 +130,6 @@ class GitHubAPIClient:
                         raise GitHubAPIError(
                             f"GitHub API error after {self.max_retries} attempts: {e}"
                         )
-                    time.sleep(self.backoff)
+                    self._sleep(self.backoff)
             page += 1
         return repos
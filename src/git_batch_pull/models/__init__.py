@@ -1,6 +1,6 @@
 """Data models for git-batch-pull."""
 
 from .config import Config
-from .repository import Repository, RepositoryBatch, RepositoryInfo
+from .repository import Repository, RepositoryBatch, RepositoryInfo, RepositoryState
 
-__all__ = ["Config", "Repository", "RepositoryInfo", "RepositoryBatch"]
+__all__ = ["Config", "Repository", "RepositoryInfo", "RepositoryBatch", "RepositoryState"]
@@ -18,6 +18,8 @@ class Config:
     max_workers: int = 1
     log_level: str = "INFO"
     use_ssh: bool = False
+    ssh_multiplex: bool = False
+    use_libgit2: bool = False
     dry_run: bool = False
     quiet: bool = False
     plain: bool = False
@@ -80,6 +82,8 @@ class Config:
             max_workers=extra_config.get("max_workers", 1),
             log_level=extra_config.get("log_level", "INFO"),
             use_ssh=extra_config.get("use_ssh", False),
+            ssh_multiplex=extra_config.get("ssh_multiplex", False),
+            use_libgit2=extra_config.get("use_libgit2", False),
             dry_run=extra_config.get("dry_run", False),
             quiet=extra_config.get("quiet", False),
             plain=extra_config.get("plain", False),
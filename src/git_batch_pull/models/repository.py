@@ -1,13 +1,15 @@
 """Repository data models."""
 
+import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class RepositoryInfo:
-    """Information about a GitHub repository."""
+    """Information about a GitHub repository (immutable, so instances can be shared)."""
 
     name: str
     default_branch: str
@@ -17,6 +19,17 @@ class RepositoryInfo:
     archived: bool = False
     fork: bool = False
 
+    # cached_property stores into the instance __dict__, which frozen dataclasses allow
+    @cached_property
+    def clone_argv_https(self) -> Tuple[str, ...]:
+        """``git clone`` argv prefix for the HTTPS URL (the local path is appended)."""
+        return ("git", "clone", self.clone_url)
+
+    @cached_property
+    def clone_argv_ssh(self) -> Tuple[str, ...]:
+        """``git clone`` argv prefix for the SSH URL, or HTTPS when there is none."""
+        return ("git", "clone", self.ssh_url or self.clone_url)
+
     @classmethod
     def from_github_api(cls, repo_data: Dict) -> "RepositoryInfo":
         """Create RepositoryInfo from GitHub API response."""
@@ -35,6 +48,10 @@ class RepositoryInfo:
 class Repository:
     """Local repository with associated metadata."""
 
+    # Declared by hand (dataclass(slots=True) needs Python 3.10); batches hold
+    # thousands of these, and slots drop the per-instance __dict__
+    __slots__ = ("info", "local_path", "_path_strs")
+
     info: RepositoryInfo
     local_path: Path
 
@@ -43,10 +60,34 @@ class Repository:
         """Get repository name."""
         return self.info.name
 
+    @property
+    def local_path_str(self) -> str:
+        """Get the local path as a string, for git argv (cached)."""
+        return self._get_path_strs()[0]
+
+    @property
+    def parent_path_str(self) -> str:
+        """Get the local path's parent directory as a string (cached)."""
+        return self._get_path_strs()[1]
+
+    def _get_path_strs(self) -> Tuple[str, str]:
+        """Get (local path, parent) strings, rebuilt only when local_path is replaced."""
+        try:
+            path, strs = self._path_strs
+            if path is self.local_path:
+                return strs
+        except AttributeError:
+            pass
+        strs = (os.fspath(self.local_path), os.fspath(self.local_path.parent))
+        self._path_strs: Tuple[Path, Tuple[str, str]] = (self.local_path, strs)
+        return strs
+
     @property
     def exists_locally(self) -> bool:
         """Check if repository exists locally."""
-        return self.local_path.exists() and (self.local_path / ".git").exists()
+        # One stat: .git cannot exist without local_path. exists() rather than
+        # isdir() so worktrees and submodules (where .git is a file) still count
+        return os.path.exists(os.path.join(self.local_path_str, ".git"))
 
     def get_clone_url(self, use_ssh: bool = False) -> str:
         """Get the appropriate clone URL based on protocol preference."""
@@ -55,6 +96,20 @@ class Repository:
         return self.info.clone_url
 
 
+@dataclass(frozen=True)
+class RepositoryState:
+    """Working-tree state of a local clone, as read before a pull."""
+
+    head_sha: Optional[str]  # None when the repository has no commits
+    dirty: bool = False
+    branch: Optional[str] = None  # None when HEAD is detached or not read
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the repository has no commits."""
+        return self.head_sha is None
+
+
 @dataclass
 class RepositoryBatch:
     """A batch of repositories to process."""
@@ -1,5 +1,9 @@
+import functools
 import importlib.metadata
 import logging
+import sys
+
+PLUGIN_GROUP = "git_batch_pull_plugins"
 
 
 class PluginBase:
@@ -17,12 +21,25 @@ def discover_plugins():
     Discover plugins via entry points.
     Gracefully handle missing/broken plugins.
 
+    Installed plugins don't change while the process runs, so discovery happens
+    once; each call returns a fresh copy of the mapping.
+
     Returns:
         dict: Mapping of plugin name to plugin class.
     """
+    return dict(_load_plugins())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_plugins():
+    """Load every plugin entry point (cached; see discover_plugins)."""
     plugins = {}
     try:
-        entry_points = importlib.metadata.entry_points().get("git_batch_pull_plugins", [])
+        if sys.version_info >= (3, 10):
+            # Only this group's entry points, not every installed distribution's
+            entry_points = importlib.metadata.entry_points(group=PLUGIN_GROUP)
+        else:
+            entry_points = importlib.metadata.entry_points().get(PLUGIN_GROUP, [])
         for entry_point in entry_points:
             try:
                 plugin = entry_point.load()
@@ -30,7 +47,7 @@ def discover_plugins():
                 logging.info(f"Loaded plugin: {entry_point.name} from {entry_point.module}")
             except Exception as e:
                 logging.warning(
-                    f"Failed to load plugin {entry_point.name} from " f"{entry_point.module}: {e}"
+                    f"Failed to load plugin {entry_point.name} from {entry_point.module}: {e}"
                 )
     except Exception as e:
         logging.warning(f"Failed to discover plugins: {e}")
@@ -1,16 +1,47 @@
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
 
+# Scheme prefixes of lower-cased remote URLs; tuple startswith beats a regex here
+_SSH_PREFIXES = ("git@", "ssh://")
+_HTTPS_PREFIX = "https://"
 
-def detect_protocol_mismatch(repo_path: str, intended_protocol: Optional[str] = None) -> str:
-    """
-    Detect if the remote URL protocol (SSH/HTTPS) mismatches the user's intended protocol.
 
-    Args:
-        repo_path: Path to the local git repository.
-        intended_protocol: 'ssh', 'https', or None (just report protocol).
-    Returns:
-        str: Warning string if a mismatch is detected, otherwise an empty string.
-    """
+def clear_cache() -> None:
+    """Forget every cached remote URL."""
+    _cached_remote_url.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _classify(remote_url: str) -> Tuple[bool, bool]:
+    """Return (is_ssh, is_https) for a remote URL."""
+    remote_url_lower = remote_url.lower()
+    return remote_url_lower.startswith(_SSH_PREFIXES), remote_url_lower.startswith(_HTTPS_PREFIX)
+
+
+def _get_remote_url(repo_path: str) -> Optional[str]:
+    """Get the origin URL, running git only when .git/config has changed since last time."""
+    try:
+        config_stat = os.stat(os.path.join(repo_path, ".git", "config"))
+    except OSError:
+        return _read_remote_url(repo_path)
+    return _cached_remote_url(
+        os.path.abspath(repo_path), config_stat.st_mtime_ns, config_stat.st_size
+    )
+
+
+# Keyed by .git/config's mtime and size too, so an edited config misses even when
+# the rewrite lands within the filesystem's timestamp granularity (a protocol
+# switch changes the URL's length); entries of superseded configs age out of the
+# LRU rather than piling up
+@lru_cache(maxsize=1024)
+def _cached_remote_url(repo_path: str, config_mtime: int, config_size: int) -> Optional[str]:
+    """Get the origin URL of a repository whose .git/config has the given mtime and size."""
+    return _read_remote_url(repo_path)
+
+
+def _read_remote_url(repo_path: str) -> Optional[str]:
+    """Run git to get the origin URL, or None when there is none."""
     import subprocess
 
     try:
@@ -21,13 +52,26 @@ def detect_protocol_mismatch(repo_path: str, intended_protocol: Optional[str] =
             text=True,
             check=True,
         )
-        remote_url = result.stdout.strip()
     except Exception:
+        return None
+    return result.stdout.strip()
+
+
+def detect_protocol_mismatch(repo_path: str, intended_protocol: Optional[str] = None) -> str:
+    """
+    Detect if the remote URL protocol (SSH/HTTPS) mismatches the user's intended protocol.
+
+    Args:
+        repo_path: Path to the local git repository.
+        intended_protocol: 'ssh', 'https', or None (just report protocol).
+    Returns:
+        str: Warning string if a mismatch is detected, otherwise an empty string.
+    """
+    remote_url = _get_remote_url(repo_path)
+    if remote_url is None:
         return ""
 
-    remote_url_lower = remote_url.lower()
-    is_ssh = remote_url_lower.startswith("git@") or remote_url_lower.startswith("ssh://")
-    is_https = remote_url_lower.startswith("https://")
+    is_ssh, is_https = _classify(remote_url)
 
     if intended_protocol == "ssh":
         if not is_ssh:
@@ -1,6 +1,28 @@
 import json
 import os
-from typing import Dict, List
+import tempfile
+from types import ModuleType
+from typing import Dict, List, Optional, cast
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional: pip install git-batch-pull[fast-json]
+    orjson = None
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> object:
+    """Parse UTF-8 JSON (orjson's decode error subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class RepoStore:
@@ -24,8 +46,18 @@ class RepoStore:
         Args:
             repos: List of repository metadata dicts.
         """
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(repos, f, indent=2)
+        # Write a sibling temp file and rename it over the target, so readers only
+        # ever see a complete file; no fsync, as the file is a rebuildable cache
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(self.path)}.", dir=os.path.dirname(self.path) or "."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(repos))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def load(self) -> List[Dict]:
         """
@@ -34,8 +66,8 @@ class RepoStore:
         Returns:
             List of repository metadata dicts.
         """
-        with open(self.path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(self.path, "rb") as f:
+            return cast(List[Dict], _loads(f.read()))
 
     def exists(self) -> bool:
         """
@@ -1,14 +1,26 @@
 """Path validation utilities for security."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Union
 
 from ..exceptions import PathValidationError, SecurityError
 
+# Reserved device names on Windows
+_RESERVED_NAMES = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{i}" for i in range(1, 10)]
+    + [f"LPT{i}" for i in range(1, 10)]
+)
+
 
 class PathValidator:
     """Validates paths to prevent security issues like path traversal."""
 
+    # Stateless: every method is static, so instances need no __dict__
+    __slots__ = ()
+
     @staticmethod
     def validate_safe_path(path: Union[str, Path], base_path: Union[str, Path]) -> Path:
         """
@@ -24,18 +36,21 @@ class PathValidator:
         Raises:
             PathValidationError: If path is unsafe
         """
-        path_obj = Path(path).resolve()
-        base_obj = Path(base_path).resolve()
+        # Compare resolved strings rather than building PurePath segment lists
+        path_str = os.path.realpath(path)
+        base_str = os.path.realpath(base_path)
 
         try:
             # Check if path is within base directory
-            path_obj.relative_to(base_obj)
-        except ValueError:
+            inside = os.path.commonpath((base_str, path_str)) == base_str
+        except ValueError:  # Different drives on Windows
+            inside = False
+        if not inside:
             raise PathValidationError(
                 f"Path '{path}' is outside of allowed base directory '{base_path}'"
             )
 
-        return path_obj
+        return Path(path_str)
 
     @staticmethod
     def validate_absolute_path(path: Union[str, Path]) -> Path:
@@ -84,10 +99,13 @@ class PathValidator:
         return path_obj
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def validate_filename(filename: str) -> str:
         """
         Validate filename for security (no path traversal, reserved names, etc.).
 
+        Results are cached, as the same repository names are checked on every run.
+
         Args:
             filename: Filename to validate
 
@@ -104,33 +122,7 @@ class PathValidator:
         if ".." in filename or "/" in filename or "\\" in filename:
             raise PathValidationError(f"Filename contains invalid characters: {filename}")
 
-        # Check for reserved names on Windows
-        reserved_names = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
-
-        if filename.upper() in reserved_names:
+        if filename.upper() in _RESERVED_NAMES:
             raise PathValidationError(f"Filename is a reserved name: {filename}")
 
         return filename
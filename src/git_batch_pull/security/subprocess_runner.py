@@ -1,9 +1,10 @@
 """Safe subprocess execution utilities."""
 
+import asyncio
 import logging
 import subprocess  # nosec
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Mapping, Optional, Union
 
 from ..exceptions import GitOperationError, SecurityError
 
@@ -22,6 +23,7 @@ class SafeSubprocessRunner:
         timeout: Optional[int] = None,
         capture_output: bool = True,
         check: bool = True,
+        env: Optional[Mapping[str, str]] = None,
     ) -> subprocess.CompletedProcess:
         """
         Safely run a git command with proper error handling.
@@ -32,6 +34,7 @@ class SafeSubprocessRunner:
             timeout: Timeout in seconds (uses default if None)
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise exception on non-zero exit
+            env: Environment for the git process (inherits ours if None)
 
         Returns:
             CompletedProcess result
@@ -40,20 +43,9 @@ class SafeSubprocessRunner:
             GitOperationError: If command fails
             SecurityError: If command is unsafe
         """
-        if not command or not isinstance(command, list):
-            raise SecurityError("Command must be a non-empty list")
-
-        # Validate that first command is git
-        if command[0] != "git":
-            raise SecurityError("Only git commands are allowed")
-
-        # Sanitize command arguments
-        safe_command = self._sanitize_command(command)
-
+        safe_command = self._prepare_git_command(command)
         timeout_val = timeout or self.default_timeout
 
-        self.logger.debug(f"Running git command: {' '.join(safe_command)}")
-
         try:
             result = subprocess.run(
                 safe_command,
@@ -62,6 +54,7 @@ class SafeSubprocessRunner:
                 text=True,
                 timeout=timeout_val,
                 check=check,
+                env=env,
             )
 
             if result.returncode != 0:
@@ -86,6 +79,73 @@ class SafeSubprocessRunner:
                 f"Unexpected error running git command: {e}", command=" ".join(safe_command)
             )
 
+    async def arun_git_command(
+        self,
+        command: List[str],
+        cwd: Union[str, Path],
+        timeout: Optional[int] = None,
+        capture_output: bool = True,
+        check: bool = True,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Safely run a git command without blocking the event loop.
+
+        Takes the same arguments and applies the same checks as run_git_command, so
+        many git processes can be awaited concurrently from one thread.
+
+        Returns:
+            CompletedProcess result
+
+        Raises:
+            GitOperationError: If command fails
+            SecurityError: If command is unsafe
+        """
+        safe_command = self._prepare_git_command(command)
+        timeout_val = timeout or self.default_timeout
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *safe_command, cwd=str(cwd), stdout=pipe, stderr=pipe, env=env
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout_val)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise GitOperationError(
+                    f"Git command timed out after {timeout_val} seconds",
+                    command=" ".join(safe_command),
+                )
+        except GitOperationError:
+            raise
+        except Exception as e:
+            raise GitOperationError(
+                f"Unexpected error running git command: {e}", command=" ".join(safe_command)
+            )
+
+        # communicate() returns only once the process has exited
+        assert process.returncode is not None
+        result = subprocess.CompletedProcess(
+            safe_command,
+            process.returncode,
+            stdout=stdout.decode(errors="replace") if stdout is not None else None,
+            stderr=stderr.decode(errors="replace") if stderr is not None else None,
+        )
+        if result.returncode != 0:
+            if check:
+                raise GitOperationError(
+                    f"Git command failed with exit code {result.returncode}",
+                    command=" ".join(safe_command),
+                    stderr=result.stderr,
+                )
+            self.logger.warning(f"Git command failed with code {result.returncode}")
+            if result.stderr:
+                self.logger.warning(f"Error output: {result.stderr}")
+
+        return result
+
     def run_safe_command(
         self,
         command: List[str],
@@ -129,6 +189,26 @@ class SafeSubprocessRunner:
         except subprocess.CalledProcessError as e:
             raise SecurityError(f"Command failed: {e}")
 
+    def _prepare_git_command(self, command: List[str]) -> List[str]:
+        """
+        Validate and sanitize a git command before running it.
+
+        Raises:
+            SecurityError: If command is unsafe
+        """
+        if not command or not isinstance(command, list):
+            raise SecurityError("Command must be a non-empty list")
+
+        # Validate that first command is git
+        if command[0] != "git":
+            raise SecurityError("Only git commands are allowed")
+
+        # Sanitize command arguments
+        safe_command = self._sanitize_command(command)
+
+        self.logger.debug(f"Running git command: {' '.join(safe_command)}")
+        return safe_command
+
     def _sanitize_command(self, command: List[str]) -> List[str]:
         """
         Sanitize command arguments to prevent injection.
@@ -39,6 +39,8 @@ class ServiceContainer:
                 base_folder=self.config.local_folder,
                 subprocess_runner=self.subprocess_runner,
                 path_validator=self.path_validator,
+                use_libgit2=self.config.use_libgit2,
+                ssh_multiplex=self.config.ssh_multiplex,
             )
         return self._git_service
 
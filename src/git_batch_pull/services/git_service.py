@@ -1,14 +1,43 @@
 """Git operations service with enhanced security and error handling."""
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    import pygit2
+else:
+    try:
+        import pygit2
+    except ImportError:  # Optional: pip install git-batch-pull[libgit2]
+        pygit2 = None
 
 from ..exceptions import GitOperationError
-from ..models import Repository
+from ..models import Repository, RepositoryState
 from ..security import PathValidator, SafeSubprocessRunner
 from ..security.credential_manager import InteractiveCredentialManager
 
+HAS_LIBGIT2 = pygit2 is not None
+
+# Remote URL prefixes of each protocol, matched against the lower-cased URL
+_SSH_PREFIXES = ("git@", "ssh://")
+_HTTPS_PREFIX = "https://"
+
 
 class GitService:
     """
@@ -20,6 +49,8 @@ class GitService:
         base_folder: Path,
         subprocess_runner: SafeSubprocessRunner,
         path_validator: PathValidator,
+        use_libgit2: bool = False,
+        ssh_multiplex: bool = False,
     ):
         """
         Initialize the Git service.
@@ -28,12 +59,28 @@ class GitService:
             base_folder: Base directory for all repositories
             subprocess_runner: Safe subprocess runner
             path_validator: Path validator for security
+            use_libgit2: Answer local queries (HEAD, branch, status, remote URLs) and
+                remote URL updates in-process through pygit2 instead of spawning git;
+                clones and pulls still run git (ignored if pygit2 is not installed)
+            ssh_multiplex: Share one SSH connection per host across git's network
+                operations (see get_ssh_env)
         """
         self.base_folder = path_validator.validate_absolute_path(base_folder)
         self.subprocess_runner = subprocess_runner
         self.path_validator = path_validator
         self.logger = logging.getLogger(__name__)
         self.credential_manager = InteractiveCredentialManager()
+        self.use_libgit2 = use_libgit2 and pygit2 is not None
+        if use_libgit2 and pygit2 is None:
+            self.logger.warning("pygit2 is not installed; falling back to the git executable")
+        # (resolved repo path, .git/config mtime, remote) -> remote URL
+        self._remote_url_cache: Dict[Tuple[Path, int, str], Optional[str]] = {}
+        self.ssh_multiplex = ssh_multiplex
+        self._ssh_env: Optional[Dict[str, str]] = None
+        # Directory names in base_folder while an existence_cache() block is active
+        self._existing: Optional[Set[str]] = None
+        # repo name -> validated path under base_folder
+        self._path_cache: Dict[str, Path] = {}
 
         # Ensure base directory exists
         self.path_validator.ensure_directory_exists(self.base_folder)
@@ -51,8 +98,97 @@ class GitService:
         Raises:
             PathValidationError: If repo_name is invalid
         """
-        safe_name = self.path_validator.validate_filename(repo_name)
-        return self.base_folder / safe_name
+        path = self._path_cache.get(repo_name)
+        if path is None:
+            # Invalid names raise before anything is cached, so they are checked every time
+            safe_name = self.path_validator.validate_filename(repo_name)
+            path = self._path_cache[repo_name] = self.base_folder / safe_name
+        return path
+
+    @contextmanager
+    def existence_cache(self) -> Iterator[None]:
+        """
+        Answer repository_exists from one scan of base_folder for the block's duration.
+
+        Repositories that are not in base_folder cost a set lookup instead of two
+        stat calls. Directories created or removed by anything other than this
+        service's clones are not noticed until the block ends. Blocks may nest; the
+        enclosing block's cache is restored when an inner one ends.
+        """
+        previous = self._existing
+        try:
+            with os.scandir(self.base_folder) as entries:
+                self._existing = {entry.name for entry in entries if entry.is_dir()}
+        except OSError as e:
+            self.logger.debug(f"Not caching repository existence: {e}")
+        try:
+            yield
+        finally:
+            self._existing = previous
+
+    def repository_exists(self, repository: Repository) -> bool:
+        """
+        Check if a repository has been cloned locally.
+
+        Same answer as Repository.exists_locally, from the existence cache when active.
+        """
+        existing = self._existing
+        if existing is None or repository.parent_path_str != os.fspath(self.base_folder):
+            return repository.exists_locally
+        return repository.local_path.name in existing and os.path.exists(
+            os.path.join(repository.local_path_str, ".git")
+        )
+
+    def filter_existing(
+        self, repositories: Sequence[Repository]
+    ) -> Tuple[List[Repository], List[Repository]]:
+        """
+        Partition repositories into those cloned locally and those that are not.
+
+        Uses one scan of base_folder (see existence_cache) rather than checking each
+        repository directory separately.
+
+        Returns:
+            (existing, missing), each in the order given
+        """
+        existing: List[Repository] = []
+        missing: List[Repository] = []
+        with self.existence_cache():
+            for repository in repositories:
+                (existing if self.repository_exists(repository) else missing).append(repository)
+        return existing, missing
+
+    @staticmethod
+    def _open_libgit2(repo_path: Path) -> "pygit2.Repository":
+        """
+        Open a repository with pygit2.
+
+        Handles are not kept between calls, so a long batch doesn't hold open files
+        for every repository it has seen, and none is shared between threads.
+
+        Raises:
+            GitOperationError: If the path is not a git repository
+        """
+        try:
+            return pygit2.Repository(os.fspath(repo_path))
+        except (pygit2.GitError, KeyError) as e:
+            raise GitOperationError(f"Unable to open repository {repo_path}: {e}")
+
+    @staticmethod
+    def _libgit2_head_sha(repo: "pygit2.Repository") -> Optional[str]:
+        """Get HEAD's commit SHA from a pygit2 handle, None if HEAD is unborn."""
+        if repo.head_is_unborn:
+            return None
+        return str(repo.head.target)
+
+    @staticmethod
+    def _libgit2_branch(repo: "pygit2.Repository") -> Optional[str]:
+        """Get the checked-out branch name, or None if HEAD is detached."""
+        if repo.head_is_detached:
+            return None
+        # HEAD's symbolic target also names the branch of an unborn HEAD
+        target = str(repo.lookup_reference("HEAD").target)
+        return target[len("refs/heads/") :] if target.startswith("refs/heads/") else None
 
     def has_uncommitted_changes(self, repo_path: Path) -> bool:
         """
@@ -68,6 +204,10 @@ class GitService:
             GitOperationError: If git command fails
         """
         try:
+            if self.use_libgit2:
+                # Same view as --porcelain: changed and untracked files, not ignored ones
+                return bool(self._open_libgit2(repo_path).status())
+
             result = self.subprocess_runner.run_git_command(
                 ["git", "status", "--porcelain"], cwd=repo_path, timeout=10
             )
@@ -76,23 +216,82 @@ class GitService:
             self.logger.error(f"Error checking uncommitted changes in {repo_path}: {e}")
             return False
 
-    def is_repository_empty(self, repo_path: Path) -> bool:
+    def get_head_sha(self, repo_path: Path) -> Optional[str]:
         """
-        Check if a repository is empty (no commits).
+        Get the commit SHA of HEAD.
 
         Args:
             repo_path: Path to the repository
 
         Returns:
-            True if repository is empty
+            HEAD's commit SHA, or None if the repository is empty (no commits)
         """
         try:
-            self.subprocess_runner.run_git_command(
+            if self.use_libgit2:
+                return self._libgit2_head_sha(self._open_libgit2(repo_path))
+
+            result = self.subprocess_runner.run_git_command(
                 ["git", "rev-parse", "--verify", "HEAD"], cwd=repo_path, timeout=5
             )
-            return False  # HEAD exists, so not empty
         except GitOperationError:
-            return True  # No HEAD, repository is empty
+            return None  # No HEAD, repository is empty
+        return result.stdout.strip()
+
+    def get_status(self, repo_path: Path) -> RepositoryState:
+        """
+        Get HEAD's commit, the dirty state and the current branch with a single git call.
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            RepositoryState of the working tree
+
+        Raises:
+            GitOperationError: If git command fails
+        """
+        if self.use_libgit2:
+            repo = self._open_libgit2(repo_path)
+            return RepositoryState(
+                head_sha=self._libgit2_head_sha(repo),
+                dirty=bool(repo.status()),
+                branch=self._libgit2_branch(repo),
+            )
+
+        result = self.subprocess_runner.run_git_command(
+            ["git", "status", "--branch", "--porcelain=v2"], cwd=repo_path, timeout=10
+        )
+        return self._parse_status(result.stdout)
+
+    @staticmethod
+    def _parse_status(output: str) -> RepositoryState:
+        """Parse ``git status --branch --porcelain=v2`` into a RepositoryState."""
+        head_sha: Optional[str] = None
+        branch: Optional[str] = None
+        dirty = False
+        for line in output.splitlines():
+            if line.startswith("# branch.oid "):
+                oid = line[len("# branch.oid ") :].strip()
+                head_sha = None if oid == "(initial)" else oid
+            elif line.startswith("# branch.head "):
+                head = line[len("# branch.head ") :].strip()
+                branch = None if head == "(detached)" else head
+            elif line and not line.startswith("#"):
+                # Changed, unmerged or untracked entry, as --porcelain would list
+                dirty = True
+        return RepositoryState(head_sha=head_sha, dirty=dirty, branch=branch)
+
+    def is_repository_empty(self, repo_path: Path) -> bool:
+        """
+        Check if a repository is empty (no commits).
+
+        Args:
+            repo_path: Path to the repository
+
+        Returns:
+            True if repository is empty
+        """
+        return self.get_head_sha(repo_path) is None
 
     def get_current_branch(self, repo_path: Path) -> Optional[str]:
         """
@@ -105,6 +304,9 @@ class GitService:
             Current branch name or None if detached HEAD
         """
         try:
+            if self.use_libgit2:
+                return self._libgit2_branch(self._open_libgit2(repo_path))
+
             result = self.subprocess_runner.run_git_command(
                 ["git", "branch", "--show-current"], cwd=repo_path, timeout=5
             )
@@ -122,14 +324,56 @@ class GitService:
 
         Returns:
             Remote URL or None if not found
+
+        Results are cached per repository and invalidated whenever .git/config
+        changes, so a protocol check followed by a URL lookup runs git once.
         """
+        cache_key = self._remote_url_key(repo_path, remote)
+        if cache_key is not None and cache_key in self._remote_url_cache:
+            return self._remote_url_cache[cache_key]
+
         try:
-            result = self.subprocess_runner.run_git_command(
-                ["git", "remote", "get-url", remote], cwd=repo_path, timeout=5
-            )
-            return result.stdout.strip()
-        except GitOperationError:
+            if self.use_libgit2:
+                url: Optional[str] = self._open_libgit2(repo_path).remotes[remote].url
+            else:
+                result = self.subprocess_runner.run_git_command(
+                    ["git", "remote", "get-url", remote], cwd=repo_path, timeout=5
+                )
+                url = result.stdout.strip()
+        except (GitOperationError, KeyError):
+            url = None
+
+        if cache_key is not None:
+            self._remote_url_cache[cache_key] = url
+        return url
+
+    def get_remote_urls(
+        self, repo_paths: Sequence[Path], remote: str = "origin", max_workers: int = 8
+    ) -> List[Optional[str]]:
+        """
+        Get the URL of a remote for several repositories, looking them up concurrently.
+
+        Args:
+            repo_paths: Paths to the repositories
+            remote: Remote name (default: origin)
+            max_workers: Maximum number of concurrent lookups
+
+        Returns:
+            Remote URL (or None) for each path, in the order given
+        """
+        if len(repo_paths) <= 1 or max_workers <= 1:
+            return [self.get_remote_url(repo_path, remote) for repo_path in repo_paths]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_paths))) as executor:
+            return list(executor.map(lambda path: self.get_remote_url(path, remote), repo_paths))
+
+    @staticmethod
+    def _remote_url_key(repo_path: Path, remote: str) -> Optional[Tuple[Path, int, str]]:
+        """Get the remote URL cache key, or None if .git/config can't be read."""
+        try:
+            config_mtime = (repo_path / ".git" / "config").stat().st_mtime_ns
+        except OSError:
             return None
+        return (repo_path.resolve(), config_mtime, remote)
 
     def detect_protocol(self, repo_path: Path) -> Optional[str]:
         """
@@ -140,21 +384,72 @@ class GitService:
 
         Returns:
             'ssh', 'https', or None if cannot determine
+
+        The origin URL is cached by get_remote_url, so repeated checks don't spawn
+        git again until .git/config changes.
         """
-        remote_url = self.get_remote_url(repo_path)
+        return self.protocol_from_url(self.get_remote_url(repo_path))
+
+    @staticmethod
+    def protocol_from_url(remote_url: Optional[str]) -> Optional[str]:
+        """Classify a remote URL as 'ssh', 'https' or None."""
         if not remote_url:
             return None
 
         remote_url_lower = remote_url.lower()
-        if remote_url_lower.startswith("git@") or remote_url_lower.startswith("ssh://"):
+        if remote_url_lower.startswith(_SSH_PREFIXES):
             return "ssh"
-        elif remote_url_lower.startswith("https://"):
+        if remote_url_lower.startswith(_HTTPS_PREFIX):
             return "https"
-        else:
+        return None
+
+    def get_ssh_env(self) -> Optional[Dict[str, str]]:
+        """
+        Get an environment that multiplexes git's SSH connections, if enabled.
+
+        Every SSH clone, pull or fetch otherwise pays for a fresh SSH handshake; with
+        ControlMaster the first connection to a host is kept open for 60 seconds and
+        reused by the following ones. The control sockets live in
+        ~/.cache/git-batch-pull, created with mode 0700 on first use.
+
+        Returns:
+            Environment with GIT_SSH_COMMAND set, or None to inherit ours unchanged
+            (unless ssh_multiplex is on; on Windows, whose OpenSSH lacks ControlMaster;
+            or when the user already configured GIT_SSH_COMMAND / GIT_SSH)
+        """
+        if (
+            not self.ssh_multiplex
+            or os.name == "nt"
+            or "GIT_SSH_COMMAND" in os.environ
+            or "GIT_SSH" in os.environ
+        ):
             return None
 
+        if self._ssh_env is None:
+            control_dir = Path.home() / ".cache" / "git-batch-pull"
+            try:
+                control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            except OSError as e:
+                self.logger.debug(f"SSH connection sharing disabled: {e}")
+                return None
+            # %C is a hash of the connection, keeping the socket path short
+            ssh_command = (
+                "ssh -o ControlMaster=auto "
+                f"-o ControlPath={control_dir / 'ssh-%C'} "
+                "-o ControlPersist=60s"
+            )
+            self._ssh_env = {**os.environ, "GIT_SSH_COMMAND": ssh_command}
+
+        return self._ssh_env
+
     def clone_repository(
-        self, repository: Repository, use_ssh: bool = False, interactive_auth: bool = False
+        self,
+        repository: Repository,
+        use_ssh: bool = False,
+        interactive_auth: bool = False,
+        shallow: bool = False,
+        single_branch: bool = False,
+        filter_blobs: bool = False,
     ) -> None:
         """
         Clone a repository.
@@ -163,12 +458,40 @@ class GitService:
             repository: Repository to clone
             use_ssh: Whether to use SSH URL
             interactive_auth: Whether to prompt for HTTPS credentials interactively
+            shallow: Fetch only the latest commit (--depth 1)
+            single_branch: Fetch only the default branch (--single-branch -b <branch>)
+            filter_blobs: Fetch file contents on demand (--filter=blob:none)
 
         Raises:
             GitOperationError: If clone fails
         """
+        command, run_kwargs = self._prepare_clone(
+            repository, use_ssh, interactive_auth, shallow, single_branch, filter_blobs
+        )
+        try:
+            self.subprocess_runner.run_git_command(command, **run_kwargs)
+        except GitOperationError as e:
+            self.logger.error(f"Failed to clone {repository.name}: {e}")
+            raise
+        self.logger.info(f"Successfully cloned {repository.name}")
+        self._record_clone(repository)
+
+    def _prepare_clone(
+        self,
+        repository: Repository,
+        use_ssh: bool,
+        interactive_auth: bool,
+        shallow: bool,
+        single_branch: bool,
+        filter_blobs: bool,
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Get a clone's command and run_git_command options, shared by the sync and async paths.
+
+        Raises:
+            GitOperationError: If interactive credentials can't be obtained
+        """
         clone_url = repository.get_clone_url(use_ssh)
-        repo_path = repository.local_path
 
         self.logger.info(f"Cloning {repository.name}...")
         self.logger.debug(
@@ -188,18 +511,53 @@ class GitService:
                 raise GitOperationError(f"Authentication failed: {e}")
 
         # Ensure parent directory exists
-        self.path_validator.ensure_directory_exists(repo_path.parent)
+        self.path_validator.ensure_directory_exists(repository.local_path.parent)
+
+        # Credentials are only added to HTTPS URLs, which replaces the cached one
+        command = self._clone_command(
+            repository,
+            use_ssh,
+            shallow,
+            single_branch,
+            filter_blobs,
+            clone_url=None if use_ssh or not interactive_auth else clone_url,
+        )
 
-        try:
-            self.subprocess_runner.run_git_command(
-                ["git", "clone", clone_url, str(repo_path)],
-                cwd=repo_path.parent,
-                timeout=300,  # 5 minutes for clone
-            )
-            self.logger.info(f"Successfully cloned {repository.name}")
-        except GitOperationError as e:
-            self.logger.error(f"Failed to clone {repository.name}: {e}")
-            raise
+        run_kwargs: Dict[str, Any] = {
+            "cwd": repository.parent_path_str,
+            "timeout": 300,  # 5 minutes for clone
+        }
+        # SSH clones share one connection per host across repositories
+        if use_ssh:
+            run_kwargs["env"] = self.get_ssh_env()
+        return command, run_kwargs
+
+    def _record_clone(self, repository: Repository) -> None:
+        """Add a freshly cloned repository to the existence cache, if active."""
+        existing = self._existing
+        if existing is not None:
+            existing.add(repository.local_path.name)
+
+    @staticmethod
+    def _clone_command(
+        repository: Repository,
+        use_ssh: bool = False,
+        shallow: bool = False,
+        single_branch: bool = False,
+        filter_blobs: bool = False,
+        clone_url: Optional[str] = None,
+    ) -> List[str]:
+        """Build the git clone argv from the repository's cached template."""
+        info = repository.info
+        git, clone, url = info.clone_argv_ssh if use_ssh else info.clone_argv_https
+        options: List[str] = []
+        if single_branch:
+            options += ["--single-branch", "-b", info.default_branch]
+        if shallow:
+            options += ["--depth", "1"]
+        if filter_blobs:
+            options.append("--filter=blob:none")
+        return [git, clone, *options, clone_url or url, repository.local_path_str]
 
     def pull_repository(self, repository: Repository) -> None:
         """
@@ -211,40 +569,65 @@ class GitService:
         Raises:
             GitOperationError: If pull fails
         """
-        repo_path = repository.local_path
-        default_branch = repository.info.default_branch
+        repo_path = self._pull_path(repository)
+        commands = self._pull_commands(repository, self.get_status(repo_path))
+        try:
+            for command, timeout in commands:
+                self.subprocess_runner.run_git_command(
+                    command, cwd=repo_path, timeout=timeout, env=self.get_ssh_env()
+                )
+        except GitOperationError as e:
+            self.logger.error(f"Failed to pull {repository.name}: {e}")
+            raise
+        if commands:
+            self.logger.info(f"Successfully pulled {repository.name}")
+
+    @staticmethod
+    def _pull_path(repository: Repository) -> Path:
+        """
+        Get the working tree to pull into.
 
+        Raises:
+            GitOperationError: If it doesn't exist
+        """
+        repo_path = repository.local_path
         if not repo_path.exists():
             raise GitOperationError(f"Repository path does not exist: {repo_path}")
+        return repo_path
+
+    def _pull_commands(
+        self, repository: Repository, state: RepositoryState
+    ) -> List[Tuple[List[str], int]]:
+        """
+        Decide how to update a working tree, shared by the sync and async paths.
+
+        Args:
+            repository: Repository being pulled
+            state: Its current status
 
-        if self.is_repository_empty(repo_path):
+        Returns:
+            (command, timeout) pairs to run in order; empty if the pull is skipped
+        """
+        if state.is_empty:
             self.logger.info(f"Repository {repository.name} is empty, nothing to pull")
-            return
+            return []
 
-        if self.has_uncommitted_changes(repo_path):
+        if state.dirty:
             self.logger.warning(
                 f"Repository {repository.name} has uncommitted changes, skipping pull"
             )
-            return
+            return []
 
         self.logger.info(f"Pulling {repository.name}...")
 
-        try:
-            # Checkout default branch
-            self.subprocess_runner.run_git_command(
-                ["git", "checkout", default_branch], cwd=repo_path, timeout=30
-            )
-
-            # Pull from origin
-            self.subprocess_runner.run_git_command(
-                ["git", "pull", "origin", default_branch], cwd=repo_path, timeout=60
-            )
-
-            self.logger.info(f"Successfully pulled {repository.name}")
-
-        except GitOperationError as e:
-            self.logger.error(f"Failed to pull {repository.name}: {e}")
-            raise
+        default_branch = repository.info.default_branch
+        commands: List[Tuple[List[str], int]] = []
+        # Checkout default branch, unless the status already showed it checked out
+        if state.branch != default_branch:
+            commands.append((["git", "checkout", default_branch], 30))
+        # Pull from origin
+        commands.append((["git", "pull", "origin", default_branch], 60))
+        return commands
 
     def update_remote_url(self, repo_path: Path, new_url: str, remote: str = "origin") -> None:
         """
@@ -258,17 +641,39 @@ class GitService:
         Raises:
             GitOperationError: If update fails
         """
+        # The config mtime may not visibly change within the filesystem's timestamp
+        # granularity, so drop cached URLs of this remote explicitly
+        resolved = repo_path.resolve()
+        for key in list(self._remote_url_cache):
+            if key[0] == resolved and key[2] == remote:
+                self._remote_url_cache.pop(key, None)
+
         try:
-            self.subprocess_runner.run_git_command(
-                ["git", "remote", "set-url", remote, new_url], cwd=repo_path, timeout=10
-            )
+            if self.use_libgit2:
+                try:
+                    self._open_libgit2(repo_path).remotes.set_url(remote, new_url)
+                except (pygit2.GitError, KeyError, ValueError) as e:
+                    raise GitOperationError(f"Unable to set {remote} URL: {e}")
+            else:
+                self.subprocess_runner.run_git_command(
+                    ["git", "remote", "set-url", remote, new_url], cwd=repo_path, timeout=10
+                )
+            cache_key = self._remote_url_key(repo_path, remote)
+            if cache_key is not None:
+                self._remote_url_cache[cache_key] = new_url
             self.logger.info(f"Updated {remote} remote URL to {new_url}")
         except GitOperationError as e:
             self.logger.error(f"Failed to update remote URL: {e}")
             raise
 
     def clone_or_pull(
-        self, repository: Repository, use_ssh: bool = False, interactive_auth: bool = False
+        self,
+        repository: Repository,
+        use_ssh: bool = False,
+        interactive_auth: bool = False,
+        shallow: bool = False,
+        single_branch: bool = False,
+        filter_blobs: bool = False,
     ) -> None:
         """
         Clone repository if not present, otherwise pull latest changes.
@@ -277,15 +682,196 @@ class GitService:
             repository: Repository to process
             use_ssh: Whether to use SSH URLs
             interactive_auth: Whether to prompt for HTTPS credentials interactively
+            shallow: Clone only the latest commit
+            single_branch: Clone only the default branch
+            filter_blobs: Clone without file contents (fetched on demand)
 
         Raises:
             GitOperationError: If operation fails
         """
-        if not repository.exists_locally:
-            self.clone_repository(repository, use_ssh, interactive_auth)
+        if not self.repository_exists(repository):
+            self.clone_repository(
+                repository, use_ssh, interactive_auth, shallow, single_branch, filter_blobs
+            )
         else:
             self.pull_repository(repository)
 
+    def clone_or_pull_batch(
+        self,
+        repositories: Sequence[Repository],
+        use_ssh: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[str, Exception]]:
+        """
+        Clone or pull several repositories concurrently.
+
+        Each repository is handled by clone_or_pull on a worker thread; the work is
+        dominated by waiting on git subprocesses, so threads overlap it well.
+
+        Args:
+            repositories: Repositories to process
+            use_ssh: Whether to use SSH URLs
+            max_workers: Maximum number of concurrent repositories
+                (default: three quarters of the CPU count, at least 1)
+
+        Returns:
+            (repository name, error) for every repository that failed
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) * 3 // 4)
+
+        with self.existence_cache():
+            return self._run_concurrently(
+                repositories,
+                lambda repository: self.clone_or_pull(repository, use_ssh),
+                max_workers,
+            )
+
+    async def aclone_or_pull(
+        self,
+        repository: Repository,
+        use_ssh: bool = False,
+        shallow: bool = False,
+        single_branch: bool = False,
+        filter_blobs: bool = False,
+    ) -> None:
+        """
+        Clone or pull a repository without blocking the event loop.
+
+        Same steps and skips as clone_or_pull (both build their commands with
+        _prepare_clone and _pull_commands), with every git call awaited through
+        SafeSubprocessRunner.arun_git_command; with use_libgit2 the status is read
+        through pygit2 on a worker thread instead. Interactive authentication is not
+        offered here since prompting would block the loop.
+
+        Raises:
+            GitOperationError: If operation fails
+        """
+        run = self.subprocess_runner.arun_git_command
+
+        if not self.repository_exists(repository):
+            command, run_kwargs = self._prepare_clone(
+                repository, use_ssh, False, shallow, single_branch, filter_blobs
+            )
+            try:
+                await run(command, **run_kwargs)
+            except GitOperationError as e:
+                self.logger.error(f"Failed to clone {repository.name}: {e}")
+                raise
+            self.logger.info(f"Successfully cloned {repository.name}")
+            self._record_clone(repository)
+            return
+
+        repo_path = self._pull_path(repository)
+        if self.use_libgit2:
+            # In-process, but a large working tree's status walk would still stall the loop
+            state = await asyncio.to_thread(self.get_status, repo_path)
+        else:
+            result = await run(
+                ["git", "status", "--branch", "--porcelain=v2"], cwd=repo_path, timeout=10
+            )
+            state = self._parse_status(result.stdout)
+        commands = self._pull_commands(repository, state)
+        try:
+            for command, timeout in commands:
+                await run(command, cwd=repo_path, timeout=timeout, env=self.get_ssh_env())
+        except GitOperationError as e:
+            self.logger.error(f"Failed to pull {repository.name}: {e}")
+            raise
+        if commands:
+            self.logger.info(f"Successfully pulled {repository.name}")
+
+    async def aclone_or_pull_batch(
+        self,
+        repositories: Sequence[Repository],
+        use_ssh: bool = False,
+        concurrency: int = 32,
+    ) -> List[Tuple[str, Exception]]:
+        """
+        Clone or pull several repositories concurrently on one event loop.
+
+        Unlike clone_or_pull_batch no worker thread is held per repository, so the
+        limit can be much higher than the CPU count.
+
+        Args:
+            repositories: Repositories to process
+            use_ssh: Whether to use SSH URLs
+            concurrency: Maximum number of repositories in flight
+
+        Returns:
+            (repository name, error) for every repository that failed
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def process(repository: Repository) -> None:
+            async with semaphore:
+                await self.aclone_or_pull(repository, use_ssh)
+
+        with self.existence_cache():
+            results = await asyncio.gather(
+                *(process(repository) for repository in repositories), return_exceptions=True
+            )
+
+        failures: List[Tuple[str, Exception]] = []
+        for repository, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to process {repository.name}: {result}")
+                failures.append((repository.name, result))
+        return failures
+
+    def fetch_all(
+        self, repositories: Sequence[Repository], jobs: int = 8
+    ) -> List[Tuple[str, Exception]]:
+        """
+        Fetch every remote of the locally present repositories, several at a time.
+
+        Up to ``jobs`` repositories are fetched concurrently, and each runs
+        ``git fetch --all --jobs=<jobs>`` so repositories with several remotes
+        fetch them in parallel too. Working trees are not touched.
+
+        Args:
+            repositories: Repositories to fetch (missing ones are skipped)
+            jobs: Maximum number of concurrent fetches
+
+        Returns:
+            (repository name, error) for every repository that failed
+        """
+        jobs = max(1, jobs)
+        command = ["git", "fetch", "--all", f"--jobs={jobs}"]
+
+        def fetch(repository: Repository) -> None:
+            self.subprocess_runner.run_git_command(
+                command, cwd=repository.local_path, timeout=120, env=self.get_ssh_env()
+            )
+
+        with self.existence_cache():
+            present = [
+                repository for repository in repositories if self.repository_exists(repository)
+            ]
+        return self._run_concurrently(present, fetch, jobs)
+
+    def _run_concurrently(
+        self,
+        repositories: Sequence[Repository],
+        operation: Callable[[Repository], None],
+        max_workers: int,
+    ) -> List[Tuple[str, Exception]]:
+        """Run operation on each repository in a thread pool, collecting failures."""
+        failures: List[Tuple[str, Exception]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(operation, repository): repository for repository in repositories
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    repository = futures[future]
+                    self.logger.error(f"Failed to process {repository.name}: {e}")
+                    failures.append((repository.name, e))
+
+        return failures
+
     def clear_cached_credentials(self) -> None:
         """Clear any cached interactive credentials."""
         self.credential_manager.clear_credentials()
@@ -1,14 +1,20 @@
 """GitHub API service with enhanced error handling and security."""
 
 import logging
+import re
+import threading
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 
 from ..exceptions import AuthenticationError, GitHubAPIError
 from ..security import SafeSubprocessRunner
 
+# Page number of the rel="last" URL in a GitHub Link header
+_LAST_PAGE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
 
 class GitHubService:
     """
@@ -21,6 +27,8 @@ class GitHubService:
         subprocess_runner: SafeSubprocessRunner,
         max_retries: int = 3,
         backoff: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep,
+        session_factory: Callable[[], requests.Session] = requests.Session,
     ):
         """
         Initialize the GitHub API service.
@@ -30,22 +38,40 @@ class GitHubService:
             subprocess_runner: Safe subprocess runner instance
             max_retries: Number of retries for failed requests
             backoff: Backoff time (seconds) for retries
+            sleep: Function used to wait between retries and on rate limits
+            session_factory: Creates the HTTP session of each thread
         """
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github+json",
-                "User-Agent": "git-batch-pull/1.0.0",
-            }
-        )
+        self._headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "git-batch-pull/1.0.0",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        self._session_factory = session_factory
+        self._local = threading.local()
 
         self.api_url = "https://api.github.com"
         self.max_retries = max_retries
         self.backoff = backoff
+        self._sleep = sleep
+        # Pages fetched at once after the first
+        self.max_page_workers = 8
         self.subprocess_runner = subprocess_runner
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the calling thread's HTTP session, creating it on first use.
+
+        requests.Session is not thread-safe, so each page worker keeps its own.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._session_factory()
+            session.headers.update(self._headers)
+        return session
+
     def get_repositories(
         self, entity_type: str, entity_name: str, repo_visibility: str = "all"
     ) -> List[Dict]:
@@ -77,73 +103,115 @@ class GitHubService:
         else:
             raise ValueError(f"Invalid entity_type: {entity_type}. Must be 'user' or 'org'")
 
-        repositories: List[Dict] = []
-        page = 1
-
-        while True:
-            current_params = {"per_page": 100, "page": page, **params}
+        # Page 1 says how many pages there are (Link rel="last"); the rest are
+        # independent requests, so they are fetched concurrently
+        data, last_page = self._fetch_page(url, params, 1, entity_name)
+        repositories = data or []
+        skipped_pages = [] if data is not None else [1]
+        if last_page is not None and last_page > 1:
+            pages = range(2, last_page + 1)
+            workers = min(self.max_page_workers, len(pages))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page, (data, _) in zip(
+                    pages,
+                    executor.map(
+                        lambda page: self._fetch_page(url, params, page, entity_name), pages
+                    ),
+                ):
+                    if data is None:
+                        skipped_pages.append(page)
+                    repositories.extend(data or [])
+        else:
+            # No Link header: walk the pages until an empty one (a skipped page isn't)
+            page = 1
+            while data is None or data:
+                page += 1
+                data, _ = self._fetch_page(url, params, page, entity_name)
+                if data is None:
+                    skipped_pages.append(page)
+                repositories.extend(data or [])
+
+        if skipped_pages:
+            self.logger.warning(
+                f"Repository list for {entity_name} is incomplete, up to "
+                f"{100 * len(skipped_pages)} repositories missing; rate limited pages "
+                f"skipped: {', '.join(map(str, skipped_pages))}"
+            )
+        self.logger.debug(f"Fetched {len(repositories)} repositories total")
+        return repositories
+
+    def _fetch_page(
+        self, url: str, params: Dict, page: int, entity_name: str
+    ) -> Tuple[Optional[List[Dict]], Optional[int]]:
+        """
+        Fetch one page of repositories, retrying on timeouts and rate limits.
 
-            for attempt in range(self.max_retries):
-                try:
-                    self.logger.debug(f"API request: {url} (page {page}, attempt {attempt + 1})")
+        Returns:
+            (repositories on the page, last page number from the Link header or None);
+            the repositories are None if the page was skipped because the rate limit
+            was still exhausted after max_retries waits
 
-                    response = self.session.get(url, params=current_params, timeout=30)
+        Raises:
+            GitHubAPIError: On API failure
+            AuthenticationError: On authentication issues
+        """
+        current_params = {"per_page": 100, "page": page, **params}
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        if not data:  # No more pages
-                            self.logger.debug(f"Fetched {len(repositories)} repositories total")
-                            return repositories
+        for attempt in range(self.max_retries):
+            try:
+                self.logger.debug(f"API request: {url} (page {page}, attempt {attempt + 1})")
 
-                        repositories.extend(data)
-                        self.logger.debug(f"Page {page}: received {len(data)} repositories")
-                        break  # Success, continue to next page
+                response = self.session.get(url, params=current_params, timeout=30)
 
-                    elif response.status_code == 401:
-                        raise AuthenticationError(
-                            "Invalid GitHub token or insufficient permissions"
-                        )
+                if response.status_code == 200:
+                    data = response.json()
+                    self.logger.debug(f"Page {page}: received {len(data)} repositories")
+                    return data, self._get_last_page(response)
 
-                    elif response.status_code == 403:
-                        if self._is_rate_limited(response):
-                            wait_time = self._get_rate_limit_wait_time(response)
-                            self.logger.warning(f"Rate limit exceeded, waiting {wait_time} seconds")
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            raise GitHubAPIError(
-                                "Access forbidden - check token permissions",
-                                status_code=403,
-                                response_text=response.text,
-                            )
-
-                    elif response.status_code == 404:
-                        raise GitHubAPIError(
-                            f"Entity '{entity_name}' not found or not accessible", status_code=404
-                        )
+                elif response.status_code == 401:
+                    raise AuthenticationError("Invalid GitHub token or insufficient permissions")
 
+                elif response.status_code == 403:
+                    if self._is_rate_limited(response):
+                        wait_time = self._get_rate_limit_wait_time(response)
+                        self.logger.warning(f"Rate limit exceeded, waiting {wait_time} seconds")
+                        self._sleep(wait_time)
+                        continue
                     else:
                         raise GitHubAPIError(
-                            f"GitHub API error: HTTP {response.status_code}",
-                            status_code=response.status_code,
+                            "Access forbidden - check token permissions",
+                            status_code=403,
                             response_text=response.text,
                         )
 
-                except requests.exceptions.Timeout:
-                    self.logger.warning(f"Request timeout (attempt {attempt + 1})")
-                    if attempt == self.max_retries - 1:
-                        raise GitHubAPIError("Request timeout after maximum retries")
-                    time.sleep(self.backoff)
-
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                    if attempt == self.max_retries - 1:
-                        raise GitHubAPIError(
-                            f"Request failed after {self.max_retries} attempts: {e}"
-                        )
-                    time.sleep(self.backoff)
-
-            page += 1
+                elif response.status_code == 404:
+                    raise GitHubAPIError(
+                        f"Entity '{entity_name}' not found or not accessible", status_code=404
+                    )
+
+                else:
+                    raise GitHubAPIError(
+                        f"GitHub API error: HTTP {response.status_code}",
+                        status_code=response.status_code,
+                        response_text=response.text,
+                    )
+
+            except requests.exceptions.Timeout:
+                self.logger.warning(f"Request timeout (attempt {attempt + 1})")
+                if attempt == self.max_retries - 1:
+                    raise GitHubAPIError("Request timeout after maximum retries")
+                self._sleep(self.backoff)
+
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+                if attempt == self.max_retries - 1:
+                    raise GitHubAPIError(f"Request failed after {self.max_retries} attempts: {e}")
+                self._sleep(self.backoff)
+
+        self.logger.warning(
+            f"Rate limit still exceeded after {self.max_retries} attempts, skipping page {page}"
+        )
+        return None, None
 
     def test_authentication(self) -> bool:
         """
@@ -158,6 +226,12 @@ class GitHubService:
         except Exception:
             return False
 
+    @staticmethod
+    def _get_last_page(response: requests.Response) -> Optional[int]:
+        """Get the last page number from the response's Link header, if it has one."""
+        match = _LAST_PAGE.search(response.headers.get("Link", ""))
+        return int(match.group(1)) if match else None
+
     def _is_rate_limited(self, response: requests.Response) -> bool:
         """Check if response indicates rate limiting."""
         return (
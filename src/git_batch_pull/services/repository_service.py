@@ -101,20 +101,26 @@ class RepositoryService:
         else:
             repositories = batch_or_repositories
 
-        for repository in repositories:
-            if not repository.exists_locally:
+        existing, _ = self.git_service.filter_existing(repositories)
+        current_urls = self.git_service.get_remote_urls(
+            [repository.local_path for repository in existing]
+        )
+        for repository, current_url in zip(existing, current_urls):
+            if current_url is None:
+                # No origin remote, so nothing to switch
                 continue
-
-            current_protocol = self.git_service.detect_protocol(repository.local_path)
+            current_protocol = self.git_service.protocol_from_url(current_url)
             if current_protocol and current_protocol != intended_protocol:
-                current_url = self.git_service.get_remote_url(repository.local_path)
-                if current_url:
-                    mismatches.append((repository.name, current_url))
+                mismatches.append((repository.name, current_url))
 
         return mismatches
 
     def fix_protocol_mismatches(
-        self, batch: RepositoryBatch, intended_protocol: str, entity_name: str
+        self,
+        batch: RepositoryBatch,
+        intended_protocol: str,
+        entity_name: str,
+        mismatches: Optional[List[tuple[str, str]]] = None,
     ) -> None:
         """
         Fix protocol mismatches by updating remote URLs.
@@ -123,12 +129,15 @@ class RepositoryService:
             batch: Repository batch to fix
             intended_protocol: Intended protocol ('ssh' or 'https')
             entity_name: GitHub entity name
+            mismatches: Result of detect_protocol_mismatches for this batch, if the
+                caller already has it (detected again otherwise)
         """
-        mismatches = self.detect_protocol_mismatches(batch, intended_protocol)
+        if mismatches is None:
+            mismatches = self.detect_protocol_mismatches(batch, intended_protocol)
 
+        repositories_by_name = {repository.name: repository for repository in batch.repositories}
         for repo_name, current_url in mismatches:
-            # Find the repository in the batch
-            repository = next((r for r in batch.repositories if r.name == repo_name), None)
+            repository = repositories_by_name.get(repo_name)
             if repository:
                 # Get the new URL based on intended protocol
                 new_url = repository.get_clone_url(use_ssh=(intended_protocol == "ssh"))
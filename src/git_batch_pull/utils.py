@@ -1,11 +1,19 @@
 """Utility functions for git-batch-pull - enhanced version."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from colorama import Fore, Style
 
+# Characters unsafe in file names on some platforms, each replaced by "_"
+_UNSAFE_CHARS = '<>:"/\\|?*'
+_UNSAFE_CHARS_SET = frozenset(_UNSAFE_CHARS)
+_UNSAFE_CHARS_TABLE = str.maketrans(_UNSAFE_CHARS, "_" * len(_UNSAFE_CHARS))
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def write_error_log(error_log_path: Optional[str], error_log_lines: List[str]) -> None:
     """
@@ -51,9 +59,11 @@ def print_summary(processed: int, failed: int, quiet: bool = False) -> None:
         print(f"{Fore.YELLOW}Success rate: {success_rate:.1f}%{Style.RESET_ALL}")
 
 
+# Repository names recur across path building, logging and existence checks
+@lru_cache(maxsize=2048)
 def sanitize_filename(filename: str) -> str:
     """
-    Sanitize a filename to be safe for use in file system.
+    Sanitize a filename to be safe for use in file system (results are cached).
 
     Args:
         filename: Original filename
@@ -61,15 +71,11 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace unsafe characters
-    unsafe_chars = ["<", ">", ":", '"', "/", "\\", "|", "?", "*"]
-    sanitized = filename
-
-    for char in unsafe_chars:
-        sanitized = sanitized.replace(char, "_")
-
-    # Remove leading/trailing dots and spaces
-    sanitized = sanitized.strip(". ")
+    # Replace unsafe characters in one pass (skipped for the usual clean name, which
+    # translate would copy anyway), then remove leading/trailing dots and spaces
+    if not _UNSAFE_CHARS_SET.isdisjoint(filename):
+        filename = filename.translate(_UNSAFE_CHARS_TABLE)
+    sanitized = filename.strip(". ")
 
     # Ensure it's not empty
     if not sanitized:
@@ -111,12 +117,9 @@ def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size_value: float = size_bytes
-
-    while size_value >= 1024 and i < len(size_names) - 1:
-        size_value /= 1024.0
-        i += 1
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit = 0
+    if size_bytes >= 1024:
+        unit = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-    return f"{size_value:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
@@ -1,17 +1,135 @@
 """
 Pytest configuration and fixtures for git-batch-pull tests.
-Automatically patches time.sleep to speed up tests.
+Tests marked ``no_sleep`` get time.sleep replaced with a no-op.
+Scratch directories, tmp_path included, live in RAM (/dev/shm) where the platform has it.
+Git repositories are copied from a template written once per session.
 """
 
-from unittest.mock import patch
+import os
+import shutil
+import tempfile
+from pathlib import Path
 
 import pytest
 
+_SHM = Path("/dev/shm")
+_USE_SHM = _SHM.is_dir() and os.access(_SHM, os.W_OK)
+
+# basetemp this process created on tmpfs, removed again at unconfigure
+_shm_basetemp = None
+
+
+def pytest_configure(config):
+    """
+    Put pytest's own tmp_path directories on tmpfs as well, unless --basetemp is given.
+
+    xdist workers inherit a subdirectory of the controller's basetemp.
+    """
+    global _shm_basetemp
+    if _USE_SHM and config.option.basetemp is None:
+        _shm_basetemp = tempfile.mkdtemp(prefix=f"pytest-{os.getpid()}-", dir=_SHM)
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure(config):
+    """
+    Remove the tmpfs basetemp, so test runs don't accumulate in RAM.
+    """
+    if _shm_basetemp is not None:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+
+
+def _no_sleep(*args, **kwargs):
+    return None
+
+
+@pytest.fixture
+def patch_sleep(monkeypatch):
+    """
+    Replace time.sleep with a no-op for the duration of a test.
+    """
+    monkeypatch.setattr("time.sleep", _no_sleep)
+
 
 @pytest.fixture(autouse=True)
-def patch_sleep():
+def _apply_no_sleep_marker(request):
     """
-    Automatically patch time.sleep to a no-op for all tests.
+    Apply patch_sleep only to tests carrying the no_sleep marker.
     """
-    with patch("time.sleep", return_value=None):
-        yield
+    if request.node.get_closest_marker("no_sleep") is not None:
+        request.getfixturevalue("patch_sleep")
+
+
+@pytest.fixture(scope="session")
+def tmpfs_root():
+    """
+    One scratch directory per test session (and xdist worker), on tmpfs if available.
+    """
+    parent = _SHM if _USE_SHM else None
+    root = Path(tempfile.mkdtemp(prefix=f"gbp-{os.getpid()}-", dir=parent))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def base_folder(tmpfs_root):
+    """
+    An empty directory for a single test, under tmpfs_root.
+    """
+    return Path(tempfile.mkdtemp(dir=tmpfs_root))
+
+
+@pytest.fixture(scope="session")
+def git_template(tmpfs_root):
+    """
+    An empty git repository, written once per session, for make_git_repo to copy.
+
+    Only what git needs to recognise the directory (HEAD, objects/, refs/ and a
+    config) is written, without running git init.
+    """
+    git_dir = tmpfs_root / "git-template" / ".git"
+    (git_dir / "objects").mkdir(parents=True)
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "config").write_text(
+        "[core]\n\trepositoryformatversion = 0\n\tbare = false\n", encoding="utf-8"
+    )
+    return git_dir.parent
+
+
+def _copy_git_repo(template, repo_dir, remote_url=None):
+    shutil.copytree(template, repo_dir)
+    if remote_url is not None:
+        # What ``git remote add origin`` writes
+        with open(repo_dir / ".git" / "config", "a", encoding="utf-8") as config:
+            config.write(
+                f'[remote "origin"]\n\turl = {remote_url}\n'
+                "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+            )
+    return repo_dir
+
+
+@pytest.fixture
+def make_git_repo(git_template):
+    """
+    Create a git repository at a path, with an optional origin URL, without running git.
+    """
+    return lambda repo_dir, remote_url=None: _copy_git_repo(git_template, repo_dir, remote_url)
+
+
+@pytest.fixture(scope="session")
+def shared_git_repo(git_template, tmpfs_root):
+    """
+    Get a session-wide git repository for an origin URL (or none), built on first use.
+
+    Tests that change the repository must use make_git_repo instead.
+    """
+    repos = {}
+
+    def get(remote_url=None):
+        if remote_url not in repos:
+            repo_dir = Path(tempfile.mkdtemp(dir=tmpfs_root)) / "repo"
+            repos[remote_url] = _copy_git_repo(git_template, repo_dir, remote_url)
+        return repos[remote_url]
+
+    return get
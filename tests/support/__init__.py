@@ -0,0 +1 @@
+"""Shared test doubles for the git-batch-pull test suite."""
@@ -0,0 +1,99 @@
+"""
+Hand-written fakes for the git-batch-pull test suite.
+
+They are much cheaper to build than spec'd MagicMocks and record calls as plain
+values, so tests can compare them with ``==``.
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+# A canned result: stdout text, an exception to raise, or a ready-made result object
+Result = Union[str, BaseException, subprocess.CompletedProcess]
+
+
+class GitCall(NamedTuple):
+    """One recorded git invocation."""
+
+    command: List[str]
+    cwd: Union[str, Path]
+    timeout: Optional[int] = None
+    env: Optional[Mapping[str, str]] = None
+
+
+class FakeSubprocessRunner:
+    """
+    Stand-in for SafeSubprocessRunner that records git calls and replays results.
+
+    ``results`` is either a sequence consumed one result per call (an empty, clean
+    result once exhausted) or a callable mapping each command to its result.
+    """
+
+    def __init__(self, results: Union[Iterable[Result], Callable[[List[str]], Result]] = ()):
+        self.calls: List[GitCall] = []
+        self._lock = threading.Lock()
+        self.set_results(results)
+
+    def set_results(self, results: Union[Iterable[Result], Callable[[List[str]], Result]]) -> None:
+        """Replace the results returned by the following calls."""
+        if callable(results):
+            self._respond = results
+        else:
+            pending = iter(results)
+            self._respond = lambda command: next(pending, "")
+
+    @property
+    def commands(self) -> List[List[str]]:
+        """The argv of every recorded call, in order."""
+        return [call.command for call in self.calls]
+
+    def run_git_command(
+        self,
+        command: List[str],
+        cwd: Union[str, Path],
+        timeout: Optional[int] = None,
+        capture_output: bool = True,
+        check: bool = True,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        # Record and respond together, so a callable result may read calls[-1]
+        # even when GitService runs commands on several threads
+        with self._lock:
+            self.calls.append(GitCall(command, cwd, timeout, env))
+            result = self._respond(command)
+        if isinstance(result, BaseException):
+            raise result
+        if isinstance(result, str):
+            return subprocess.CompletedProcess(command, 0, stdout=result, stderr="")
+        return result
+
+    async def arun_git_command(
+        self,
+        command: List[str],
+        cwd: Union[str, Path],
+        timeout: Optional[int] = None,
+        capture_output: bool = True,
+        check: bool = True,
+        env: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        return self.run_git_command(command, cwd, timeout, capture_output, check, env)
+
+
+class FakeGitHubService:
+    """
+    Stand-in for GitHubService that serves a fixed repository list.
+
+    ``requests`` records the (entity_type, entity_name, repo_visibility) of every listing.
+    """
+
+    def __init__(self, repositories: Iterable[Mapping[str, Any]] = ()):
+        self.repositories = list(repositories)
+        self.requests: List[tuple] = []
+
+    def get_repositories(
+        self, entity_type: str, entity_name: str, repo_visibility: str = "all"
+    ) -> List[Mapping[str, Any]]:
+        self.requests.append((entity_type, entity_name, repo_visibility))
+        return list(self.repositories)
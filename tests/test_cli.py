@@ -3,26 +3,26 @@ Integration tests for the git-batch-pull CLI interface.
 Covers help and version output for CLI entry point.
 """
 
-import subprocess
-from pathlib import Path
+from typer.testing import CliRunner
 
-# Use the installed CLI command
-CLI_COMMAND = str(Path(__file__).parent.parent / ".venv" / "bin" / "git-batch-pull")
+from git_batch_pull.cli import app
+
+runner = CliRunner()
 
 
 def test_cli_help():
     """
     Test that the CLI help command runs successfully and displays usage info.
     """
-    result = subprocess.run([CLI_COMMAND, "--help"], capture_output=True, text=True)
-    assert result.returncode == 0
-    assert "usage" in result.stdout.lower() or "commands" in result.stdout.lower()
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "usage" in result.output.lower() or "commands" in result.output.lower()
 
 
 def test_cli_version():
     """
     Test that the CLI version command runs successfully and displays version info.
     """
-    result = subprocess.run([CLI_COMMAND, "sync", "--version"], capture_output=True, text=True)
-    assert result.returncode == 0
-    assert "git-batch-pull" in result.stdout.lower()
+    result = runner.invoke(app, ["sync", "--version"])
+    assert result.exit_code == 0
+    assert "git-batch-pull" in result.output.lower()
@@ -3,9 +3,10 @@ Tests for clone vs pull behavior in the sync command.
 Tests that the same command (sync) intelligently clones or pulls based on repository state.
 """
 
-import tempfile
+from collections import defaultdict
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import create_autospec
 
 import pytest
 
@@ -17,17 +18,56 @@ from git_batch_pull.services.github_service import GitHubService
 from git_batch_pull.services.repository_service import RepositoryService
 
 
+def make_info(name: str, branch: str = "main") -> RepositoryInfo:
+    """Build the RepositoryInfo of a user/<name> repository."""
+    return RepositoryInfo(
+        name=name,
+        clone_url=f"https://github.com/user/{name}.git",
+        ssh_url=f"git@github.com:user/{name}.git",
+        default_branch=branch,
+        private=False,
+        fork=False,
+        archived=False,
+    )
+
+
+def status_result(*entries: str, oid: str = "abc123") -> SimpleNamespace:
+    """Build the result of ``git status --branch --porcelain=v2`` for HEAD ``oid``."""
+    stdout = "".join(f"{line}\n" for line in (f"# branch.oid {oid}", *entries))
+    return SimpleNamespace(stdout=stdout, stderr="", returncode=0)
+
+
+def assert_git_calls(run_git_command, **expected):
+    """
+    Assert how many times each git subcommand was run, e.g. ``clone=1, pull=0``.
+
+    Recorded calls are grouped by subcommand in a single pass; the groups are
+    returned so callers can inspect the individual commands.
+    """
+    by_subcommand = defaultdict(list)
+    for call in run_git_command.call_args_list:
+        by_subcommand[call[0][0][1]].append(call)
+
+    for subcommand, count in expected.items():
+        assert len(by_subcommand[subcommand]) == count, subcommand
+    return by_subcommand
+
+
+def make_fake_repo(path: Path) -> None:
+    """Create ``path`` with an empty .git directory so it looks like an existing clone."""
+    (path / ".git").mkdir(parents=True, exist_ok=True)
+
+
 @pytest.fixture
-def temp_base_folder():
-    """Create a temporary directory for test repositories."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_base_folder(fs):
+    """Create an in-memory base directory (pyfakefs) for test repositories."""
+    return Path(fs.create_dir("/fake/base").path)
 
 
 @pytest.fixture
 def mock_subprocess_runner():
     """Mock SafeSubprocessRunner for testing."""
-    return MagicMock(spec=SafeSubprocessRunner)
+    return create_autospec(SafeSubprocessRunner, instance=True)
 
 
 @pytest.fixture
@@ -39,7 +79,7 @@ def path_validator():
 @pytest.fixture
 def mock_github_service():
     """Mock GitHubService for testing."""
-    return MagicMock(spec=GitHubService)
+    return create_autospec(GitHubService, instance=True)
 
 
 @pytest.fixture
@@ -64,15 +104,7 @@ def batch_processor(git_service):
 @pytest.fixture
 def sample_repository_info():
     """Sample repository info for testing."""
-    return RepositoryInfo(
-        name="test-repo",
-        clone_url="https://github.com/user/test-repo.git",
-        ssh_url="git@github.com:user/test-repo.git",
-        default_branch="main",
-        private=False,
-        fork=False,
-        archived=False,
-    )
+    return make_info("test-repo")
 
 
 @pytest.fixture
@@ -95,12 +127,10 @@ class TestCloneVsPullBehavior:
         batch_processor.process_repositories([sample_repository], use_ssh=False, dry_run=False)
 
         # Should call git clone
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        clone_calls = [call for call in calls if call[0][0][0:2] == ["git", "clone"]]
-        assert len(clone_calls) == 1
+        by_subcommand = assert_git_calls(mock_subprocess_runner.run_git_command, clone=1)
 
         # Verify clone command
-        clone_call = clone_calls[0]
+        clone_call = by_subcommand["clone"][0]
         assert clone_call[0][0] == [
             "git",
             "clone",
@@ -119,12 +149,10 @@ class TestCloneVsPullBehavior:
         batch_processor.process_repositories([sample_repository], use_ssh=True, dry_run=False)
 
         # Should call git clone with SSH URL
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        clone_calls = [call for call in calls if call[0][0][0:2] == ["git", "clone"]]
-        assert len(clone_calls) == 1
+        by_subcommand = assert_git_calls(mock_subprocess_runner.run_git_command, clone=1)
 
         # Verify clone command uses SSH URL
-        clone_call = clone_calls[0]
+        clone_call = by_subcommand["clone"][0]
         assert clone_call[0][0] == [
             "git",
             "clone",
@@ -137,37 +165,23 @@ class TestCloneVsPullBehavior:
     ):
         """Test that sync pulls when repository exists and is clean."""
         # Create repository directory to simulate it exists
-        sample_repository.local_path.mkdir(parents=True)
-        (sample_repository.local_path / ".git").mkdir()  # Create .git directory
+        make_fake_repo(sample_repository.local_path)
 
         # Mock repository is not empty and has no uncommitted changes
-        mock_result_head = MagicMock()
-        mock_result_head.stdout = "abc123\n"
-        mock_result_status = MagicMock()
-        mock_result_status.stdout = ""
-
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result_head,  # git rev-parse (not empty)
-            mock_result_status,  # git status (clean)
-            MagicMock(),  # git checkout
-            MagicMock(),  # git pull
-        ]
+        mock_result_status = status_result()
+
+        mock_subprocess_runner.run_git_command.return_value = mock_result_status
 
         # Process the repository
         batch_processor.process_repositories([sample_repository], use_ssh=False, dry_run=False)
 
         # Should call git pull operations, not clone
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        clone_calls = [call for call in calls if call[0][0][0:2] == ["git", "clone"]]
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-        checkout_calls = [call for call in calls if call[0][0][0:2] == ["git", "checkout"]]
-
-        assert len(clone_calls) == 0  # No clone
-        assert len(pull_calls) == 1  # One pull
-        assert len(checkout_calls) == 1  # One checkout
+        by_subcommand = assert_git_calls(
+            mock_subprocess_runner.run_git_command, clone=0, pull=1, checkout=1
+        )
 
         # Verify pull command
-        pull_call = pull_calls[0]
+        pull_call = by_subcommand["pull"][0]
         assert pull_call[0][0] == ["git", "pull", "origin", "main"]
 
     def test_sync_skips_pull_when_repository_has_uncommitted_changes(
@@ -175,119 +189,62 @@ class TestCloneVsPullBehavior:
     ):
         """Test that sync skips pull when repository exists but has uncommitted changes."""
         # Create repository directory to simulate it exists
-        sample_repository.local_path.mkdir(parents=True)
-        (sample_repository.local_path / ".git").mkdir()  # Create .git directory
+        make_fake_repo(sample_repository.local_path)
 
         # Mock repository is not empty but has uncommitted changes
-        mock_result_head = MagicMock()
-        mock_result_head.stdout = "abc123\n"
-        mock_result_status = MagicMock()
-        mock_result_status.stdout = "M  file.txt\n"
-
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result_head,  # git rev-parse (not empty)
-            mock_result_status,  # git status (dirty)
-        ]
+        mock_result_status = status_result("1 M. N... 100644 100644 100644 a1 a1 file.txt")
+
+        mock_subprocess_runner.run_git_command.return_value = mock_result_status
 
         # Process the repository
         batch_processor.process_repositories([sample_repository], use_ssh=False, dry_run=False)
 
         # Should not call git pull or checkout due to uncommitted changes
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-        checkout_calls = [call for call in calls if call[0][0][0:2] == ["git", "checkout"]]
-
-        assert len(pull_calls) == 0  # No pull
-        assert len(checkout_calls) == 0  # No checkout
-        assert len(calls) == 2  # Only rev-parse and status
+        assert_git_calls(mock_subprocess_runner.run_git_command, pull=0, checkout=0)
+        assert mock_subprocess_runner.run_git_command.call_count == 1  # Only status
 
     def test_sync_skips_pull_when_repository_is_empty(
         self, batch_processor, sample_repository, mock_subprocess_runner
     ):
         """Test that sync skips pull when repository exists but is empty."""
         # Create repository directory to simulate it exists
-        sample_repository.local_path.mkdir(parents=True)
-        (sample_repository.local_path / ".git").mkdir()  # Create .git directory
+        make_fake_repo(sample_repository.local_path)
 
         # Mock repository is empty (no HEAD)
-        mock_subprocess_runner.run_git_command.side_effect = [
-            Exception("No HEAD")  # git rev-parse fails
-        ]
+        mock_subprocess_runner.run_git_command.return_value = status_result(oid="(initial)")
 
         # Process the repository
         batch_processor.process_repositories([sample_repository], use_ssh=False, dry_run=False)
 
         # Should not call git pull or checkout for empty repository
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-        checkout_calls = [call for call in calls if call[0][0][0:2] == ["git", "checkout"]]
-
-        assert len(pull_calls) == 0  # No pull
-        assert len(checkout_calls) == 0  # No checkout
-        assert len(calls) == 1  # Only rev-parse
+        assert_git_calls(mock_subprocess_runner.run_git_command, pull=0, checkout=0)
+        assert mock_subprocess_runner.run_git_command.call_count == 1  # Only status
 
     def test_sync_mixed_repositories_clone_and_pull(
         self, batch_processor, temp_base_folder, mock_subprocess_runner
     ):
         """Test sync with mixed repositories - some to clone, some to pull."""
         # Create multiple repositories
-        repo1_info = RepositoryInfo(
-            name="new-repo",
-            clone_url="https://github.com/user/new-repo.git",
-            ssh_url="git@github.com:user/new-repo.git",
-            default_branch="main",
-            private=False,
-            fork=False,
-            archived=False,
-        )
+        repo1_info = make_info("new-repo")
         repo1 = Repository(info=repo1_info, local_path=temp_base_folder / "new-repo")
 
-        repo2_info = RepositoryInfo(
-            name="existing-repo",
-            clone_url="https://github.com/user/existing-repo.git",
-            ssh_url="git@github.com:user/existing-repo.git",
-            default_branch="main",
-            private=False,
-            fork=False,
-            archived=False,
-        )
+        repo2_info = make_info("existing-repo")
         repo2 = Repository(info=repo2_info, local_path=temp_base_folder / "existing-repo")
 
         # Create existing repository directory
-        repo2.local_path.mkdir(parents=True)
-        (repo2.local_path / ".git").mkdir()  # Create .git directory
-
-        # Mock responses for existing repository
-        def mock_git_command(command, **kwargs):
-            if kwargs.get("cwd") == repo2.local_path:
-                if command[0:2] == ["git", "rev-parse"]:
-                    mock_result = MagicMock()
-                    mock_result.stdout = "abc123\n"
-                    return mock_result
-                elif command[0:2] == ["git", "status"]:
-                    mock_result = MagicMock()
-                    mock_result.stdout = ""
-                    return mock_result
-                else:
-                    return MagicMock()
-            else:
-                return MagicMock()
-
-        mock_subprocess_runner.run_git_command.side_effect = mock_git_command
+        make_fake_repo(repo2.local_path)
 
-        # Process both repositories
-        batch_processor.process_repositories([repo1, repo2], use_ssh=False, dry_run=False)
+        # Mock responses for existing repository (the new one is only cloned)
+        mock_result_status = status_result()
 
-        calls = mock_subprocess_runner.run_git_command.call_args_list
+        mock_subprocess_runner.run_git_command.return_value = mock_result_status
 
-        # Should have clone calls for new repository
-        clone_calls = [call for call in calls if call[0][0][0:2] == ["git", "clone"]]
-        assert len(clone_calls) == 1
-        assert "new-repo" in str(clone_calls[0][0][0])
+        # Process both repositories
+        batch_processor.process_repositories([repo1, repo2], use_ssh=False, dry_run=False)
 
-        # Should have pull calls for existing repository
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-        assert len(pull_calls) == 1
+        # Should clone the new repository and pull the existing one
+        by_subcommand = assert_git_calls(mock_subprocess_runner.run_git_command, clone=1, pull=1)
+        assert "new-repo" in str(by_subcommand["clone"][0][0][0])
 
     def test_sync_dry_run_shows_intended_actions(
         self, batch_processor, sample_repository, mock_subprocess_runner
@@ -308,33 +265,18 @@ class TestCloneVsPullBehavior:
     ):
         """Test that sync pulls existing repositories regardless of SSH preference."""
         # Create repository directory to simulate it exists
-        sample_repository.local_path.mkdir(parents=True)
-        (sample_repository.local_path / ".git").mkdir()  # Create .git directory
+        make_fake_repo(sample_repository.local_path)
 
         # Mock repository is not empty, clean
-        mock_result_head = MagicMock()
-        mock_result_head.stdout = "abc123\n"
-        mock_result_status = MagicMock()
-        mock_result_status.stdout = ""
-
-        def mock_git_command(command, **kwargs):
-            if command[0:2] == ["git", "rev-parse"]:
-                return mock_result_head
-            elif command[0:2] == ["git", "status"]:
-                return mock_result_status
-            else:
-                return MagicMock()
+        mock_result_status = status_result()
 
-        mock_subprocess_runner.run_git_command.side_effect = mock_git_command
+        mock_subprocess_runner.run_git_command.return_value = mock_result_status
 
         # Process the repository with SSH preference (should still pull)
         batch_processor.process_repositories([sample_repository], use_ssh=True, dry_run=False)
 
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-
         # Should pull the existing repository
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-        assert len(pull_calls) == 1
+        assert_git_calls(mock_subprocess_runner.run_git_command, pull=1)
 
     def test_sync_handles_git_errors_gracefully(
         self, batch_processor, sample_repository, mock_subprocess_runner
@@ -361,45 +303,21 @@ class TestCloneVsPullBehavior:
     ):
         """Test sync with repositories having different default branches."""
         # Create repository with non-main default branch
-        repo_info = RepositoryInfo(
-            name="develop-repo",
-            clone_url="https://github.com/user/develop-repo.git",
-            ssh_url="git@github.com:user/develop-repo.git",
-            default_branch="develop",  # Not main
-            private=False,
-            fork=False,
-            archived=False,
-        )
+        repo_info = make_info("develop-repo", "develop")  # Not main
         repo = Repository(info=repo_info, local_path=temp_base_folder / "develop-repo")
 
         # Create repository directory to simulate it exists
-        repo.local_path.mkdir(parents=True)
-        (repo.local_path / ".git").mkdir()  # Create .git directory
+        make_fake_repo(repo.local_path)
 
         # Mock repository is not empty and clean
-        mock_result_head = MagicMock()
-        mock_result_head.stdout = "abc123\n"
-        mock_result_status = MagicMock()
-        mock_result_status.stdout = ""
-
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result_head,  # git rev-parse
-            mock_result_status,  # git status
-            MagicMock(),  # git checkout
-            MagicMock(),  # git pull
-        ]
+        mock_result_status = status_result()
+
+        mock_subprocess_runner.run_git_command.return_value = mock_result_status
 
         # Process the repository
         batch_processor.process_repositories([repo], use_ssh=False, dry_run=False)
 
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-
         # Should checkout and pull from develop branch
-        checkout_calls = [call for call in calls if call[0][0][0:2] == ["git", "checkout"]]
-        pull_calls = [call for call in calls if call[0][0][0:2] == ["git", "pull"]]
-
-        assert len(checkout_calls) == 1
-        assert checkout_calls[0][0][0] == ["git", "checkout", "develop"]
-
-        assert len(pull_calls) == 1
-        assert pull_calls[0][0][0] == ["git", "pull", "origin", "develop"]
+        by_subcommand = assert_git_calls(mock_subprocess_runner.run_git_command, checkout=1, pull=1)
+        assert by_subcommand["checkout"][0][0][0] == ["git", "checkout", "develop"]
+        assert by_subcommand["pull"][0][0][0] == ["git", "pull", "origin", "develop"]
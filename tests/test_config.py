@@ -1,32 +1,10 @@
-import os
-from contextlib import contextmanager
-
 import pytest
-from hypothesis import given
+from hypothesis import HealthCheck, Phase, given, settings
 from hypothesis import strategies as st
 
 from git_batch_pull import config
 
 
-@contextmanager
-def set_env(token, folder):
-    old_token = os.environ.get("github_token")
-    old_folder = os.environ.get("local_folder")
-    os.environ["github_token"] = token
-    os.environ["local_folder"] = folder
-    try:
-        yield
-    finally:
-        if old_token is not None:
-            os.environ["github_token"] = old_token
-        else:
-            os.environ.pop("github_token", None)
-        if old_folder is not None:
-            os.environ["local_folder"] = old_folder
-        else:
-            os.environ.pop("local_folder", None)
-
-
 def test_load_config_env(monkeypatch):
     monkeypatch.setenv("github_token", "token")
     monkeypatch.setenv("local_folder", "/tmp")
@@ -49,13 +27,30 @@ def test_invalid_local_folder(monkeypatch):
         config.load_config()
 
 
-@given(
-    token=st.text(min_size=1, max_size=100).filter(lambda s: "\x00" not in s),
-    folder=st.text(min_size=1, max_size=100).filter(lambda s: "\x00" not in s),
+# Environment values cannot contain NUL; excluding it from the alphabet avoids
+# the reject-and-retry cost of a .filter().
+ENV_TEXT = st.text(
+    alphabet=st.characters(exclude_categories=("Cs",), exclude_characters="\x00"),
+    min_size=1,
+    max_size=100,
 )
-def test_config_property(token, folder):
-    with set_env(token, folder):
-        try:
-            config.load_config()
-        except Exception:
-            pass
+
+
+# monkeypatch is shared by all examples; each setenv overwrites the previous
+# example's values and the originals are restored once at teardown. The body
+# swallows every exception, so only the generate phase can do useful work.
+@settings(
+    phases=[Phase.generate],
+    max_examples=25,
+    database=None,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+@given(token=ENV_TEXT, folder=ENV_TEXT)
+def test_config_property(monkeypatch, token, folder):
+    monkeypatch.setenv("github_token", token)
+    monkeypatch.setenv("local_folder", folder)
+    try:
+        config.load_config()
+    except Exception:
+        pass
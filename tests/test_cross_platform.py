@@ -6,14 +6,23 @@ Ensures correct path string formatting on Windows and Unix-like systems.
 import platform
 from pathlib import Path
 
+import pytest
 
-def test_cross_platform_paths():
+SYSTEM = platform.system()
+
+POSIX_PATH = ("/tmp/repo", "/tmp")
+
+# platform.system() -> (path string, expected prefix of its str())
+PLATFORM_PATHS = {
+    "Windows": ("C:\\Users\\test\\repo", "C:\\"),
+    "Linux": POSIX_PATH,
+    "Darwin": POSIX_PATH,
+}
+
+
+@pytest.mark.parametrize("path_str,prefix", [PLATFORM_PATHS.get(SYSTEM, POSIX_PATH)])
+def test_cross_platform_paths(path_str, prefix):
     """
     Test that path string formatting is correct for the current platform.
     """
-    if platform.system() == "Windows":
-        p = Path("C:\\Users\\test\\repo")
-        assert str(p).startswith("C:\\")
-    else:
-        p = Path("/tmp/repo")
-        assert str(p).startswith("/tmp")
+    assert str(Path(path_str)).startswith(prefix)
@@ -3,315 +3,646 @@ Simple end-to-end tests for the core functionality.
 Tests clone vs pull behavior and protocol switching in realistic scenarios.
 """
 
-import tempfile
+import asyncio
+import os
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import ANY
 
+import pytest
+from support.fakes import FakeSubprocessRunner, GitCall
+
+from git_batch_pull.core.batch_processor import BatchProcessor
+from git_batch_pull.exceptions import GitOperationError
 from git_batch_pull.models.repository import Repository, RepositoryInfo
-from git_batch_pull.security import PathValidator, SafeSubprocessRunner
+from git_batch_pull.security import PathValidator
 from git_batch_pull.services.git_service import GitService
 
 
 class TestEndToEndFunctionality:
     """End-to-end tests for core functionality."""
 
-    def test_sync_functionality_clone_scenario(self):
+    def test_sync_functionality_clone_scenario(self, base_folder):
         """Test that sync clones when repository doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
-
-            # Create test repository
-            repo_info = RepositoryInfo(
-                name="test-repo",
-                clone_url="https://github.com/user/test-repo.git",
-                ssh_url="git@github.com:user/test-repo.git",
-                default_branch="main",
-                private=False,
-                fork=False,
-                archived=False,
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        # Create test repository
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="main",
+            private=False,
+            fork=False,
+            archived=False,
+        )
+        repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
+
+        # Repository doesn't exist - should clone
+        assert not repo.exists_locally
+
+        # Call clone_or_pull (core sync functionality)
+        git_service.clone_or_pull(repo, use_ssh=False)
+
+        # Should have called git clone with HTTPS URL
+        assert repo_info.clone_argv_https == (
+            "git",
+            "clone",
+            "https://github.com/user/test-repo.git",
+        )
+        assert runner.calls == [
+            GitCall([*repo_info.clone_argv_https, str(repo.local_path)], repo.parent_path_str, 300)
+        ]
+
+    def test_clone_argv_templates_are_cached(self):
+        """Test that clone argv templates are built once and fall back to HTTPS."""
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            default_branch="main",
+        )
+
+        assert repo_info.clone_argv_https is repo_info.clone_argv_https
+        # Without an SSH URL, SSH clones use the HTTPS one like get_clone_url does
+        assert repo_info.clone_argv_ssh == repo_info.clone_argv_https
+
+    def test_path_strings_follow_local_path(self):
+        """Test that cached path strings are rebuilt when local_path is replaced."""
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            default_branch="main",
+        )
+        repo = Repository(info=repo_info, local_path=Path("/base/test-repo"))
+
+        assert repo.local_path_str == str(Path("/base/test-repo"))
+        assert repo.parent_path_str == str(Path("/base"))
+
+        repo.local_path = Path("/other/test-repo")
+        assert repo.local_path_str == str(Path("/other/test-repo"))
+        assert repo.parent_path_str == str(Path("/other"))
+
+    def test_repository_slots(self):
+        """Test that Repository instances carry no per-instance __dict__."""
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            default_branch="main",
+        )
+        repo = Repository(info=repo_info, local_path=Path("/base/test-repo"))
+
+        assert not hasattr(repo, "__dict__")
+        with pytest.raises(AttributeError):
+            repo.unexpected = True
+
+    def test_sync_shallow_clone(self, base_folder):
+        """Test that the reduced-clone options are passed through to git clone."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="develop",
+        )
+        repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
+
+        git_service.clone_or_pull(
+            repo, use_ssh=False, shallow=True, single_branch=True, filter_blobs=True
+        )
+
+        assert runner.calls == [
+            GitCall(
+                [
+                    "git",
+                    "clone",
+                    "--single-branch",
+                    "-b",
+                    "develop",
+                    "--depth",
+                    "1",
+                    "--filter=blob:none",
+                    "https://github.com/user/test-repo.git",
+                    str(repo.local_path),
+                ],
+                repo.parent_path_str,
+                300,
             )
-            repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
-
-            # Repository doesn't exist - should clone
-            assert not repo.exists_locally
-
-            # Call clone_or_pull (core sync functionality)
-            git_service.clone_or_pull(repo, use_ssh=False)
+        ]
 
-            # Should have called git clone with HTTPS URL
-            mock_runner.run_git_command.assert_called_once_with(
-                ["git", "clone", "https://github.com/user/test-repo.git", str(repo.local_path)],
-                cwd=repo.local_path.parent,
-                timeout=300,
-            )
-
-    def test_sync_functionality_pull_scenario(self):
+    def test_sync_functionality_pull_scenario(self, base_folder):
         """Test that sync pulls when repository exists and is clean."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
-
-            # Create test repository
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        # Create test repository
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="main",
+            private=False,
+            fork=False,
+            archived=False,
+        )
+        repo_path = base_folder / "test-repo"
+        repo = Repository(info=repo_info, local_path=repo_path)
+
+        # Create repository directory and .git to simulate existing repo
+        (repo_path / ".git").mkdir(parents=True)
+
+        # Repository exists - should pull
+        assert repo.exists_locally
+
+        # Mock git commands for pull scenario
+        runner.set_results(
+            ["# branch.oid abc123\n"]  # git status: not empty, clean
+        )
+
+        # Call clone_or_pull (core sync functionality)
+        git_service.clone_or_pull(repo, use_ssh=False)
+
+        # Should have called pull commands, not clone
+        assert runner.commands == [
+            ["git", "status", "--branch", "--porcelain=v2"],
+            ["git", "checkout", "main"],
+            ["git", "pull", "origin", "main"],
+        ]
+
+    def test_fetch_all_fetches_existing_repositories(self, base_folder):
+        """Test that fetch_all runs one parallel fetch per locally present repository."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repos = []
+        for name in ("repo-a", "repo-b", "missing-repo"):
             repo_info = RepositoryInfo(
-                name="test-repo",
-                clone_url="https://github.com/user/test-repo.git",
-                ssh_url="git@github.com:user/test-repo.git",
+                name=name,
+                clone_url=f"https://github.com/user/{name}.git",
                 default_branch="main",
-                private=False,
-                fork=False,
-                archived=False,
             )
-            repo_path = base_folder / "test-repo"
-            repo = Repository(info=repo_info, local_path=repo_path)
-
-            # Create repository directory and .git to simulate existing repo
-            repo_path.mkdir(parents=True)
-            (repo_path / ".git").mkdir()
-
-            # Repository exists - should pull
-            assert repo.exists_locally
-
-            # Mock git commands for pull scenario
-            mock_head_result = MagicMock()
-            mock_head_result.stdout = "abc123\n"
-            mock_status_result = MagicMock()
-            mock_status_result.stdout = ""  # Clean repository
-
-            mock_runner.run_git_command.side_effect = [
-                mock_head_result,  # git rev-parse (not empty)
-                mock_status_result,  # git status (clean)
-                MagicMock(),  # git checkout
-                MagicMock(),  # git pull
-            ]
-
-            # Call clone_or_pull (core sync functionality)
-            git_service.clone_or_pull(repo, use_ssh=False)
+            repos.append(Repository(info=repo_info, local_path=base_folder / name))
+        for repo in repos[:2]:
+            (repo.local_path / ".git").mkdir(parents=True)
 
-            # Should have called pull commands, not clone
-            calls = mock_runner.run_git_command.call_args_list
-            assert len(calls) == 4
+        failures = git_service.fetch_all(repos, jobs=4)
 
-            # Check that checkout and pull were called
-            checkout_call = calls[2]
-            pull_call = calls[3]
+        assert failures == []
+        assert len(runner.calls) == 2
+        for call in runner.calls:
+            assert call.command == ["git", "fetch", "--all", "--jobs=4"]
+        assert {call.cwd for call in runner.calls} == {repo.local_path for repo in repos[:2]}
 
-            assert checkout_call[0][0] == ["git", "checkout", "main"]
-            assert pull_call[0][0] == ["git", "pull", "origin", "main"]
-
-    def test_protocol_detection_ssh(self):
+    def test_protocol_detection_ssh(self, base_folder):
         """Test SSH protocol detection."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
 
-            git_service = GitService(base_folder, mock_runner, validator)
+        git_service = GitService(base_folder, runner, validator)
 
-            # Mock git remote get-url to return SSH URL
-            mock_result = MagicMock()
-            mock_result.stdout = "git@github.com:user/test-repo.git\n"
-            mock_runner.run_git_command.return_value = mock_result
+        # Mock git remote get-url to return SSH URL
+        runner.set_results(["git@github.com:user/test-repo.git\n"])
 
-            repo_path = base_folder / "test-repo"
-            protocol = git_service.detect_protocol(repo_path)
+        repo_path = base_folder / "test-repo"
+        protocol = git_service.detect_protocol(repo_path)
 
-            assert protocol == "ssh"
+        assert protocol == "ssh"
 
-    def test_protocol_detection_https(self):
+    def test_protocol_detection_https(self, base_folder):
         """Test HTTPS protocol detection."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
 
-            # Mock git remote get-url to return HTTPS URL
-            mock_result = MagicMock()
-            mock_result.stdout = "https://github.com/user/test-repo.git\n"
-            mock_runner.run_git_command.return_value = mock_result
+        git_service = GitService(base_folder, runner, validator)
 
-            repo_path = base_folder / "test-repo"
-            protocol = git_service.detect_protocol(repo_path)
+        # Mock git remote get-url to return HTTPS URL
+        runner.set_results(["https://github.com/user/test-repo.git\n"])
 
-            assert protocol == "https"
+        repo_path = base_folder / "test-repo"
+        protocol = git_service.detect_protocol(repo_path)
 
-    def test_protocol_switching_ssh_to_https(self):
-        """Test switching from SSH to HTTPS protocol."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
+        assert protocol == "https"
 
-            git_service = GitService(base_folder, mock_runner, validator)
+    def test_protocol_detection_cached(self, base_folder):
+        """Test that remote URLs are cached until the repository config changes."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
 
-            repo_path = base_folder / "test-repo"
-            new_url = "https://github.com/user/test-repo.git"
+        git_service = GitService(base_folder, runner, validator)
 
-            # Update remote URL (protocol switch)
-            git_service.update_remote_url(repo_path, new_url)
+        repo_path = base_folder / "test-repo"
+        (repo_path / ".git").mkdir(parents=True)
+        (repo_path / ".git" / "config").write_text("[core]\n")
 
-            # Should have called git remote set-url
-            mock_runner.run_git_command.assert_called_once_with(
-                ["git", "remote", "set-url", "origin", new_url], cwd=repo_path, timeout=10
-            )
+        runner.set_results(
+            [
+                "git@github.com:user/test-repo.git\n",  # git remote get-url
+                "",  # git remote set-url
+            ]
+        )
+
+        assert git_service.detect_protocol(repo_path) == "ssh"
+        assert git_service.detect_protocol(repo_path) == "ssh"
+        # The mismatch report's URL lookup reuses the detection's git call
+        assert git_service.get_remote_url(repo_path) == "git@github.com:user/test-repo.git"
+        assert len(runner.calls) == 1
+
+        # Switching the remote replaces the cached URL without reading it back
+        git_service.update_remote_url(repo_path, "https://github.com/user/test-repo.git")
+        assert git_service.detect_protocol(repo_path) == "https"
+        assert len(runner.calls) == 2
+
+        # Editing the config by other means invalidates the cache
+        (repo_path / ".git" / "config").write_text("[core]\n\tbare = false\n")
+        os.utime(repo_path / ".git" / "config", ns=(1, 1))
+        runner.set_results(["git@github.com:user/test-repo.git\n"])
+        assert git_service.detect_protocol(repo_path) == "ssh"
+        assert len(runner.calls) == 3
+
+    def test_protocol_switching_ssh_to_https(self, base_folder):
+        """Test switching from SSH to HTTPS protocol."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
 
-    def test_protocol_switching_https_to_ssh(self):
-        """Test switching from HTTPS to SSH protocol."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
+        git_service = GitService(base_folder, runner, validator)
 
-            git_service = GitService(base_folder, mock_runner, validator)
+        repo_path = base_folder / "test-repo"
+        new_url = "https://github.com/user/test-repo.git"
 
-            repo_path = base_folder / "test-repo"
-            new_url = "git@github.com:user/test-repo.git"
+        # Update remote URL (protocol switch)
+        git_service.update_remote_url(repo_path, new_url)
 
-            # Update remote URL (protocol switch)
-            git_service.update_remote_url(repo_path, new_url)
+        # Should have called git remote set-url
+        assert runner.calls == [
+            GitCall(["git", "remote", "set-url", "origin", new_url], repo_path, 10)
+        ]
 
-            # Should have called git remote set-url
-            mock_runner.run_git_command.assert_called_once_with(
-                ["git", "remote", "set-url", "origin", new_url], cwd=repo_path, timeout=10
+    def test_protocol_switching_https_to_ssh(self, base_folder):
+        """Test switching from HTTPS to SSH protocol."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repo_path = base_folder / "test-repo"
+        new_url = "git@github.com:user/test-repo.git"
+
+        # Update remote URL (protocol switch)
+        git_service.update_remote_url(repo_path, new_url)
+
+        # Should have called git remote set-url
+        assert runner.calls == [
+            GitCall(["git", "remote", "set-url", "origin", new_url], repo_path, 10)
+        ]
+
+    def test_sync_with_ssh_flag_clones_with_ssh(self, base_folder, monkeypatch):
+        """Test that sync with SSH flag clones using SSH URL over a shared connection."""
+        monkeypatch.setenv("HOME", str(base_folder))
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        monkeypatch.delenv("GIT_SSH", raising=False)
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator, ssh_multiplex=True)
+
+        # Create test repository
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="main",
+            private=False,
+            fork=False,
+            archived=False,
+        )
+        repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
+
+        # Repository doesn't exist - should clone with SSH
+        assert not repo.exists_locally
+
+        # Call clone_or_pull with SSH flag
+        git_service.clone_or_pull(repo, use_ssh=True)
+
+        # Should have called git clone with SSH URL
+        assert runner.calls == [
+            GitCall(
+                ["git", "clone", "git@github.com:user/test-repo.git", str(repo.local_path)],
+                repo.parent_path_str,
+                300,
+                env=ANY,
             )
+        ]
 
-    def test_sync_with_ssh_flag_clones_with_ssh(self):
-        """Test that sync with SSH flag clones using SSH URL."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
+        # ...with SSH connection sharing where the platform supports it
+        if os.name != "nt":
+            assert "ControlMaster=auto" in runner.calls[0].env["GIT_SSH_COMMAND"]
 
-            # Create test repository
-            repo_info = RepositoryInfo(
-                name="test-repo",
-                clone_url="https://github.com/user/test-repo.git",
-                ssh_url="git@github.com:user/test-repo.git",
-                default_branch="main",
-                private=False,
-                fork=False,
-                archived=False,
+    def test_sync_skips_pull_when_uncommitted_changes(self, base_folder):
+        """Test that sync skips pull when repository has uncommitted changes."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        # Create test repository
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="main",
+            private=False,
+            fork=False,
+            archived=False,
+        )
+        repo_path = base_folder / "test-repo"
+        repo = Repository(info=repo_info, local_path=repo_path)
+
+        # Create repository directory and .git to simulate existing repo
+        (repo_path / ".git").mkdir(parents=True)
+
+        # Mock git commands - repository has uncommitted changes
+        runner.set_results(
+            ["# branch.oid abc123\n1 M. N... 100644 100644 100644 a1 a1 file.txt\n"]  # Dirty
+        )
+
+        # Call clone_or_pull - should skip pull due to uncommitted changes
+        git_service.clone_or_pull(repo, use_ssh=False)
+
+        # Should only call status, not checkout/pull
+        assert runner.commands == [["git", "status", "--branch", "--porcelain=v2"]]
+
+    def test_sync_handles_different_default_branches(self, base_folder):
+        """Test that sync works with repositories having non-main default branches."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        # Create test repository with develop as default branch
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            ssh_url="git@github.com:user/test-repo.git",
+            default_branch="develop",  # Not main
+            private=False,
+            fork=False,
+            archived=False,
+        )
+        repo_path = base_folder / "test-repo"
+        repo = Repository(info=repo_info, local_path=repo_path)
+
+        # Create repository directory and .git to simulate existing repo
+        (repo_path / ".git").mkdir(parents=True)
+
+        # Mock git commands for pull scenario
+        runner.set_results(
+            ["# branch.oid abc123\n"]  # git status: not empty, clean
+        )
+
+        # Call clone_or_pull
+        git_service.clone_or_pull(repo, use_ssh=False)
+
+        # Should checkout and pull from develop branch
+        assert runner.commands[1:] == [
+            ["git", "checkout", "develop"],
+            ["git", "pull", "origin", "develop"],
+        ]
+
+    def test_sync_functionality_batch_clone_scenario(self, base_folder):
+        """Test that a batch sync clones every missing repository concurrently."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=f"repo-{i}",
+                    clone_url=f"https://github.com/user/repo-{i}.git",
+                    ssh_url=f"git@github.com:user/repo-{i}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / f"repo-{i}",
             )
-            repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
-
-            # Repository doesn't exist - should clone with SSH
-            assert not repo.exists_locally
-
-            # Call clone_or_pull with SSH flag
-            git_service.clone_or_pull(repo, use_ssh=True)
-
-            # Should have called git clone with SSH URL
-            mock_runner.run_git_command.assert_called_once_with(
-                ["git", "clone", "git@github.com:user/test-repo.git", str(repo.local_path)],
-                cwd=repo.local_path.parent,
-                timeout=300,
+            for i in range(6)
+        ]
+
+        failures = git_service.clone_or_pull_batch(repos, use_ssh=False, max_workers=3)
+
+        # One clone per repository, none failed
+        assert failures == []
+        assert len(runner.calls) == len(repos)
+        assert {command[2] for command in runner.commands} == {
+            repo.info.clone_url for repo in repos
+        }
+
+    def test_sync_functionality_batch_reports_failures(self, base_folder):
+        """Test that a failing repository doesn't stop the rest of the batch."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=name,
+                    clone_url=f"https://github.com/user/{name}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / name,
             )
-
-    def test_sync_skips_pull_when_uncommitted_changes(self):
-        """Test that sync skips pull when repository has uncommitted changes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
-
-            # Create test repository
-            repo_info = RepositoryInfo(
-                name="test-repo",
-                clone_url="https://github.com/user/test-repo.git",
-                ssh_url="git@github.com:user/test-repo.git",
-                default_branch="main",
-                private=False,
-                fork=False,
-                archived=False,
+            for name in ("good-repo", "bad-repo")
+        ]
+
+        runner.set_results(
+            lambda command: GitOperationError("clone failed") if "bad-repo" in command[2] else ""
+        )
+
+        failures = git_service.clone_or_pull_batch(repos, max_workers=2)
+
+        assert [name for name, _ in failures] == ["bad-repo"]
+        assert isinstance(failures[0][1], GitOperationError)
+        assert len(runner.calls) == 2
+
+    def test_async_batch_clones_and_reports_failures(self, base_folder):
+        """Test that the asyncio batch clones every repository and collects failures."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=name,
+                    clone_url=f"https://github.com/user/{name}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / name,
             )
-            repo_path = base_folder / "test-repo"
-            repo = Repository(info=repo_info, local_path=repo_path)
-
-            # Create repository directory and .git to simulate existing repo
-            repo_path.mkdir(parents=True)
-            (repo_path / ".git").mkdir()
-
-            # Mock git commands - repository has uncommitted changes
-            mock_head_result = MagicMock()
-            mock_head_result.stdout = "abc123\n"
-            mock_status_result = MagicMock()
-            mock_status_result.stdout = "M  file.txt\n"  # Dirty repository
-
-            mock_runner.run_git_command.side_effect = [
-                mock_head_result,  # git rev-parse (not empty)
-                mock_status_result,  # git status (dirty)
-            ]
-
-            # Call clone_or_pull - should skip pull due to uncommitted changes
-            git_service.clone_or_pull(repo, use_ssh=False)
-
-            # Should only call rev-parse and status, not checkout/pull
-            calls = mock_runner.run_git_command.call_args_list
-            assert len(calls) == 2
-
-            # Verify no checkout or pull was attempted
-            for call in calls:
-                assert call[0][0][0:2] not in [["git", "checkout"], ["git", "pull"]]
-
-    def test_sync_handles_different_default_branches(self):
-        """Test that sync works with repositories having non-main default branches."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_folder = Path(temp_dir)
-            mock_runner = MagicMock(spec=SafeSubprocessRunner)
-            validator = PathValidator()
-
-            git_service = GitService(base_folder, mock_runner, validator)
-
-            # Create test repository with develop as default branch
-            repo_info = RepositoryInfo(
-                name="test-repo",
-                clone_url="https://github.com/user/test-repo.git",
-                ssh_url="git@github.com:user/test-repo.git",
-                default_branch="develop",  # Not main
-                private=False,
-                fork=False,
-                archived=False,
+            for name in ("repo-1", "bad-repo", "repo-2")
+        ]
+
+        runner.set_results(
+            lambda command: GitOperationError("clone failed") if "bad-repo" in command[2] else ""
+        )
+
+        failures = asyncio.run(git_service.aclone_or_pull_batch(repos, concurrency=2))
+
+        assert [name for name, _ in failures] == ["bad-repo"]
+        assert len(runner.calls) == len(repos)
+
+    def test_async_pull_runs_same_commands_as_sync(self, base_folder):
+        """Test that the asyncio path decides a pull exactly like clone_or_pull."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repo_info = RepositoryInfo(
+            name="test-repo",
+            clone_url="https://github.com/user/test-repo.git",
+            default_branch="main",
+        )
+        repo = Repository(info=repo_info, local_path=base_folder / "test-repo")
+        (repo.local_path / ".git").mkdir(parents=True)
+
+        # Clean, on another branch: status, checkout, pull
+        runner.set_results(lambda command: "# branch.oid abc123\n# branch.head dev\n")
+
+        git_service.clone_or_pull(repo)
+        sync_commands = list(runner.commands)
+        runner.calls.clear()
+        asyncio.run(git_service.aclone_or_pull(repo))
+
+        assert runner.commands == sync_commands
+        assert [command[1] for command in sync_commands] == ["status", "checkout", "pull"]
+
+    def test_batch_processor_overlaps_git_calls_up_to_max_workers(self, base_folder):
+        """Test that parallel batches await git concurrently, never beyond max_workers."""
+
+        class TrackingRunner(FakeSubprocessRunner):
+            in_flight = peak = 0
+
+            async def arun_git_command(self, command, cwd, timeout=None, **kwargs):
+                TrackingRunner.in_flight += 1
+                TrackingRunner.peak = max(TrackingRunner.peak, TrackingRunner.in_flight)
+                try:
+                    await asyncio.sleep(0)  # Let the other repositories start
+                    return await super().arun_git_command(command, cwd, timeout, **kwargs)
+                finally:
+                    TrackingRunner.in_flight -= 1
+
+        runner = TrackingRunner(
+            lambda command: GitOperationError("clone failed") if "bad-repo" in command[2] else ""
+        )
+        git_service = GitService(base_folder, runner, PathValidator())
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=name,
+                    clone_url=f"https://github.com/user/{name}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / name,
             )
-            repo_path = base_folder / "test-repo"
-            repo = Repository(info=repo_info, local_path=repo_path)
-
-            # Create repository directory and .git to simulate existing repo
-            repo_path.mkdir(parents=True)
-            (repo_path / ".git").mkdir()
-
-            # Mock git commands for pull scenario
-            mock_head_result = MagicMock()
-            mock_head_result.stdout = "abc123\n"
-            mock_status_result = MagicMock()
-            mock_status_result.stdout = ""  # Clean repository
-
-            mock_runner.run_git_command.side_effect = [
-                mock_head_result,  # git rev-parse (not empty)
-                mock_status_result,  # git status (clean)
-                MagicMock(),  # git checkout
-                MagicMock(),  # git pull
-            ]
-
-            # Call clone_or_pull
-            git_service.clone_or_pull(repo, use_ssh=False)
+            for name in ("repo-1", "repo-2", "bad-repo", "repo-3", "repo-4")
+        ]
+
+        result = BatchProcessor(git_service, max_workers=2).process_repositories(repos, quiet=True)
+
+        assert (result.processed, result.failed) == (4, 1)
+        assert result.errors == [("bad-repo", "clone failed")]
+        assert len(runner.calls) == len(repos)
+        assert TrackingRunner.peak == 2
+
+    def test_prime_existence_cache_bulk(self, base_folder, monkeypatch):
+        """Test that a batch learns which repositories exist from one base-folder scan."""
+        runner = FakeSubprocessRunner()
+        validator = PathValidator()
+
+        git_service = GitService(base_folder, runner, validator)
+
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=f"repo-{i}",
+                    clone_url=f"https://github.com/user/repo-{i}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / f"repo-{i}",
+            )
+            for i in range(5)
+        ]
+        (repos[0].local_path / ".git").mkdir(parents=True)
+        (repos[1].local_path).mkdir()  # A directory, but not a clone
+
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+        with git_service.existence_cache():
+            exists = [git_service.repository_exists(repo) for repo in repos]
+
+        assert exists == [True, False, False, False, False]
+        assert scans == [base_folder]
+        # Outside the block every check goes back to the filesystem
+        assert git_service.repository_exists(repos[0])
+        assert len(scans) == 1
+
+    def test_nested_existence_cache_restores_outer(self, base_folder):
+        """Test that leaving a nested existence_cache block keeps the outer one active."""
+        git_service = GitService(base_folder, FakeSubprocessRunner(), PathValidator())
+        repo = Repository(
+            info=RepositoryInfo(
+                name="repo",
+                clone_url="https://github.com/user/repo.git",
+                default_branch="main",
+            ),
+            local_path=base_folder / "repo",
+        )
+
+        with git_service.existence_cache():
+            outer = git_service._existing
+            git_service.filter_existing([repo])
+            assert git_service._existing is outer
+        assert git_service._existing is None
+
+    def test_filter_existing_partitions_in_order(self, base_folder, monkeypatch):
+        """Test that filter_existing splits cloned from missing repositories with one scan."""
+        git_service = GitService(base_folder, FakeSubprocessRunner(), PathValidator())
+
+        repos = [
+            Repository(
+                info=RepositoryInfo(
+                    name=f"repo-{i}",
+                    clone_url=f"https://github.com/user/repo-{i}.git",
+                    default_branch="main",
+                ),
+                local_path=base_folder / f"repo-{i}",
+            )
+            for i in range(4)
+        ]
+        (repos[1].local_path / ".git").mkdir(parents=True)
+        (repos[3].local_path / ".git").mkdir(parents=True)
 
-            calls = mock_runner.run_git_command.call_args_list
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
 
-            # Should checkout and pull from develop branch
-            checkout_call = calls[2]
-            pull_call = calls[3]
+        existing, missing = git_service.filter_existing(repos)
 
-            assert checkout_call[0][0] == ["git", "checkout", "develop"]
-            assert pull_call[0][0] == ["git", "pull", "origin", "develop"]
+        assert existing == [repos[1], repos[3]]
+        assert missing == [repos[0], repos[2]]
+        assert scans == [base_folder]
@@ -3,7 +3,6 @@ Unit tests for git_ops module in git-batch-pull.
 Covers detection of uncommitted changes and error handling in clone/pull operations.
 """
 
-import os
 from unittest.mock import patch
 
 import pytest
@@ -15,12 +14,12 @@ def test_has_uncommitted_changes(tmp_path):
     """
     Test detection of uncommitted changes in a git repository.
     """
+    pygit2 = pytest.importorskip("pygit2")
     repo_path = tmp_path / "repo"
-    os.makedirs(repo_path)
-    os.system(f"git init {repo_path}")
-    with open(repo_path / "file.txt", "w") as f:
-        f.write("test")
-    os.system(f"git -C {repo_path} add .")
+    repo = pygit2.init_repository(str(repo_path))
+    (repo_path / "file.txt").write_text("test")
+    repo.index.add_all()
+    repo.index.write()
     git_op = git_ops.GitOperator(str(tmp_path))
     assert git_op.has_uncommitted_changes(str(repo_path))
 
@@ -3,29 +3,29 @@ Comprehensive tests for GitService in the new architecture.
 Tests clone, pull, clone_or_pull functionality and protocol switching.
 """
 
-import tempfile
-from pathlib import Path
+import asyncio
+import os
 from unittest.mock import MagicMock
 
 import pytest
+from support.fakes import FakeSubprocessRunner, GitCall
 
 from git_batch_pull.exceptions import GitOperationError
-from git_batch_pull.models.repository import Repository, RepositoryInfo
-from git_batch_pull.security import PathValidator, SafeSubprocessRunner
+from git_batch_pull.models.repository import Repository, RepositoryInfo, RepositoryState
+from git_batch_pull.security import PathValidator
 from git_batch_pull.services.git_service import GitService
 
 
 @pytest.fixture
-def temp_base_folder():
-    """Create a temporary directory for test repositories."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_base_folder(base_folder):
+    """Temporary directory for test repositories."""
+    return base_folder
 
 
 @pytest.fixture
-def mock_subprocess_runner():
-    """Mock SafeSubprocessRunner for testing."""
-    return MagicMock(spec=SafeSubprocessRunner)
+def runner():
+    """Fake SafeSubprocessRunner recording git calls (clean, empty output by default)."""
+    return FakeSubprocessRunner()
 
 
 @pytest.fixture
@@ -35,9 +35,9 @@ def path_validator():
 
 
 @pytest.fixture
-def git_service(temp_base_folder, mock_subprocess_runner, path_validator):
+def git_service(temp_base_folder, runner, path_validator):
     """GitService instance for testing."""
-    return GitService(temp_base_folder, mock_subprocess_runner, path_validator)
+    return GitService(temp_base_folder, runner, path_validator)
 
 
 @pytest.fixture
@@ -69,223 +69,292 @@ class TestGitService:
         assert repo_path.name == "test-repo"
         assert repo_path.parent == git_service.base_folder
 
+    def test_get_repository_path_cached(self, temp_base_folder, runner):
+        """Test that each repository name is validated only once."""
+        validator = MagicMock(wraps=PathValidator())
+        service = GitService(temp_base_folder, runner, validator)
+
+        first = service.get_repository_path("test-repo")
+        assert service.get_repository_path("test-repo") is first
+        validator.validate_filename.assert_called_once_with("test-repo")
+
     def test_get_repository_path_invalid_name(self, git_service):
         """Test repository path with invalid characters."""
         with pytest.raises(Exception):  # PathValidationError
             git_service.get_repository_path("../dangerous-repo")
 
-    def test_has_uncommitted_changes_clean(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_has_uncommitted_changes_clean(self, git_service, sample_repository, runner):
         """Test has_uncommitted_changes with clean repository."""
         # Mock git status to return clean
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "")
 
         result = git_service.has_uncommitted_changes(sample_repository.local_path)
         assert result is False
 
-    def test_has_uncommitted_changes_dirty(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_has_uncommitted_changes_dirty(self, git_service, sample_repository, runner):
         """Test has_uncommitted_changes with dirty repository."""
         # Mock git status to return changes
-        mock_result = MagicMock()
-        mock_result.stdout = "M  file.txt\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "M  file.txt\n")
 
         result = git_service.has_uncommitted_changes(sample_repository.local_path)
         assert result is True
 
-    def test_is_repository_empty_not_empty(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_has_uncommitted_changes_libgit2(self, temp_base_folder, runner, path_validator):
+        """Test has_uncommitted_changes reads the status through pygit2 when enabled."""
+        pygit2 = pytest.importorskip("pygit2")
+        repo_path = temp_base_folder / "libgit2-repo"
+        pygit2.init_repository(str(repo_path))
+        service = GitService(temp_base_folder, runner, path_validator, use_libgit2=True)
+
+        assert service.has_uncommitted_changes(repo_path) is False
+        (repo_path / "file.txt").write_text("test")
+        assert service.has_uncommitted_changes(repo_path) is True
+        assert runner.calls == []
+
+    def test_get_status(self, git_service, sample_repository, runner):
+        """Test get_status reads HEAD, branch and dirty state from one porcelain v2 call."""
+        runner.set_results(
+            [
+                "# branch.oid abc123\n"
+                "# branch.head main\n"
+                "# branch.upstream origin/main\n"
+                "# branch.ab +0 -0\n"
+                "? new-file.txt\n"
+            ]
+        )
+
+        assert git_service.get_status(sample_repository.local_path) == RepositoryState(
+            head_sha="abc123", dirty=True, branch="main"
+        )
+        assert runner.calls == [
+            GitCall(
+                ["git", "status", "--branch", "--porcelain=v2"], sample_repository.local_path, 10
+            )
+        ]
+
+    def test_is_repository_empty_not_empty(self, git_service, sample_repository, runner):
         """Test is_repository_empty with commits."""
         # Mock git rev-parse to succeed (has commits)
-        mock_result = MagicMock()
-        mock_result.stdout = "abc123\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "abc123\n")
 
         result = git_service.is_repository_empty(sample_repository.local_path)
         assert result is False
 
-    def test_is_repository_empty_empty(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_is_repository_empty_empty(self, git_service, sample_repository, runner):
         """Test is_repository_empty with no commits."""
         # Mock git rev-parse to fail (no commits)
-        mock_subprocess_runner.run_git_command.side_effect = GitOperationError("No HEAD")
+        runner.set_results([GitOperationError("No HEAD")])
 
         result = git_service.is_repository_empty(sample_repository.local_path)
         assert result is True
 
-    def test_get_current_branch(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_get_current_branch(self, git_service, sample_repository, runner):
         """Test getting current branch."""
-        mock_result = MagicMock()
-        mock_result.stdout = "main\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "main\n")
 
         result = git_service.get_current_branch(sample_repository.local_path)
         assert result == "main"
 
-    def test_get_remote_url_https(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_get_remote_url_https(self, git_service, sample_repository, runner):
         """Test getting HTTPS remote URL."""
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/test-repo.git\n")
 
         result = git_service.get_remote_url(sample_repository.local_path)
         assert result == "https://github.com/user/test-repo.git"
 
-    def test_get_remote_url_ssh(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_get_remote_url_ssh(self, git_service, sample_repository, runner):
         """Test getting SSH remote URL."""
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/test-repo.git\n")
 
         result = git_service.get_remote_url(sample_repository.local_path)
         assert result == "git@github.com:user/test-repo.git"
 
-    def test_detect_protocol_ssh(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_get_remote_urls_in_order(self, git_service, temp_base_folder, runner):
+        """Test that concurrent remote lookups come back in the order of the paths."""
+        paths = [temp_base_folder / f"repo-{i}" for i in range(5)]
+        runner.set_results(lambda command: f"https://github.com/user/{runner.calls[-1].cwd.name}\n")
+
+        urls = git_service.get_remote_urls(paths, max_workers=3)
+
+        assert urls == [f"https://github.com/user/repo-{i}" for i in range(5)]
+        assert sorted(call.cwd for call in runner.calls) == paths
+
+    def test_detect_protocol_ssh(self, git_service, sample_repository, runner):
         """Test protocol detection for SSH."""
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/test-repo.git\n")
 
         result = git_service.detect_protocol(sample_repository.local_path)
         assert result == "ssh"
 
-    def test_detect_protocol_https(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_detect_protocol_https(self, git_service, sample_repository, runner):
         """Test protocol detection for HTTPS."""
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/test-repo.git\n")
 
         result = git_service.detect_protocol(sample_repository.local_path)
         assert result == "https"
 
-    def test_clone_repository_https(self, git_service, sample_repository, mock_subprocess_runner):
+    @pytest.mark.parametrize(
+        "url,protocol",
+        [
+            ("git@github.com:user/test-repo.git", "ssh"),
+            ("ssh://git@github.com/user/test-repo.git", "ssh"),
+            ("SSH://git@github.com/user/test-repo.git", "ssh"),
+            ("https://github.com/user/test-repo.git", "https"),
+            ("http://github.com/user/test-repo.git", None),
+            ("file:///local/repo.git", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_protocol_from_url(self, url, protocol):
+        """Test URL classification without any git call."""
+        assert GitService.protocol_from_url(url) == protocol
+
+    def test_clone_repository_https(self, git_service, sample_repository, runner):
         """Test cloning repository with HTTPS."""
         git_service.clone_repository(sample_repository, use_ssh=False)
 
         # Verify git clone was called with HTTPS URL
-        mock_subprocess_runner.run_git_command.assert_called_once_with(
-            [
-                "git",
-                "clone",
-                "https://github.com/user/test-repo.git",
-                str(sample_repository.local_path),
-            ],
-            cwd=sample_repository.local_path.parent,
-            timeout=300,
-        )
+        assert runner.calls == [
+            GitCall(
+                [
+                    "git",
+                    "clone",
+                    "https://github.com/user/test-repo.git",
+                    str(sample_repository.local_path),
+                ],
+                sample_repository.parent_path_str,
+                300,
+            )
+        ]
 
-    def test_clone_repository_ssh(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_clone_repository_ssh(
+        self, git_service, sample_repository, runner, temp_base_folder, monkeypatch
+    ):
         """Test cloning repository with SSH."""
+        monkeypatch.setenv("HOME", str(temp_base_folder))
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        monkeypatch.delenv("GIT_SSH", raising=False)
+
         git_service.clone_repository(sample_repository, use_ssh=True)
 
         # Verify git clone was called with SSH URL
-        mock_subprocess_runner.run_git_command.assert_called_once_with(
-            [
-                "git",
-                "clone",
-                "git@github.com:user/test-repo.git",
-                str(sample_repository.local_path),
-            ],
-            cwd=sample_repository.local_path.parent,
-            timeout=300,
-        )
+        assert runner.calls == [
+            GitCall(
+                [
+                    "git",
+                    "clone",
+                    "git@github.com:user/test-repo.git",
+                    str(sample_repository.local_path),
+                ],
+                sample_repository.parent_path_str,
+                300,
+                git_service.get_ssh_env(),
+            )
+        ]
+
+    def test_ssh_multiplex_is_opt_in(
+        self, sample_repository, runner, path_validator, temp_base_folder, monkeypatch
+    ):
+        """Test that SSH connections are only shared when ssh_multiplex is on, pulls included."""
+        monkeypatch.setenv("HOME", str(temp_base_folder))
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        monkeypatch.delenv("GIT_SSH", raising=False)
+
+        assert GitService(temp_base_folder, runner, path_validator).get_ssh_env() is None
+        assert not (temp_base_folder / ".cache").exists()
+
+        service = GitService(temp_base_folder, runner, path_validator, ssh_multiplex=True)
+        (sample_repository.local_path / ".git").mkdir(parents=True)
+        runner.set_results(["# branch.oid abc123\n# branch.head main\n", ""])
+
+        service.pull_repository(sample_repository)
+
+        if os.name != "nt":
+            assert "ControlMaster=auto" in runner.calls[-1].env["GIT_SSH_COMMAND"]
+            assert (temp_base_folder / ".cache" / "git-batch-pull").is_dir()
 
-    def test_clone_repository_failure(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_clone_repository_failure(self, git_service, sample_repository, runner):
         """Test clone repository failure handling."""
-        mock_subprocess_runner.run_git_command.side_effect = GitOperationError("Clone failed")
+        runner.set_results([GitOperationError("Clone failed")])
 
         with pytest.raises(GitOperationError):
             git_service.clone_repository(sample_repository, use_ssh=False)
 
-    def test_pull_repository_success(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_pull_repository_success(self, git_service, sample_repository, runner):
         """Test successful pull operation."""
         # Mock repository exists
         sample_repository.local_path.mkdir(parents=True)
 
         # Mock repository is not empty and has no uncommitted changes
-        mock_result = MagicMock()
-        mock_result.stdout = "abc123\n"
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result,  # git rev-parse (not empty)
-            MagicMock(stdout=""),  # git status (clean)
-            MagicMock(),  # git checkout
-            MagicMock(),  # git pull
-        ]
+        runner.set_results(["# branch.oid abc123\n"])  # git status (not empty, clean)
 
         git_service.pull_repository(sample_repository)
 
         # Verify checkout and pull were called
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        assert len(calls) == 4
+        commands = runner.commands
+        assert len(commands) == 3
         # Check checkout call
-        assert calls[2][0][0] == ["git", "checkout", "main"]
+        assert commands[1] == ["git", "checkout", "main"]
         # Check pull call
-        assert calls[3][0][0] == ["git", "pull", "origin", "main"]
+        assert commands[2] == ["git", "pull", "origin", "main"]
 
-    def test_pull_repository_uncommitted_changes(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_pull_repository_on_default_branch(self, git_service, sample_repository, runner):
+        """Test that no checkout runs when the status shows the default branch checked out."""
+        sample_repository.local_path.mkdir(parents=True)
+        runner.set_results(["# branch.oid abc123\n# branch.head main\n"])  # git status
+
+        git_service.pull_repository(sample_repository)
+
+        assert runner.commands == [
+            ["git", "status", "--branch", "--porcelain=v2"],
+            ["git", "pull", "origin", "main"],
+        ]
+
+    def test_pull_repository_uncommitted_changes(self, git_service, sample_repository, runner):
         """Test pull skipped when uncommitted changes exist."""
         # Mock repository exists
         sample_repository.local_path.mkdir(parents=True)
 
         # Mock repository has uncommitted changes
-        mock_result_empty = MagicMock()
-        mock_result_empty.stdout = "abc123\n"
-        mock_result_dirty = MagicMock()
-        mock_result_dirty.stdout = "M  file.txt\n"
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result_empty,  # git rev-parse (not empty)
-            mock_result_dirty,  # git status (dirty)
-        ]
+        runner.set_results(["# branch.oid abc123\n1 M. N... 100644 100644 100644 a1 a1 file.txt\n"])
 
         git_service.pull_repository(sample_repository)
 
-        # Should only call git rev-parse and git status, not checkout/pull
-        assert mock_subprocess_runner.run_git_command.call_count == 2
+        # Should only call git status, not checkout/pull
+        assert len(runner.calls) == 1
 
-    def test_pull_repository_empty(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_pull_repository_empty(self, git_service, sample_repository, runner):
         """Test pull skipped when repository is empty."""
         # Mock repository exists
         sample_repository.local_path.mkdir(parents=True)
 
         # Mock repository is empty
-        mock_subprocess_runner.run_git_command.side_effect = GitOperationError("No HEAD")
+        runner.set_results(["# branch.oid (initial)\n# branch.head main\n"])
 
         git_service.pull_repository(sample_repository)
 
-        # Should only call git rev-parse
-        assert mock_subprocess_runner.run_git_command.call_count == 1
+        # Should only call git status
+        assert len(runner.calls) == 1
 
-    def test_pull_repository_not_exists(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_pull_repository_not_exists(self, git_service, sample_repository, runner):
         """Test pull fails when repository doesn't exist."""
         with pytest.raises(GitOperationError):
             git_service.pull_repository(sample_repository)
 
-    def test_update_remote_url(self, git_service, sample_repository, mock_subprocess_runner):
+    def test_update_remote_url(self, git_service, sample_repository, runner):
         """Test updating remote URL."""
         new_url = "git@github.com:user/test-repo.git"
 
         git_service.update_remote_url(sample_repository.local_path, new_url)
 
-        mock_subprocess_runner.run_git_command.assert_called_once_with(
-            ["git", "remote", "set-url", "origin", new_url],
-            cwd=sample_repository.local_path,
-            timeout=10,
-        )
+        assert runner.calls == [
+            GitCall(
+                ["git", "remote", "set-url", "origin", new_url], sample_repository.local_path, 10
+            )
+        ]
 
-    def test_clone_or_pull_clone_scenario(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_clone_or_pull_clone_scenario(self, git_service, sample_repository, runner):
         """Test clone_or_pull when repository doesn't exist (clone scenario)."""
         # Repository doesn't exist locally
         assert not sample_repository.exists_locally
@@ -293,56 +362,44 @@ class TestGitService:
         git_service.clone_or_pull(sample_repository, use_ssh=False)
 
         # Should call git clone
-        mock_subprocess_runner.run_git_command.assert_called_once_with(
-            [
-                "git",
-                "clone",
-                "https://github.com/user/test-repo.git",
-                str(sample_repository.local_path),
-            ],
-            cwd=sample_repository.local_path.parent,
-            timeout=300,
-        )
+        assert runner.calls == [
+            GitCall(
+                [
+                    "git",
+                    "clone",
+                    "https://github.com/user/test-repo.git",
+                    str(sample_repository.local_path),
+                ],
+                sample_repository.parent_path_str,
+                300,
+            )
+        ]
 
-    def test_clone_or_pull_pull_scenario(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_clone_or_pull_pull_scenario(self, git_service, sample_repository, runner):
         """Test clone_or_pull when repository exists (pull scenario)."""
         # Create repository directory and .git to simulate it exists
-        sample_repository.local_path.mkdir(parents=True)
-        (sample_repository.local_path / ".git").mkdir()
+        (sample_repository.local_path / ".git").mkdir(parents=True)
 
         # Mock repository is not empty and has no uncommitted changes
-        mock_result = MagicMock()
-        mock_result.stdout = "abc123\n"
-        mock_subprocess_runner.run_git_command.side_effect = [
-            mock_result,  # git rev-parse (not empty)
-            MagicMock(stdout=""),  # git status (clean)
-            MagicMock(),  # git checkout
-            MagicMock(),  # git pull
-        ]
+        runner.set_results(["# branch.oid abc123\n"])  # git status (not empty, clean)
 
         git_service.clone_or_pull(sample_repository, use_ssh=False)
 
         # Should call git commands for pull, not clone
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        assert len(calls) == 4
+        commands = runner.commands
+        assert len(commands) == 3
         # Verify it's doing pull operations
-        assert calls[2][0][0] == ["git", "checkout", "main"]
-        assert calls[3][0][0] == ["git", "pull", "origin", "main"]
+        assert commands[1] == ["git", "checkout", "main"]
+        assert commands[2] == ["git", "pull", "origin", "main"]
 
 
 class TestProtocolSwitching:
     """Test cases for protocol switching scenarios."""
 
-    def test_ssh_to_https_protocol_switch(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_ssh_to_https_protocol_switch(self, git_service, sample_repository, runner):
         """Test switching from SSH to HTTPS protocol."""
         # Mock current remote as SSH
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/test-repo.git\n")
 
         # Get current protocol
         current_protocol = git_service.detect_protocol(sample_repository.local_path)
@@ -353,20 +410,14 @@ class TestProtocolSwitching:
         git_service.update_remote_url(sample_repository.local_path, new_url)
 
         # Verify remote URL was updated
-        mock_subprocess_runner.run_git_command.assert_called_with(
-            ["git", "remote", "set-url", "origin", new_url],
-            cwd=sample_repository.local_path,
-            timeout=10,
+        assert runner.calls[-1] == GitCall(
+            ["git", "remote", "set-url", "origin", new_url], sample_repository.local_path, 10
         )
 
-    def test_https_to_ssh_protocol_switch(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_https_to_ssh_protocol_switch(self, git_service, sample_repository, runner):
         """Test switching from HTTPS to SSH protocol."""
         # Mock current remote as HTTPS
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/test-repo.git\n")
 
         # Get current protocol
         current_protocol = git_service.detect_protocol(sample_repository.local_path)
@@ -377,20 +428,14 @@ class TestProtocolSwitching:
         git_service.update_remote_url(sample_repository.local_path, new_url)
 
         # Verify remote URL was updated
-        mock_subprocess_runner.run_git_command.assert_called_with(
-            ["git", "remote", "set-url", "origin", new_url],
-            cwd=sample_repository.local_path,
-            timeout=10,
+        assert runner.calls[-1] == GitCall(
+            ["git", "remote", "set-url", "origin", new_url], sample_repository.local_path, 10
         )
 
-    def test_no_protocol_switch_needed(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_no_protocol_switch_needed(self, git_service, sample_repository, runner):
         """Test when no protocol switch is needed."""
         # Mock current remote as HTTPS
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/test-repo.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/test-repo.git\n")
 
         # Get current protocol - should match intended protocol
         current_protocol = git_service.detect_protocol(sample_repository.local_path)
@@ -399,20 +444,96 @@ class TestProtocolSwitching:
         assert current_protocol == intended_protocol
         # No remote update should be needed
 
-    def test_protocol_detection_edge_cases(
-        self, git_service, sample_repository, mock_subprocess_runner
-    ):
+    def test_protocol_detection_edge_cases(self, git_service, sample_repository, runner):
         """Test protocol detection with edge cases."""
         # Test with no remote
-        mock_subprocess_runner.run_git_command.side_effect = GitOperationError("No remote")
+        runner.set_results([GitOperationError("No remote")])
         result = git_service.detect_protocol(sample_repository.local_path)
         assert result is None
 
         # Test with unusual URL format
-        mock_result = MagicMock()
-        mock_result.stdout = "file:///local/repo.git\n"
-        mock_subprocess_runner.run_git_command.side_effect = None
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(["file:///local/repo.git\n"])
 
         result = git_service.detect_protocol(sample_repository.local_path)
         assert result is None  # Unknown protocol
+
+
+@pytest.fixture
+def libgit2_repo(temp_base_folder):
+    """A pygit2-created repository with one commit on main and an origin remote."""
+    pygit2 = pytest.importorskip("pygit2")
+    repo_path = temp_base_folder / "libgit2-repo"
+    repo = pygit2.init_repository(str(repo_path), initial_head="main")
+    (repo_path / "README.md").write_text("hello\n")
+    repo.index.add_all()
+    repo.index.write()
+    signature = pygit2.Signature("Test", "test@example.com")
+    commit = repo.create_commit("HEAD", signature, signature, "init", repo.index.write_tree(), [])
+    repo.remotes.create("origin", "git@github.com:user/libgit2-repo.git")
+    return repo_path, str(commit)
+
+
+class TestGitServiceLibgit2:
+    """Test cases for GitService's in-process pygit2 queries."""
+
+    @pytest.fixture
+    def libgit2_service(self, temp_base_folder, runner, path_validator):
+        return GitService(temp_base_folder, runner, path_validator, use_libgit2=True)
+
+    def test_queries_without_spawning_git(self, libgit2_service, libgit2_repo, runner):
+        """Test that HEAD, branch, status and remote lookups stay in-process."""
+        repo_path, commit = libgit2_repo
+
+        assert libgit2_service.get_head_sha(repo_path) == commit
+        assert libgit2_service.get_status(repo_path) == RepositoryState(commit, False, "main")
+        assert libgit2_service.get_current_branch(repo_path) == "main"
+        assert libgit2_service.get_remote_url(repo_path) == "git@github.com:user/libgit2-repo.git"
+        assert libgit2_service.get_remote_url(repo_path, "upstream") is None
+        assert libgit2_service.detect_protocol(repo_path) == "ssh"
+
+        (repo_path / "README.md").write_text("changed\n")
+        assert libgit2_service.get_status(repo_path) == RepositoryState(commit, True, "main")
+        assert runner.calls == []
+
+    def test_update_remote_url(self, libgit2_service, libgit2_repo, runner):
+        """Test that remote URLs are rewritten through pygit2."""
+        repo_path, _ = libgit2_repo
+        new_url = "https://github.com/user/libgit2-repo.git"
+
+        libgit2_service.update_remote_url(repo_path, new_url)
+
+        assert libgit2_service.get_remote_url(repo_path) == new_url
+        assert libgit2_service.detect_protocol(repo_path) == "https"
+        assert runner.calls == []
+
+    def test_empty_repository(self, libgit2_service, temp_base_folder):
+        """Test that an unborn HEAD reads as an empty repository on its branch."""
+        pygit2 = pytest.importorskip("pygit2")
+        repo_path = temp_base_folder / "empty-repo"
+        pygit2.init_repository(str(repo_path), initial_head="main")
+
+        assert libgit2_service.is_repository_empty(repo_path)
+        assert libgit2_service.get_status(repo_path) == RepositoryState(None, False, "main")
+        assert libgit2_service.get_current_branch(repo_path) == "main"
+
+    def test_not_a_repository(self, libgit2_service, temp_base_folder):
+        """Test that a plain directory fails like a failing git command would."""
+        with pytest.raises(GitOperationError):
+            libgit2_service.get_status(temp_base_folder)
+        assert libgit2_service.get_head_sha(temp_base_folder) is None
+
+    def test_async_pull_reads_status_in_process(self, libgit2_service, libgit2_repo, runner):
+        """Test that the asyncio path honours use_libgit2 and only spawns the pull."""
+        repo_path, _ = libgit2_repo
+        repository = Repository(
+            info=RepositoryInfo(
+                name="libgit2-repo",
+                clone_url="https://github.com/user/libgit2-repo.git",
+                default_branch="main",
+            ),
+            local_path=repo_path,
+        )
+
+        asyncio.run(libgit2_service.aclone_or_pull(repository))
+
+        assert runner.commands == [["git", "pull", "origin", "main"]]
@@ -3,7 +3,7 @@ Unit tests for the GitHubAPIClient and related GitHub API logic in git_batch_pul
 Covers API pagination, organization/user repo fetching, and error handling with mocks.
 """
 
-import time
+import json
 
 import pytest
 import requests
@@ -11,6 +11,46 @@ import requests
 from git_batch_pull import github_api
 
 
+def _no_sleep(seconds):
+    """Skip retry backoff and rate-limit waits."""
+
+
+class DummyResponse:
+    """Canned 200 response; built once per payload and shared by every request."""
+
+    __slots__ = ("_payload", "text")
+
+    headers: dict = {}
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+        # Serialized once: the client reads it for every logged first page
+        self.text = json.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+_EMPTY = DummyResponse([])
+_ORG_REPOS = DummyResponse(
+    [{"name": "org-repo", "default_branch": "main", "clone_url": "org-url", "ssh_url": "org-ssh"}]
+)
+_USER_REPOS = DummyResponse(
+    [
+        {
+            "name": "user-repo",
+            "default_branch": "main",
+            "clone_url": "user-url",
+            "ssh_url": "user-ssh",
+        }
+    ]
+)
+
+
 class DummySession:
     """Mock requests.Session for GitHub API tests."""
 
@@ -26,46 +66,13 @@ class DummySession:
         page = params["page"] if params and "page" in params else 1
         print(f"MOCK GET: url={url}, params={params}, page={page}")
 
-        class Resp:
-            headers = {}
-
-            def raise_for_status(self):
-                pass
-
-            def json(self):
-                if page > 1:
-                    return []
-                if "/orgs/" in url and "/repos" in url:
-                    return [
-                        {
-                            "name": "org-repo",
-                            "default_branch": "main",
-                            "clone_url": "org-url",
-                            "ssh_url": "org-ssh",
-                        }
-                    ]
-                if "/user/repos" in url:
-                    return [
-                        {
-                            "name": "user-repo",
-                            "default_branch": "main",
-                            "clone_url": "user-url",
-                            "ssh_url": "user-ssh",
-                        }
-                    ]
-                return []
-
-            @property
-            def status_code(self):
-                return 200
-
-            @property
-            def text(self):
-                import json
-
-                return json.dumps(self.json())
-
-        return Resp()
+        if page > 1:
+            return _EMPTY
+        if "/orgs/" in url and "/repos" in url:
+            return _ORG_REPOS
+        if "/user/repos" in url:
+            return _USER_REPOS
+        return _EMPTY
 
     def __getattr__(self, name):
         # Allow any other attribute access to not break
@@ -74,7 +81,7 @@ class DummySession:
 
 def test_get_repos_user(monkeypatch):
     """Test fetching user repos from the GitHub API client."""
-    client = github_api.GitHubAPIClient("token")
+    client = github_api.GitHubAPIClient("token", sleep=_no_sleep)
     client.session = DummySession()
     repos = client.get_repos("user", "foo")
     assert repos[0]["name"] == "user-repo"
@@ -82,7 +89,7 @@ def test_get_repos_user(monkeypatch):
 
 def test_get_repos_org(monkeypatch):
     """Test fetching org repos from the GitHub API client."""
-    client = github_api.GitHubAPIClient("token")
+    client = github_api.GitHubAPIClient("token", sleep=_no_sleep)
     client.session = DummySession()
     repos = client.get_repos("org", "myorg")
     assert repos[0]["name"] == "org-repo"
@@ -95,26 +102,12 @@ def test_get_repos_handles_error(monkeypatch):
         def get(self, url, params=None, timeout=None):
             raise Exception("API fail")
 
-    client = github_api.GitHubAPIClient("token")
+    client = github_api.GitHubAPIClient("token", sleep=_no_sleep)
     client.session = FailingSession()
     with pytest.raises(Exception):
         client.get_repos("user", "foo")
 
 
-def pytest_fixture_patch_sleep():
-    import time as real_time
-
-    orig_sleep = real_time.sleep
-    real_time.sleep = lambda x: None
-    yield
-    real_time.sleep = orig_sleep
-
-
-@pytest.fixture(autouse=True)
-def patch_sleep(monkeypatch):
-    monkeypatch.setattr(time, "sleep", lambda x: None)
-
-
 @pytest.fixture(autouse=True)
 def patch_requests_session(monkeypatch):
     monkeypatch.setattr(requests, "Session", DummySession)
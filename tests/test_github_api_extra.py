@@ -22,6 +22,25 @@ class DummyFailSession:
         raise Exception("API fail")
 
 
+class DummyResponse:
+    """Canned response; the session below hands out preallocated instances."""
+
+    def __init__(self, status_code, headers, error):
+        self.status_code = status_code
+        self.headers = headers
+        self._error = error
+
+    def raise_for_status(self):
+        raise Exception(self._error)
+
+    def json(self):
+        return []
+
+
+_RATE_LIMITED = DummyResponse(403, {"X-RateLimit-Remaining": "0"}, "rate limit exceeded")
+_ERROR = DummyResponse(500, {}, "fail")
+
+
 class DummyRateLimitSession:
     """
     Mock session that simulates GitHub API rate limiting, then fails after one retry.
@@ -33,44 +52,28 @@ class DummyRateLimitSession:
 
     def get(self, url, params=None, timeout=None):
         self.calls += 1
-
-        class Resp:
-            def __init__(self, calls):
-                self.calls = calls
-
-            @property
-            def status_code(self):
-                return 403 if self.calls == 1 else 500
-
-            @property
-            def headers(self):
-                return {"X-RateLimit-Remaining": "0"} if self.calls == 1 else {}
-
-            def raise_for_status(self):
-                raise Exception("rate limit exceeded" if self.calls == 1 else "fail")
-
-            def json(self):
-                return []
-
-        return Resp(self.calls)
+        return _RATE_LIMITED if self.calls == 1 else _ERROR
 
 
 def test_github_api_error():
     """
     Test that GitHubAPIClient raises on API error.
     """
-    client = GitHubAPIClient("token")
+    waits = []
+    client = GitHubAPIClient("token", sleep=waits.append)
     client.session = DummyFailSession()
     with pytest.raises(Exception):
         client.get_repos("user", "foo")
+    # Backoff between the three attempts, none after the last
+    assert waits == [2.0, 2.0]
 
 
 def test_github_api_rate_limit():
     """
     Test that GitHubAPIClient handles API rate limiting and retries.
     """
-    client = GitHubAPIClient("token", max_retries=1, backoff=0)
+    client = GitHubAPIClient("token", max_retries=1, backoff=0, sleep=lambda seconds: None)
     client.session = DummyRateLimitSession()
-    with patch("time.sleep", return_value=None), patch("time.time", return_value=0):
+    with patch("time.time", return_value=0):
         with pytest.raises(Exception):
             client.get_repos("user", "foo")
@@ -0,0 +1,154 @@
+"""
+Unit tests for GitHubService pagination in git_batch_pull.services.github_service.
+Covers concurrent page fetching from the Link header, the serial fallback,
+per-thread sessions and rate-limited pages.
+"""
+
+import logging
+import threading
+
+import pytest
+
+from git_batch_pull.exceptions import GitHubAPIError
+from git_batch_pull.services.github_service import GitHubService
+
+API_URL = "https://api.github.com/user/repos"
+
+
+class PageResponse:
+    """Canned response for one page of repositories."""
+
+    def __init__(self, repos, link="", status_code=200):
+        self._repos = repos
+        self.status_code = status_code
+        self.headers = {"Link": link} if link else {}
+        self.text = ""
+
+    def json(self):
+        return self._repos
+
+
+class PagedSession:
+    """Mock requests.Session serving ``pages`` (a list of repo-name lists)."""
+
+    def __init__(self, pages, with_link=True):
+        self.pages = pages
+        self.with_link = with_link
+        self.requested = []
+        self.headers = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        # No per-request headers: they are set once on the session
+        page = params["page"]
+        with self._lock:
+            self.requested.append(page)
+        names = self.pages[page - 1] if page <= len(self.pages) else []
+        link = ""
+        if self.with_link and len(self.pages) > 1:
+            link = (
+                f'<{url}?per_page=100&page={page + 1}&visibility=all>; rel="next", '
+                f'<{url}?per_page=100&page={len(self.pages)}&visibility=all>; rel="last"'
+            )
+        return PageResponse([{"name": name} for name in names], link)
+
+
+def make_service(session):
+    return GitHubService(
+        "token", subprocess_runner=None, sleep=lambda seconds: None, session_factory=lambda: session
+    )
+
+
+def test_pages_after_the_first_follow_the_link_header():
+    """Test that every page up to rel="last" is fetched once, results in page order."""
+    pages = [[f"repo-{page}-{i}" for i in range(2)] for page in range(1, 6)]
+    session = PagedSession(pages)
+
+    repos = make_service(session).get_repositories("user", "foo")
+
+    assert [repo["name"] for repo in repos] == [name for names in pages for name in names]
+    assert sorted(session.requested) == [1, 2, 3, 4, 5]
+
+
+def test_without_link_header_pages_until_empty():
+    """Test the serial fallback stops at the first empty page."""
+    session = PagedSession([["a", "b"], ["c"]], with_link=False)
+
+    repos = make_service(session).get_repositories("user", "foo")
+
+    assert [repo["name"] for repo in repos] == ["a", "b", "c"]
+    assert session.requested == [1, 2, 3]
+
+
+def test_failed_page_raises():
+    """Test that an error on any concurrently fetched page fails the whole listing."""
+    session = PagedSession([["a"], ["b"], ["c"]])
+    get = session.get
+
+    def failing_get(url, params=None, timeout=None):
+        if params["page"] == 3:
+            return PageResponse([], status_code=500)
+        return get(url, params, timeout)
+
+    session.get = failing_get
+
+    with pytest.raises(GitHubAPIError):
+        make_service(session).get_repositories("user", "foo")
+
+
+def test_rate_limited_page_is_skipped(caplog):
+    """Test that a page still rate limited after every retry is skipped and reported."""
+    session = PagedSession([["a"], ["b"], ["c"]])
+    get = session.get
+
+    def rate_limited_get(url, params=None, timeout=None):
+        if params["page"] == 2:
+            response = PageResponse([], status_code=403)
+            response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}
+            return response
+        return get(url, params, timeout)
+
+    session.get = rate_limited_get
+
+    with caplog.at_level(logging.WARNING):
+        repos = make_service(session).get_repositories("user", "foo")
+
+    assert [repo["name"] for repo in repos] == ["a", "c"]
+    assert "Repository list for foo is incomplete" in caplog.text
+    assert "rate limited pages skipped: 2" in caplog.text
+
+
+def test_each_thread_gets_its_own_session():
+    """Test that concurrent page workers never share a session."""
+    pages = [[f"repo-{page}"] for page in range(1, 10)]
+    threads_by_session = {}
+    lock = threading.Lock()
+
+    def session_factory():
+        session = PagedSession(pages)
+        get = session.get
+
+        def recording_get(url, params=None, timeout=None):
+            with lock:
+                threads_by_session.setdefault(id(session), set()).add(threading.get_ident())
+            return get(url, params, timeout)
+
+        session.get = recording_get
+        return session
+
+    service = GitHubService(
+        "token", subprocess_runner=None, sleep=lambda seconds: None, session_factory=session_factory
+    )
+    repos = service.get_repositories("user", "foo")
+
+    assert len(repos) == len(pages)
+    assert all(len(threads) == 1 for threads in threads_by_session.values())
+
+
+def test_headers_are_set_once_on_the_session():
+    """Test that authentication and API headers live on the pooled session."""
+    headers = GitHubService("secret", subprocess_runner=None).session.headers
+
+    assert headers["Authorization"] == "token secret"
+    assert headers["Accept"] == "application/vnd.github+json"
+    assert headers["X-GitHub-Api-Version"] == "2022-11-28"
@@ -0,0 +1,47 @@
+"""
+Unit tests for PathValidator.
+Covers base-directory containment and repository filename checks.
+"""
+
+import pytest
+
+from git_batch_pull.exceptions import PathValidationError
+from git_batch_pull.security import PathValidator
+
+
+def test_validate_safe_path_inside_base(tmp_path):
+    """
+    Test that a path below the base directory is accepted and resolved.
+    """
+    assert PathValidator.validate_safe_path(tmp_path / "a" / ".." / "b", tmp_path) == (
+        tmp_path.resolve() / "b"
+    )
+
+
+@pytest.mark.parametrize("relative", ["..", "../sibling", "a/../../sibling"])
+def test_validate_safe_path_outside_base(tmp_path, relative):
+    """
+    Test that paths escaping the base directory, including sibling prefixes, are refused.
+    """
+    base = tmp_path / "base"
+    with pytest.raises(PathValidationError):
+        PathValidator.validate_safe_path(base / relative, base)
+    with pytest.raises(PathValidationError):
+        PathValidator.validate_safe_path(tmp_path / "base-other", base)
+
+
+@pytest.mark.parametrize("filename", ["", "  ", "..", "a/b", "a\\b", "con", "LPT1"])
+def test_validate_filename_rejects_unsafe_names(filename):
+    """
+    Test that empty, traversing and reserved filenames are refused.
+    """
+    with pytest.raises(PathValidationError):
+        PathValidator().validate_filename(filename)
+
+
+def test_validate_filename_accepts_repository_names():
+    """
+    Test that ordinary repository names pass through unchanged.
+    """
+    for name in ("git-batch-pull", "my.repo", "repo_1", "COM10"):
+        assert PathValidator().validate_filename(name) == name
@@ -4,8 +4,12 @@ Covers successful and failed plugin loading via entry points.
 """
 
 import importlib
+import sys
 
-from git_batch_pull.plugins import discover_plugins
+import pytest
+
+from git_batch_pull import plugins
+from git_batch_pull.plugins import PLUGIN_GROUP, discover_plugins
 
 
 class DummyEntryPoint:
@@ -27,14 +31,27 @@ class DummyEntryPoint:
         return f"plugin-{self.name}"
 
 
+def fake_entry_points(*entry_points):
+    """Build an importlib.metadata.entry_points stand-in serving our plugin group."""
+    if sys.version_info >= (3, 10):
+        return lambda group=None: list(entry_points) if group == PLUGIN_GROUP else []
+    return lambda: {PLUGIN_GROUP: list(entry_points)}
+
+
+@pytest.fixture(autouse=True)
+def clear_plugin_cache():
+    """Discover afresh in every test, since the result is cached per process."""
+    plugins._load_plugins.cache_clear()
+    yield
+    plugins._load_plugins.cache_clear()
+
+
 def test_discover_plugins_success(monkeypatch):
     """
     Test that discover_plugins returns successfully loaded plugins.
     """
     monkeypatch.setattr(
-        importlib.metadata,
-        "entry_points",
-        lambda: {"git_batch_pull_plugins": [DummyEntryPoint("foo", "foo_mod")]},
+        importlib.metadata, "entry_points", fake_entry_points(DummyEntryPoint("foo", "foo_mod"))
     )
     found = discover_plugins()
     assert "foo" in found
@@ -48,7 +65,24 @@ def test_discover_plugins_failure(monkeypatch):
     monkeypatch.setattr(
         importlib.metadata,
         "entry_points",
-        lambda: {"git_batch_pull_plugins": [DummyEntryPoint("bar", "bar_mod", should_fail=True)]},
+        fake_entry_points(DummyEntryPoint("bar", "bar_mod", should_fail=True)),
     )
     found = discover_plugins()
     assert found == {}
+
+
+def test_discover_plugins_cached(monkeypatch):
+    """
+    Test that entry points are scanned once and callers get independent mappings.
+    """
+    scans = []
+
+    def entry_points(*args, **kwargs):
+        scans.append(kwargs)
+        return fake_entry_points(DummyEntryPoint("foo", "foo_mod"))(*args, **kwargs)
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+    first = discover_plugins()
+    first.clear()
+    assert discover_plugins() == {"foo": "plugin-foo"}
+    assert len(scans) == 1
@@ -3,98 +3,36 @@ Integration and unit tests for protocol switch prompt logic in git-batch-pull.
 Covers prompt suppression and protocol detection logic for SSH/HTTPS remotes.
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-import subprocess
+import pytest
 
 from git_batch_pull.main import prompt_protocol_switch
 
-
-def setup_git_repo(tmp_path, remote_url):
-    """
-    Set up a temporary git repository with the given remote URL.
-    """
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "remote", "add", "origin", remote_url], cwd=repo_dir, check=True)
-    return repo_dir
-
-
-def test_no_prompt_when_protocol_matches_ssh(tmp_path, monkeypatch):
-    """
-    Test that no prompt is shown when protocol matches SSH and --use-ssh is set.
-    """
-    _ = setup_git_repo(tmp_path, "git@github.com:user/repo.git")
-    # Simulate args.use_ssh = True
-    mismatches = []
-
-    def fake_prompt(m, t):
-        raise AssertionError("Should not prompt when protocol matches")
-
-    # Simulate detection logic
-    is_ssh = True
-    is_https = False
-    args_use_ssh = True
-    if args_use_ssh and not is_ssh:
-        mismatches.append(("repo", "git@github.com:user/repo.git"))
-    elif not args_use_ssh and not is_https:
-        mismatches.append(("repo", "git@github.com:user/repo.git"))
-    assert not mismatches
-
-
-def test_no_prompt_when_protocol_matches_https(tmp_path, monkeypatch):
-    """
-    Test that no prompt is shown when protocol matches HTTPS and --use-ssh is not set.
-    """
-    _ = setup_git_repo(tmp_path, "https://github.com/user/repo.git")
-    mismatches = []
-
-    def fake_prompt(m, t):
-        raise AssertionError("Should not prompt when protocol matches")
-
-    is_ssh = False
-    is_https = True
-    args_use_ssh = False
-    if args_use_ssh and not is_ssh:
-        mismatches.append(("repo", "https://github.com/user/repo.git"))
-    elif not args_use_ssh and not is_https:
-        mismatches.append(("repo", "https://github.com/user/repo.git"))
-    assert not mismatches
-
-
-def test_prompt_when_protocol_mismatch_ssh(tmp_path, monkeypatch):
-    """
-    Test that a prompt is shown when there is a protocol mismatch and --use-ssh is set.
-    """
-    _ = setup_git_repo(tmp_path, "https://github.com/user/repo.git")
-    mismatches = []
-    is_ssh = False
-    is_https = True
-    args_use_ssh = True
-    if args_use_ssh and not is_ssh:
-        mismatches.append(("repo", "https://github.com/user/repo.git"))
-    elif not args_use_ssh and not is_https:
-        mismatches.append(("repo", "https://github.com/user/repo.git"))
-    assert mismatches == [("repo", "https://github.com/user/repo.git")]
-
-
-def test_prompt_when_protocol_mismatch_https(tmp_path, monkeypatch):
+pytestmark = pytest.mark.git
+
+
+@pytest.mark.parametrize(
+    "url,is_ssh,is_https,args_use_ssh,expect_mismatch",
+    [
+        ("git@github.com:user/repo.git", True, False, True, False),  # SSH with --use-ssh
+        ("https://github.com/user/repo.git", False, True, False, False),  # HTTPS default
+        ("https://github.com/user/repo.git", False, True, True, True),  # HTTPS with --use-ssh
+        ("git@github.com:user/repo.git", True, False, False, True),  # SSH with the default
+    ],
+)
+def test_protocol_mismatch_detection(
+    shared_git_repo, url, is_ssh, is_https, args_use_ssh, expect_mismatch
+):
     """
-    Test that a prompt is shown when there is a protocol mismatch and --use-ssh is not set.
+    Test that a mismatch (and so a prompt) is reported only when the remote's
+    protocol differs from the one requested with --use-ssh.
     """
-    _ = setup_git_repo(tmp_path, "git@github.com:user/repo.git")
+    _ = shared_git_repo(url)
     mismatches = []
-    is_ssh = True
-    is_https = False
-    args_use_ssh = False
     if args_use_ssh and not is_ssh:
-        mismatches.append(("repo", "git@github.com:user/repo.git"))
+        mismatches.append(("repo", url))
     elif not args_use_ssh and not is_https:
-        mismatches.append(("repo", "git@github.com:user/repo.git"))
-    assert mismatches == [("repo", "git@github.com:user/repo.git")]
+        mismatches.append(("repo", url))
+    assert mismatches == ([("repo", url)] if expect_mismatch else [])
 
 
 def test_prompt_protocol_switch_yes(monkeypatch):
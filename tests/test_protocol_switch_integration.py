@@ -3,23 +3,13 @@ Integration tests for protocol switch prompt and update logic in git-batch-pull.
 Covers user input handling and remote URL updates for protocol switching.
 """
 
-import os
 import subprocess
-import sys
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-from git_batch_pull.main import prompt_protocol_switch
+import pytest
 
+from git_batch_pull.main import prompt_protocol_switch
 
-def setup_git_repo(tmp_path, remote_url):
-    """
-    Set up a temporary git repository with the given remote URL.
-    """
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-    subprocess.run(["git", "remote", "add", "origin", remote_url], cwd=repo_dir, check=True)
-    return repo_dir
+pytestmark = pytest.mark.git
 
 
 def get_remote_url(repo_dir):
@@ -36,11 +26,11 @@ def get_remote_url(repo_dir):
     return result.stdout.strip()
 
 
-def test_switch_protocol_on_user_input_yes(tmp_path, monkeypatch):
+def test_switch_protocol_on_user_input_yes(tmp_path, make_git_repo, monkeypatch):
     """
     Test protocol switch when user selects 'yes' to switch protocol (input '1').
     """
-    repo_dir = setup_git_repo(tmp_path, "https://github.com/user/repo.git")
+    repo_dir = make_git_repo(tmp_path / "repo", "https://github.com/user/repo.git")
     called = {}
 
     def fake_input(prompt):
@@ -58,11 +48,11 @@ def test_switch_protocol_on_user_input_yes(tmp_path, monkeypatch):
     assert called["input"]
 
 
-def test_switch_protocol_on_user_input_no(tmp_path, monkeypatch):
+def test_switch_protocol_on_user_input_no(tmp_path, make_git_repo, monkeypatch):
     """
     Test protocol switch when user selects 'no' to switch protocol (input '2').
     """
-    repo_dir = setup_git_repo(tmp_path, "https://github.com/user/repo.git")
+    repo_dir = make_git_repo(tmp_path / "repo", "https://github.com/user/repo.git")
     called = {}
 
     def fake_input(prompt):
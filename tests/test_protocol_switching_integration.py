@@ -3,31 +3,28 @@ Integration tests for protocol switching with user interaction.
 Tests the complete workflow of detecting mismatches and prompting users.
 """
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from support.fakes import FakeGitHubService, FakeSubprocessRunner
 
 from git_batch_pull.core.protocol_handler import ProtocolHandler
 from git_batch_pull.models.repository import Repository, RepositoryBatch, RepositoryInfo
-from git_batch_pull.security import PathValidator, SafeSubprocessRunner
+from git_batch_pull.security import PathValidator
 from git_batch_pull.services.git_service import GitService
-from git_batch_pull.services.github_service import GitHubService
 from git_batch_pull.services.repository_service import RepositoryService
 
 
 @pytest.fixture
-def temp_base_folder():
-    """Create a temporary directory for test repositories."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_base_folder(base_folder):
+    """Temporary directory for test repositories."""
+    return base_folder
 
 
 @pytest.fixture
-def mock_subprocess_runner():
-    """Mock SafeSubprocessRunner for testing."""
-    return MagicMock(spec=SafeSubprocessRunner)
+def runner():
+    """Fake SafeSubprocessRunner recording git calls."""
+    return FakeSubprocessRunner()
 
 
 @pytest.fixture
@@ -38,14 +35,14 @@ def path_validator():
 
 @pytest.fixture
 def mock_github_service():
-    """Mock GitHubService for testing."""
-    return MagicMock(spec=GitHubService)
+    """Fake GitHubService for testing (no repositories listed)."""
+    return FakeGitHubService()
 
 
 @pytest.fixture
-def git_service(temp_base_folder, mock_subprocess_runner, path_validator):
+def git_service(temp_base_folder, runner, path_validator):
     """GitService instance for testing."""
-    return GitService(temp_base_folder, mock_subprocess_runner, path_validator)
+    return GitService(temp_base_folder, runner, path_validator)
 
 
 @pytest.fixture
@@ -61,54 +58,51 @@ def protocol_handler(repository_service):
     return ProtocolHandler(repository_service)
 
 
-@pytest.fixture
-def sample_repositories(temp_base_folder):
-    """Create sample repositories for testing."""
-    repositories = []
-
+# RepositoryInfo is frozen, so every test can share these
+SAMPLE_REPO_INFOS = (
     # Repository 1: Currently using SSH
-    repo1_info = RepositoryInfo(
+    RepositoryInfo(
         name="repo-ssh",
         clone_url="https://github.com/user/repo-ssh.git",
         ssh_url="git@github.com:user/repo-ssh.git",
         default_branch="main",
-        private=False,
-        fork=False,
-        archived=False,
-    )
-    repo1 = Repository(info=repo1_info, local_path=temp_base_folder / "repo-ssh")
-
+    ),
     # Repository 2: Currently using HTTPS
-    repo2_info = RepositoryInfo(
+    RepositoryInfo(
         name="repo-https",
         clone_url="https://github.com/user/repo-https.git",
         ssh_url="git@github.com:user/repo-https.git",
         default_branch="main",
-        private=False,
-        fork=False,
-        archived=False,
-    )
-    repo2 = Repository(info=repo2_info, local_path=temp_base_folder / "repo-https")
+    ),
+)
+
+
+_SET_URL = ("git", "remote", "set-url")
 
-    repositories.extend([repo1, repo2])
-    return repositories
+
+def set_url_commands(runner):
+    """The ``git remote set-url`` commands recorded by ``runner``."""
+    return [command for command in runner.commands if tuple(command[:3]) == _SET_URL]
+
+
+@pytest.fixture
+def sample_repositories(temp_base_folder):
+    """Create sample repositories for testing, under this test's base folder."""
+    return [
+        Repository(info=info, local_path=temp_base_folder / info.name) for info in SAMPLE_REPO_INFOS
+    ]
 
 
 class TestProtocolSwitchingIntegration:
     """Integration tests for protocol switching scenarios."""
 
-    def test_detect_ssh_to_https_mismatch(
-        self, repository_service, sample_repositories, mock_subprocess_runner
-    ):
+    def test_detect_ssh_to_https_mismatch(self, repository_service, sample_repositories, runner):
         """Test detecting SSH to HTTPS protocol mismatch."""
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Detect mismatches when intending to use HTTPS
         batch = RepositoryBatch(
@@ -121,18 +115,13 @@ class TestProtocolSwitchingIntegration:
         assert mismatches[0][0] == "repo-ssh"
         assert "git@github.com:user/repo-ssh.git" in mismatches[0][1]
 
-    def test_detect_https_to_ssh_mismatch(
-        self, repository_service, sample_repositories, mock_subprocess_runner
-    ):
+    def test_detect_https_to_ssh_mismatch(self, repository_service, sample_repositories, runner):
         """Test detecting HTTPS to SSH protocol mismatch."""
         # Mock repository exists and current remote is HTTPS
-        sample_repositories[1].local_path.mkdir(parents=True)
-        (sample_repositories[1].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[1].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return HTTPS URL
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/repo-https.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/repo-https.git\n")
 
         # Detect mismatches when intending to use SSH
         mismatches = repository_service.detect_protocol_mismatches(sample_repositories, "ssh")
@@ -143,17 +132,14 @@ class TestProtocolSwitchingIntegration:
         assert "https://github.com/user/repo-https.git" in mismatches[0][1]
 
     def test_no_mismatch_when_protocols_align(
-        self, repository_service, sample_repositories, mock_subprocess_runner
+        self, repository_service, sample_repositories, runner
     ):
         """Test no mismatch detected when protocols align."""
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Detect mismatches when intending to use SSH (should match)
         batch = RepositoryBatch(
@@ -165,17 +151,14 @@ class TestProtocolSwitchingIntegration:
         assert len(mismatches) == 0
 
     def test_fix_protocol_mismatch_ssh_to_https(
-        self, repository_service, sample_repositories, mock_subprocess_runner
+        self, repository_service, sample_repositories, runner
     ):
         """Test fixing SSH to HTTPS protocol mismatch."""
         # Mock repository exists
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock current remote as SSH
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Fix protocol mismatches to HTTPS
         batch = RepositoryBatch(
@@ -184,19 +167,12 @@ class TestProtocolSwitchingIntegration:
         repository_service.fix_protocol_mismatches(batch, "https", "user")
 
         # Verify remote URL was updated to HTTPS
-        calls = mock_subprocess_runner.run_git_command.call_args_list
+        commands = runner.commands
         # Should have called git remote get-url and git remote set-url
-        assert len(calls) >= 2
-
-        # Find the set-url call
-        set_url_call = None
-        for call in calls:
-            if call[0][0][0:3] == ["git", "remote", "set-url"]:
-                set_url_call = call
-                break
+        assert len(commands) >= 2
 
-        assert set_url_call is not None
-        assert set_url_call[0][0] == [
+        # The set-url call comes last
+        assert commands[-1] == [
             "git",
             "remote",
             "set-url",
@@ -205,17 +181,14 @@ class TestProtocolSwitchingIntegration:
         ]
 
     def test_fix_protocol_mismatch_https_to_ssh(
-        self, repository_service, sample_repositories, mock_subprocess_runner
+        self, repository_service, sample_repositories, runner
     ):
         """Test fixing HTTPS to SSH protocol mismatch."""
         # Mock repository exists
-        sample_repositories[1].local_path.mkdir(parents=True)
-        (sample_repositories[1].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[1].local_path / ".git").mkdir(parents=True)
 
         # Mock current remote as HTTPS
-        mock_result = MagicMock()
-        mock_result.stdout = "https://github.com/user/repo-https.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "https://github.com/user/repo-https.git\n")
 
         # Fix protocol mismatches to SSH
         batch = RepositoryBatch(
@@ -224,19 +197,12 @@ class TestProtocolSwitchingIntegration:
         repository_service.fix_protocol_mismatches(batch, "ssh", "user")
 
         # Verify remote URL was updated to SSH
-        calls = mock_subprocess_runner.run_git_command.call_args_list
+        commands = runner.commands
         # Should have called git remote get-url and git remote set-url
-        assert len(calls) >= 2
+        assert len(commands) >= 2
 
-        # Find the set-url call
-        set_url_call = None
-        for call in calls:
-            if call[0][0][0:3] == ["git", "remote", "set-url"]:
-                set_url_call = call
-                break
-
-        assert set_url_call is not None
-        assert set_url_call[0][0] == [
+        # The set-url call comes last
+        assert commands[-1] == [
             "git",
             "remote",
             "set-url",
@@ -246,20 +212,17 @@ class TestProtocolSwitchingIntegration:
 
     @patch("builtins.input")
     def test_protocol_handler_user_chooses_to_switch(
-        self, mock_input, protocol_handler, sample_repositories, mock_subprocess_runner
+        self, mock_input, protocol_handler, sample_repositories, runner
     ):
         """Test protocol handler when user chooses to switch protocols."""
         # Mock user input to choose option 1 (switch)
         mock_input.return_value = "1"
 
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches
         result = protocol_handler.handle_protocol_mismatches(
@@ -273,25 +236,38 @@ class TestProtocolSwitchingIntegration:
         mock_input.assert_called_once()
 
         # Verify remote URL update was attempted
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        assert len(calls) >= 2
+        assert len(runner.calls) >= 2
+
+    @patch("builtins.input", return_value="1")
+    def test_protocol_handler_reads_each_remote_once(
+        self, mock_input, protocol_handler, sample_repositories, runner
+    ):
+        """Test that detecting, prompting and fixing look each remote URL up once."""
+        git_dir = sample_repositories[0].local_path / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "config").write_text("[core]\n")  # Lets the remote URL cache key on it
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
+
+        assert protocol_handler.handle_protocol_mismatches(sample_repositories, "https", "user")
+
+        assert runner.commands == [
+            ["git", "remote", "get-url", "origin"],
+            ["git", "remote", "set-url", "origin", "https://github.com/user/repo-ssh.git"],
+        ]
 
     @patch("builtins.input")
     def test_protocol_handler_user_chooses_not_to_switch(
-        self, mock_input, protocol_handler, sample_repositories, mock_subprocess_runner
+        self, mock_input, protocol_handler, sample_repositories, runner
     ):
         """Test protocol handler when user chooses NOT to switch protocols."""
         # Mock user input to choose option 2 (don't switch)
         mock_input.return_value = "2"
 
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches
         result = protocol_handler.handle_protocol_mismatches(
@@ -305,26 +281,21 @@ class TestProtocolSwitchingIntegration:
         mock_input.assert_called_once()
 
         # Should only call git remote get-url, not set-url
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        set_url_calls = [call for call in calls if call[0][0][0:3] == ["git", "remote", "set-url"]]
-        assert len(set_url_calls) == 0
+        assert not set_url_commands(runner)
 
     @patch("builtins.input")
     def test_protocol_handler_user_cancels(
-        self, mock_input, protocol_handler, sample_repositories, mock_subprocess_runner
+        self, mock_input, protocol_handler, sample_repositories, runner
     ):
         """Test protocol handler when user cancels (KeyboardInterrupt)."""
         # Mock user input to raise KeyboardInterrupt
         mock_input.side_effect = KeyboardInterrupt()
 
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches
         result = protocol_handler.handle_protocol_mismatches(
@@ -337,18 +308,13 @@ class TestProtocolSwitchingIntegration:
         # Verify user was prompted
         mock_input.assert_called_once()
 
-    def test_protocol_handler_dry_run(
-        self, protocol_handler, sample_repositories, mock_subprocess_runner
-    ):
+    def test_protocol_handler_dry_run(self, protocol_handler, sample_repositories, runner):
         """Test protocol handler in dry run mode."""
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches in dry run mode
         result = protocol_handler.handle_protocol_mismatches(
@@ -359,22 +325,15 @@ class TestProtocolSwitchingIntegration:
         assert result is True
 
         # Should only call git remote get-url, not set-url (dry run)
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        set_url_calls = [call for call in calls if call[0][0][0:3] == ["git", "remote", "set-url"]]
-        assert len(set_url_calls) == 0
+        assert not set_url_commands(runner)
 
-    def test_protocol_handler_no_mismatches(
-        self, protocol_handler, sample_repositories, mock_subprocess_runner
-    ):
+    def test_protocol_handler_no_mismatches(self, protocol_handler, sample_repositories, runner):
         """Test protocol handler when no mismatches are detected."""
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches when using SSH (should match)
         result = protocol_handler.handle_protocol_mismatches(
@@ -388,26 +347,21 @@ class TestProtocolSwitchingIntegration:
         assert result is True
 
         # Should only call git remote get-url
-        calls = mock_subprocess_runner.run_git_command.call_args_list
-        set_url_calls = [call for call in calls if call[0][0][0:3] == ["git", "remote", "set-url"]]
-        assert len(set_url_calls) == 0
+        assert not set_url_commands(runner)
 
     @patch("builtins.input")
     def test_protocol_handler_invalid_input_then_valid(
-        self, mock_input, protocol_handler, sample_repositories, mock_subprocess_runner
+        self, mock_input, protocol_handler, sample_repositories, runner
     ):
         """Test protocol handler with invalid input followed by valid input."""
         # Mock user input to provide invalid input first, then valid
         mock_input.side_effect = ["invalid", "3", "1"]  # invalid, invalid, then valid
 
         # Mock repository exists and current remote is SSH
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
 
         # Mock git remote get-url to return SSH URL
-        mock_result = MagicMock()
-        mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-        mock_subprocess_runner.run_git_command.return_value = mock_result
+        runner.set_results(lambda command: "git@github.com:user/repo-ssh.git\n")
 
         # Handle protocol mismatches
         result = protocol_handler.handle_protocol_mismatches(
@@ -421,31 +375,19 @@ class TestProtocolSwitchingIntegration:
         assert mock_input.call_count == 3
 
     def test_multiple_repositories_mixed_protocols(
-        self, repository_service, sample_repositories, mock_subprocess_runner
+        self, repository_service, sample_repositories, runner
     ):
         """Test handling multiple repositories with different protocols."""
         # Mock both repositories exist
-        sample_repositories[0].local_path.mkdir(parents=True)
-        (sample_repositories[0].local_path / ".git").mkdir()  # Create .git directory
-        sample_repositories[1].local_path.mkdir(parents=True)
-        (sample_repositories[1].local_path / ".git").mkdir()  # Create .git directory
-
-        # Mock different protocols for each repository
-        def mock_git_command(command, **kwargs):
-            if kwargs.get("cwd") == sample_repositories[0].local_path:
-                # First repo uses SSH
-                mock_result = MagicMock()
-                mock_result.stdout = "git@github.com:user/repo-ssh.git\n"
-                return mock_result
-            elif kwargs.get("cwd") == sample_repositories[1].local_path:
-                # Second repo uses HTTPS
-                mock_result = MagicMock()
-                mock_result.stdout = "https://github.com/user/repo-https.git\n"
-                return mock_result
-            else:
-                return MagicMock()
-
-        mock_subprocess_runner.run_git_command.side_effect = mock_git_command
+        (sample_repositories[0].local_path / ".git").mkdir(parents=True)
+        (sample_repositories[1].local_path / ".git").mkdir(parents=True)
+
+        # First repo uses SSH, second uses HTTPS; answer by the recorded call's cwd
+        remote_urls = {
+            sample_repositories[0].local_path: "git@github.com:user/repo-ssh.git\n",
+            sample_repositories[1].local_path: "https://github.com/user/repo-https.git\n",
+        }
+        runner.set_results(lambda command: remote_urls.get(runner.calls[-1].cwd, ""))
 
         # Detect mismatches when intending to use SSH
         batch = RepositoryBatch(
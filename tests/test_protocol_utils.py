@@ -4,55 +4,97 @@ Covers HTTPS, SSH, and no-remote scenarios.
 """
 
 import os
-import sys
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 import subprocess
 
+import pytest
+
+from git_batch_pull import protocol_utils
 from git_batch_pull.protocol_utils import detect_protocol_mismatch
 
+pytestmark = pytest.mark.git
+
 
-def test_detect_protocol_mismatch_https(tmp_path):
+def test_detect_protocol_mismatch_https(shared_git_repo):
     """
     Test detection of HTTPS protocol mismatch and warning message.
     """
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-    subprocess.run(
-        ["git", "remote", "add", "origin", "https://github.com/user/repo.git"],
-        cwd=repo_dir,
-        check=True,
-    )
+    repo_dir = shared_git_repo("https://github.com/user/repo.git")
     warning = detect_protocol_mismatch(str(repo_dir))
     assert "HTTPS" in warning
     assert "SSH keys" in warning
 
 
-def test_detect_protocol_mismatch_ssh(tmp_path):
+def test_detect_protocol_mismatch_ssh(shared_git_repo):
     """
     Test detection of SSH protocol mismatch and warning message.
     """
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-    subprocess.run(
-        ["git", "remote", "add", "origin", "git@github.com:user/repo.git"],
-        cwd=repo_dir,
-        check=True,
-    )
+    repo_dir = shared_git_repo("git@github.com:user/repo.git")
     warning = detect_protocol_mismatch(str(repo_dir))
     assert "SSH" in warning
     assert "HTTPS credentials" in warning
 
 
-def test_detect_protocol_mismatch_none(tmp_path):
+def test_detect_protocol_mismatch_none(shared_git_repo):
     """
     Test that no warning is returned when no remote is set.
     """
-    repo_dir = tmp_path / "repo"
-    repo_dir.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-    # No remote
+    repo_dir = shared_git_repo()  # No remote
     warning = detect_protocol_mismatch(str(repo_dir))
     assert warning == ""
+
+
+def test_detect_protocol_mismatch_cached(tmp_path, make_git_repo, monkeypatch):
+    """
+    Test that the remote URL is read with git once until .git/config changes.
+    """
+    repo_dir = make_git_repo(tmp_path / "repo", "https://github.com/user/repo.git")
+    runs = []
+    real_run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: runs.append(a) or real_run(*a, **kw))
+    protocol_utils.clear_cache()
+
+    assert "HTTPS" in detect_protocol_mismatch(str(repo_dir))
+    assert "HTTPS" in detect_protocol_mismatch(str(repo_dir), "ssh")
+    assert len(runs) == 1
+
+    config = repo_dir / ".git" / "config"
+    config.write_text(config.read_text().replace("https://github.com/", "git@github.com:"))
+    os.utime(config, ns=(1, 1))
+    assert "SSH" in detect_protocol_mismatch(str(repo_dir))
+    assert len(runs) == 2
+
+
+def test_detect_protocol_mismatch_cache_sees_same_mtime_rewrite(tmp_path, make_git_repo):
+    """
+    Test that a .git/config rewritten within one mtime tick is still read again.
+    """
+    repo_dir = make_git_repo(tmp_path / "repo", "https://github.com/user/repo.git")
+    protocol_utils.clear_cache()
+    assert "configured to use HTTPS" in detect_protocol_mismatch(str(repo_dir))
+
+    config = repo_dir / ".git" / "config"
+    before = config.stat()
+    config.write_text(config.read_text().replace("https://github.com/", "git@github.com:"))
+    os.utime(config, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert "configured to use SSH" in detect_protocol_mismatch(str(repo_dir))
+
+
+@pytest.mark.parametrize(
+    "url,classification",
+    [
+        ("git@github.com:user/repo.git", (True, False)),
+        ("git@github.com:user/repo", (True, False)),
+        ("ssh://user@host:2222/user/repo.git", (True, False)),
+        ("SSH://git@github.com/user/repo.git", (True, False)),
+        ("https://github.com/user/repo.git", (False, True)),
+        ("https://github.com/user/repo", (False, True)),
+        ("git://github.com/user/repo.git", (False, False)),
+        ("http://github.com/user/repo.git", (False, False)),
+    ],
+)
+def test_classify(url, classification):
+    """
+    Test (is_ssh, is_https) classification of remote URLs by scheme prefix alone.
+    """
+    assert protocol_utils._classify(url) == classification
@@ -28,3 +28,21 @@ def test_repo_store_missing(tmp_path):
     assert not store.exists()
     with pytest.raises(FileNotFoundError):
         store.load()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_repo_store_compact_utf8(tmp_path, monkeypatch, use_orjson):
+    """
+    Test that metadata is written as compact UTF-8 JSON, with or without orjson.
+    """
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(repo_store, "orjson", None)
+    store = repo_store.RepoStore(tmp_path / "repos.json")
+    data = [{"name": "répo", "private": False}]
+    store.save(data)
+    assert (tmp_path / "repos.json").read_text(encoding="utf-8") == (
+        '[{"name":"répo","private":false}]'
+    )
+    assert store.load() == data
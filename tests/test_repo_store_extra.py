@@ -36,3 +36,15 @@ def test_repo_store_multiple_instances(tmp_path):
     store1.save(data)
     assert store2.exists()
     assert store2.load() == data
+
+
+def test_repo_store_save_replaces_atomically(tmp_path):
+    """
+    Test that saving over existing metadata leaves only the new file behind.
+    """
+    path = tmp_path / "repos.json"
+    store = repo_store.RepoStore(str(path))
+    store.save([{"name": "old"}])
+    store.save([{"name": "new"}])
+    assert store.load() == [{"name": "new"}]
+    assert [p.name for p in tmp_path.iterdir()] == ["repos.json"]
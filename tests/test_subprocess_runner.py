@@ -0,0 +1,39 @@
+"""
+Unit tests for SafeSubprocessRunner's async runner.
+Covers output decoding and failing git commands.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from git_batch_pull.exceptions import GitOperationError
+from git_batch_pull.security import SafeSubprocessRunner
+
+pytestmark = pytest.mark.git
+
+
+def test_arun_git_command_returns_completed_process(tmp_path):
+    """
+    Test that the async runner decodes the output of the awaited git process.
+    """
+    process = MagicMock(returncode=0)
+    process.communicate = AsyncMock(return_value=(b"main\n", b""))
+
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as create:
+        result = asyncio.run(
+            SafeSubprocessRunner().arun_git_command(["git", "branch", "--show-current"], tmp_path)
+        )
+
+    assert create.await_args[0] == ("git", "branch", "--show-current")
+    assert result.returncode == 0
+    assert result.stdout == "main\n"
+
+
+def test_arun_git_command_raises_on_failure(tmp_path):
+    """
+    Test that a failing git command raises GitOperationError, as run_git_command does.
+    """
+    with pytest.raises(GitOperationError):
+        asyncio.run(SafeSubprocessRunner().arun_git_command(["git", "rev-parse", "HEAD"], tmp_path))
@@ -1,35 +1,73 @@
 """Tests for utility functions."""
 
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
 from git_batch_pull.utils import format_size, sanitize_filename
 
+UNSAFE_CHARS = '<>:"/\\|?*'
+
 
-def test_format_size():
+@pytest.mark.parametrize(
+    "size_bytes,expected",
+    [
+        (0, "0 B"),
+        (512, "512.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1048576, "1.0 MB"),
+        (1073741824, "1.0 GB"),
+    ],
+)
+def test_format_size(size_bytes, expected):
     """Test file size formatting."""
-    assert format_size(0) == "0 B"
-    assert format_size(512) == "512.0 B"
-    assert format_size(1024) == "1.0 KB"
-    assert format_size(1536) == "1.5 KB"
-    assert format_size(1048576) == "1.0 MB"
-    assert format_size(1073741824) == "1.0 GB"
+    assert format_size(size_bytes) == expected
 
 
-def test_sanitize_filename():
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        ("normal_file.txt", "normal_file.txt"),
+        ("file/with\\slashes", "file_with_slashes"),
+        ("file:with*forbidden?chars", "file_with_forbidden_chars"),
+        ("file<with>pipe|chars", "file_with_pipe_chars"),
+        ('file"with"quotes', "file_with_quotes"),
+    ],
+)
+def test_sanitize_filename(filename, expected):
     """Test filename sanitization."""
-    assert sanitize_filename("normal_file.txt") == "normal_file.txt"
-    assert sanitize_filename("file/with\\slashes") == "file_with_slashes"
-    assert sanitize_filename("file:with*forbidden?chars") == "file_with_forbidden_chars"
-    assert sanitize_filename("file<with>pipe|chars") == "file_with_pipe_chars"
-    assert sanitize_filename('file"with"quotes') == "file_with_quotes"
+    assert sanitize_filename(filename) == expected
 
 
-def test_sanitize_filename_empty():
+@pytest.mark.parametrize("filename", ["", "   "])
+def test_sanitize_filename_empty(filename):
     """Test sanitizing empty filename."""
-    assert sanitize_filename("") == "unnamed"
-    assert sanitize_filename("   ") == "unnamed"
+    assert sanitize_filename(filename) == "unnamed"
 
 
-def test_sanitize_filename_dots_only():
+@pytest.mark.parametrize("filename", ["...", ".", ".."])
+def test_sanitize_filename_dots_only(filename):
     """Test sanitizing filename with only dots."""
-    assert sanitize_filename("...") == "unnamed"
-    assert sanitize_filename(".") == "unnamed"
-    assert sanitize_filename("..") == "unnamed"
+    assert sanitize_filename(filename) == "unnamed"
+
+
+# Half the characters drawn are unsafe ones, dots or spaces, so edge cases come up often
+FILENAME_TEXT = st.text(
+    alphabet=st.one_of(st.sampled_from(UNSAFE_CHARS + ". "), st.characters()), max_size=64
+)
+
+
+@settings(max_examples=200, database=None, deadline=None)
+@given(filename=FILENAME_TEXT)
+def test_sanitize_filename_properties(filename):
+    """Test that any input maps to a non-empty, safe name without edge dots or spaces."""
+    sanitized = sanitize_filename(filename)
+
+    assert sanitized
+    assert not set(UNSAFE_CHARS) & set(sanitized)
+    assert sanitized == sanitized.strip(". ")
+    if not filename.strip(". "):
+        assert sanitized == "unnamed"
+    # Sanitizing is idempotent
+    assert sanitize_filename(sanitized) == sanitized